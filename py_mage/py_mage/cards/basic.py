@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Iterable, List
 
 from py_mage.core.abilities import Ability, ActivatedAbility
-from py_mage.core.card import Card, CardDefinition
+from py_mage.core.card import AbilityFactory, Card, CardDefinition
 from py_mage.core.game_state import GameState
 from py_mage.core.mana import ManaCost
 
@@ -52,7 +53,22 @@ def mountain_mana_ability(card: Card, game_state: GameState) -> Iterable[Ability
     return [ActivatedAbility(name="Tap: Add R", source=card, effect=effect, cost=pay_cost)]
 
 
-  
+@lru_cache(maxsize=None)
+def mana_ability_factory(symbol: str) -> AbilityFactory:
+    def mana_ability(card: Card, game_state: GameState) -> Iterable[Ability]:
+        def pay_cost(state: GameState, source: Card) -> None:
+            if source.tapped:
+                raise ValueError("Land already tapped")
+            source.tapped = True
+
+        def effect(state: GameState, stack_item) -> None:
+            stack_item.controller.mana_pool.add(symbol, 1)
+
+        return [ActivatedAbility(name=f"Tap: Add {symbol}", source=card, effect=effect, cost=pay_cost)]
+
+    return mana_ability
+
+
 def grizzly_bears_definition() -> CardDefinition:
     return CardDefinition(
         name="Grizzly Bears",
@@ -73,18 +89,22 @@ def lightning_bolt_definition() -> CardDefinition:
 
 
 def make_creature_spell(card: Card, target: Card | None = None) -> Ability:
+    # Effects reach game objects through the stack item so that cloned states
+    # resolve against their own cards.
     def effect(state: GameState, stack_item) -> None:
-        card.controller.battlefield.add(card)
-        card.zone = "Battlefield"
-        for ability in _build_abilities(card, state):
-            card.abilities.append(ability)
+        permanent = stack_item.source
+        permanent.controller.battlefield.add(permanent)
+        permanent.zone = "Battlefield"
+        state.zone_changed(permanent, "Stack", "Battlefield")
+        for ability in _build_abilities(permanent, state):
+            permanent.add_ability(ability)
 
     return Ability(name=f"Resolve {card.name}", source=card, effect=effect, target=target)
 
 
 def make_lightning_bolt_spell(card: Card, target: Card) -> Ability:
     def effect(state: GameState, stack_item) -> None:
-        target.damage += 3
+        stack_item.ability.target.damage += 3
 
     return Ability(name="Lightning Bolt", source=card, effect=effect, target=target)
 
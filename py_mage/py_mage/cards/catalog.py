@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import json
+from typing import Optional, Sequence, Tuple
+
+from py_mage.cards.basic import mana_ability_factory
+from py_mage.core.card import AbilityFactory, CardDefinition
+from py_mage.core.mana import ManaCost
+
+
+MANA_ABILITY_SYMBOLS = {
+    "WhiteManaAbility": "W",
+    "BlueManaAbility": "U",
+    "BlackManaAbility": "B",
+    "RedManaAbility": "R",
+    "GreenManaAbility": "G",
+    "ColorlessManaAbility": "C",
+}
+
+BASIC_LAND_SYMBOLS = {
+    "PLAINS": "W",
+    "ISLAND": "U",
+    "SWAMP": "B",
+    "MOUNTAIN": "R",
+    "FOREST": "G",
+}
+
+# Mage builds the basic lands from mage.cards.basiclands, outside the set
+# sources the importer reads, so their catalog rows carry no types.
+BASIC_LAND_NAMES = {subtype.capitalize(): symbol for subtype, symbol in BASIC_LAND_SYMBOLS.items()}
+BASIC_LAND_NAMES["Wastes"] = "C"
+
+CatalogRow = Tuple[Optional[str], str, str, Optional[int], Optional[int], str, int]
+
+CATALOG_ROW_QUERY = """
+    SELECT mana_cost, types, subtypes, power, toughness, keywords, mana_parse_ok
+    FROM cards
+    WHERE name = ?
+    ORDER BY set_code, collector_number
+    LIMIT 1
+"""
+
+PRINTING_QUERY = """
+    SELECT name
+    FROM cards
+    WHERE set_code = ? AND collector_number = ?
+    LIMIT 1
+"""
+
+
+def definition_from_row(name: str, row: CatalogRow) -> Optional[CardDefinition]:
+    mana_cost, types_json, subtypes_json, power, toughness, keywords_json, mana_parse_ok = row
+    types = json.loads(types_json or "[]")
+    subtypes = json.loads(subtypes_json or "[]")
+    keywords = json.loads(keywords_json or "[]")
+    if not mana_parse_ok:
+        return None
+    try:
+        cost = ManaCost.from_string(mana_cost or "")
+    except ValueError:
+        return None
+    if "CREATURE" in types:
+        if keywords or power is None or toughness is None:
+            return None
+        abilities: Sequence[AbilityFactory] = ()
+    elif types == ["LAND"]:
+        abilities = land_mana_abilities(subtypes, keywords)
+        if abilities is None:
+            return None
+    else:
+        return None
+    return CardDefinition(
+        name=name,
+        mana_cost=cost,
+        types=tuple(enum_label(card_type) for card_type in types),
+        subtypes=tuple(enum_label(subtype) for subtype in subtypes),
+        power=power,
+        toughness=toughness,
+        abilities=abilities,
+    )
+
+
+def basic_land_definition(name: str) -> Optional[CardDefinition]:
+    symbol = BASIC_LAND_NAMES.get(name)
+    if symbol is None:
+        return None
+    return CardDefinition(
+        name=name,
+        mana_cost=ManaCost(),
+        types=("Land",),
+        subtypes=(name,) if name.upper() in BASIC_LAND_SYMBOLS else (),
+        abilities=(mana_ability_factory(symbol),),
+    )
+
+
+def land_mana_abilities(
+    subtypes: Sequence[str], keywords: Sequence[str]
+) -> Optional[Tuple[AbilityFactory, ...]]:
+    if any(keyword not in MANA_ABILITY_SYMBOLS for keyword in keywords):
+        return None
+    symbols = [BASIC_LAND_SYMBOLS[subtype] for subtype in subtypes if subtype in BASIC_LAND_SYMBOLS]
+    symbols.extend(MANA_ABILITY_SYMBOLS[keyword] for keyword in keywords)
+    if not symbols:
+        return None
+    return tuple(mana_ability_factory(symbol) for symbol in dict.fromkeys(symbols))
+
+
+def enum_label(value: str) -> str:
+    return " ".join(part.capitalize() for part in value.split("_"))
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import mmap
+import os
+import sqlite3
+import struct
+from itertools import groupby
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from py_mage.cards.catalog import CatalogRow
+
+
+MAGIC = b"PYMGCARD"
+FORMAT_VERSION = 1
+# magic, version, record count, string table offset
+HEADER = struct.Struct("<8sIII")
+# name, mana_cost, types, subtypes, keywords as (offset, length) string refs,
+# then power, toughness and flags.
+RECORD = struct.Struct("<IHIHIHIHIHhhB")
+NAME_REF = struct.Struct("<IH")
+NO_STRING = 0xFFFFFFFF
+NO_STAT = -32768
+FLAG_MANA_PARSE_OK = 1
+
+
+def compile_catalog(catalog_path: Path, out_path: Path) -> int:
+    conn = sqlite3.connect(catalog_path)
+    try:
+        rows = conn.execute(
+            """
+            SELECT name, mana_cost, types, subtypes, power, toughness, keywords, mana_parse_ok
+            FROM cards
+            ORDER BY name, set_code, collector_number
+            """
+        ).fetchall()
+    finally:
+        conn.close()
+    strings = StringTable()
+    records: List[bytes] = []
+    # ORDER BY name uses SQLite's BINARY collation, which matches the UTF-8
+    # byte order CompiledCatalog.lookup searches in.
+    for _, printings in groupby(rows, key=lambda row: row[0]):
+        name, mana_cost, types, subtypes, power, toughness, keywords, mana_parse_ok = next(printings)
+        records.append(
+            RECORD.pack(
+                *strings.ref(name),
+                *strings.ref(mana_cost),
+                *strings.ref(types),
+                *strings.ref(subtypes),
+                *strings.ref(keywords),
+                NO_STAT if power is None else power,
+                NO_STAT if toughness is None else toughness,
+                FLAG_MANA_PARSE_OK if mana_parse_ok else 0,
+            )
+        )
+    strings_offset = HEADER.size + RECORD.size * len(records)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = out_path.with_name(out_path.name + ".tmp")
+    with tmp_path.open("wb") as handle:
+        handle.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(records), strings_offset))
+        handle.writelines(records)
+        handle.write(strings.data())
+    # Replace rather than rewrite in place: running workers keep their
+    # mapping of the previous file.
+    os.replace(tmp_path, out_path)
+    return len(records)
+
+
+class StringTable:
+    def __init__(self) -> None:
+        self._offsets: Dict[bytes, int] = {}
+        self._chunks: List[bytes] = []
+        self._size = 0
+
+    def ref(self, value: Optional[str]) -> Tuple[int, int]:
+        if value is None:
+            return NO_STRING, 0
+        encoded = value.encode("utf-8")
+        offset = self._offsets.get(encoded)
+        if offset is None:
+            offset = self._offsets[encoded] = self._size
+            self._chunks.append(encoded)
+            self._size += len(encoded)
+        return offset, len(encoded)
+
+    def data(self) -> bytes:
+        return b"".join(self._chunks)
+
+
+class CompiledCatalog:
+    def __init__(self, path: Path) -> None:
+        with path.open("rb") as handle:
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count, strings_offset = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._map.close()
+            raise ValueError(f"Not a compiled card catalog: {path}")
+        self.count = count
+        self._strings_offset = strings_offset
+
+    def __len__(self) -> int:
+        return self.count
+
+    def close(self) -> None:
+        self._map.close()
+
+    def lookup(self, name: str) -> Optional[CatalogRow]:
+        key = name.encode("utf-8")
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self._name(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low == self.count or self._name(low) != key:
+            return None
+        fields = RECORD.unpack_from(self._map, HEADER.size + RECORD.size * low)
+        power, toughness, flags = fields[10:]
+        return (
+            self._string(fields[2], fields[3]),
+            self._string(fields[4], fields[5]),
+            self._string(fields[6], fields[7]),
+            None if power == NO_STAT else power,
+            None if toughness == NO_STAT else toughness,
+            self._string(fields[8], fields[9]),
+            flags & FLAG_MANA_PARSE_OK,
+        )
+
+    def _name(self, index: int) -> bytes:
+        offset, length = NAME_REF.unpack_from(self._map, HEADER.size + RECORD.size * index)
+        start = self._strings_offset + offset
+        return self._map[start : start + length]
+
+    def _string(self, offset: int, length: int) -> Optional[str]:
+        if offset == NO_STRING:
+            return None
+        start = self._strings_offset + offset
+        return self._map[start : start + length].decode("utf-8")
+
+
+def is_compiled_catalog(path: Path) -> bool:
+    try:
+        with path.open("rb") as handle:
+            return handle.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
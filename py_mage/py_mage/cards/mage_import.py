@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import re
 import sqlite3
 from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 
-from py_mage.cards.registry import get_definition
+from py_mage.cards.registry import registered_names
+from py_mage.cards.search import build_search_index, has_search_index
 
 SET_CODE_RE = re.compile(r'super\(".*?",\s*"([^"]+)"')
 SET_CARD_RE = re.compile(
@@ -23,9 +27,29 @@ POWER_RE = re.compile(r"this\.power\s*=\s*new MageInt\(([-0-9]+)\)")
 TOUGHNESS_RE = re.compile(r"this\.toughness\s*=\s*new MageInt\(([-0-9]+)\)")
 ABILITY_RE = re.compile(r"new\s+([A-Za-z0-9]+Ability)")
 ABILITY_INSTANCE_RE = re.compile(r"([A-Za-z0-9]+Ability)\.getInstance\(")
+# parse_card_source folds the patterns above into scans that each start with a
+# literal prefix, which re can skip to quickly. ABILITY_INSTANCE_RE has no such
+# prefix and is retried at every identifier character, so instance keywords
+# are found from their "Ability.getInstance(" suffix instead.
+CARD_TYPE_TOKEN_RE = re.compile(r'new CardType\[]\{([^}]+)\}(?:\s*,\s*"([^"]*)")?')
+STAT_TOKEN_RE = re.compile(r"this\.(power|toughness)\s*=\s*new MageInt\(([-0-9]+)\)")
+ABILITY_INSTANCE_SUFFIX_RE = re.compile(r"Ability\.getInstance\(")
+IDENTIFIER_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789")
+
+PARSE_CHUNKS_PER_JOB = 4
+RECORD_BATCH_SIZE = 5000
+WRITE_BATCH_SIZE = 5000
+JSON_CACHE_SIZE = 4096
+# Per-class value tables: (table, column). The column name plus "s" is the
+# matching CardRecord attribute.
+CLASS_VALUE_TABLES = (
+    ("card_types", "type"),
+    ("card_subtypes", "subtype"),
+    ("card_keywords", "keyword"),
+)
+CATALOG_TABLES = {"cards", "source_files", "card_classes"} | {table for table, _ in CLASS_VALUE_TABLES}
 
 MAGIC_KEYWORD_CLASSES = {
-KNOWN_KEYWORDS = {
     "DeathtouchAbility",
     "DefenderAbility",
     "DoubleStrikeAbility",
@@ -106,90 +130,225 @@ class CardRecord:
     mana_parse_ok: bool
     types_parse_ok: bool
     source_path: str
+    set_path: str = ""
+
+
+@dataclass
+class SetCardEntry:
+    name: str
+    set_code: str
+    collector_number: str
+    rarity: str
+    card_class: str
+    class_path: Path
+    set_path: str = ""
+
+
+@dataclass
+class SourceFingerprint:
+    path: str
+    kind: str
+    mtime: int
+    size: int
+    sha256: str
+
+
+def import_mage_cards(
+    mage_root: Path, out_path: Path, jobs: int = 1, incremental: bool = False
+) -> tuple[Dict[str, int], Counter[str]]:
+    if incremental and supports_incremental(out_path):
+        # A run that changed no rows keeps the stored metrics and search index.
+        changed = any(update_sqlite(mage_root, out_path, jobs=jobs).values())
+        cached = None if changed else cached_catalog_meta(out_path)
+        metrics, keyword_counts, _ = cached or refresh_catalog_meta(out_path)
+        if changed or not has_search_index(out_path):
+            build_search_index(out_path)
+        return metrics, keyword_counts
+    stats = CatalogStats()
+    with CardClassCache(jobs=jobs) as cache:
+        write_sqlite(out_path, stats.track(iter_records(mage_root, cache)))
+        metrics = stats.metrics(cache)
+        write_fingerprints(out_path, fingerprint_sources(mage_root, cache.paths()))
+    refresh_catalog_meta(out_path)
+    build_search_index(out_path)
+    return metrics, stats.keyword_counts
+
+
+def build_records(
+    mage_root: Path, jobs: int = 1
+) -> tuple[List[CardRecord], Dict[str, int], Counter[str]]:
+    stats = CatalogStats()
+    with CardClassCache(jobs=jobs) as cache:
+        records = list(stats.track(iter_records(mage_root, cache)))
+        return records, stats.metrics(cache), stats.keyword_counts
+
+
+class CatalogStats:
+    def __init__(self) -> None:
+        self.supported_names = registered_names()
+        self.total = 0
+        self.mana_ok = 0
+        self.types_ok = 0
+        self.supported = 0
+        self.keyword_counts: Counter[str] = Counter()
+
+    def track(self, records: Iterable[CardRecord]) -> Iterator[CardRecord]:
+        for record in records:
+            self.total += 1
+            self.keyword_counts.update(record.keywords)
+            if record.mana_parse_ok:
+                self.mana_ok += 1
+            if record.types_parse_ok:
+                self.types_ok += 1
+            if record.name in self.supported_names:
+                self.supported += 1
+            yield record
+
+    def metrics(self, cache: "CardClassCache") -> Dict[str, int]:
+        metrics = {
+            "total_cards": self.total,
+            "mana_parse_ok": self.mana_ok,
+            "mana_parse_fail": self.total - self.mana_ok,
+            "types_parse_ok": self.types_ok,
+            "types_parse_fail": self.total - self.types_ok,
+            "supported_cards": self.supported,
+            "stub_required": self.total - self.supported,
+            "unique_card_classes": cache.misses,
+            "reprint_hits": cache.hits,
+        }
+        metrics.update(report_keywords(self.keyword_counts))
+        return metrics
+
+
+def iter_records(mage_root: Path, cache: "CardClassCache") -> Iterator[CardRecord]:
+    batch: List[SetCardEntry] = []
+    for entry in scan_set_files(mage_root, sorted(set_dir_for(mage_root).glob("*.java"))):
+        batch.append(entry)
+        if len(batch) >= RECORD_BATCH_SIZE:
+            yield from make_records(batch, cache)
+            batch = []
+    yield from make_records(batch, cache)
+
+
+def set_dir_for(mage_root: Path) -> Path:
+    return mage_root / "Mage.Sets" / "src" / "mage" / "sets"
+
 
+def card_dir_for(mage_root: Path) -> Path:
+    return mage_root / "Mage.Sets" / "src" / "mage" / "cards"
 
-def import_mage_cards(mage_root: Path, out_path: Path) -> tuple[Dict[str, int], Counter[str]]:
-    records, metrics, keyword_counts = build_records(mage_root)
-    write_sqlite(out_path, records)
-    return metrics, keyword_counts
 
+def class_path_for(card_dir: Path, card_class: str) -> Path:
+    return card_dir / Path(card_class.replace("mage.cards.", "").replace(".", "/") + ".java")
 
-def build_records(mage_root: Path) -> tuple[List[CardRecord], Dict[str, int], Counter[str]]:
-    set_dir = mage_root / "Mage.Sets" / "src" / "mage" / "sets"
-    card_dir = mage_root / "Mage.Sets" / "src" / "mage" / "cards"
-    records: List[CardRecord] = []
-    mana_ok = 0
-    mana_fail = 0
-    types_ok = 0
-    types_fail = 0
-    keyword_counts: Counter[str] = Counter()
 
-    for set_file in sorted(set_dir.glob("*.java")):
+def source_key(mage_root: Path, path: Path) -> str:
+    return path.relative_to(mage_root).as_posix()
+
+
+def scan_set_files(mage_root: Path, set_files: Iterable[Path]) -> Iterator[SetCardEntry]:
+    card_dir = card_dir_for(mage_root)
+    for set_file in set_files:
         content = set_file.read_text(encoding="utf-8", errors="ignore")
         set_code_match = SET_CODE_RE.search(content)
         if not set_code_match:
             continue
         set_code = set_code_match.group(1)
+        set_path = source_key(mage_root, set_file)
         for match in SET_CARD_RE.finditer(content):
-            name = match.group("name")
-            number = match.group("number").strip('"')
-            rarity = match.group("rarity")
             card_class = match.group("class")
-            class_path = card_dir / Path(card_class.replace("mage.cards.", "").replace(".", "/") + ".java")
-            parsed = parse_card_class(class_path)
-            for keyword in parsed.keywords:
-                keyword_counts[keyword] += 1
-            if parsed.mana_parse_ok:
-                mana_ok += 1
-            else:
-                mana_fail += 1
-            if parsed.types_parse_ok:
-                types_ok += 1
-            else:
-                types_fail += 1
-            records.append(
-                CardRecord(
-                    name=name,
-                    set_code=set_code,
-                    collector_number=number,
-                    rarity=rarity,
-                    card_class=card_class,
-                    mana_cost=parsed.mana_cost,
-                    types=parsed.types,
-                    supertypes=parsed.supertypes,
-                    subtypes=parsed.subtypes,
-                    power=parsed.power,
-                    toughness=parsed.toughness,
-                    keywords=parsed.keywords,
-                    mana_parse_ok=parsed.mana_parse_ok,
-                    types_parse_ok=parsed.types_parse_ok,
-                    source_path=str(class_path) if class_path.exists() else "",
-                )
+            yield SetCardEntry(
+                name=match.group("name"),
+                set_code=set_code,
+                collector_number=match.group("number").strip('"'),
+                rarity=match.group("rarity"),
+                card_class=card_class,
+                class_path=class_path_for(card_dir, card_class),
+                set_path=set_path,
             )
 
-    supported = count_supported(records)
-    metrics = {
-        "total_cards": len(records),
-        "mana_parse_ok": mana_ok,
-        "mana_parse_fail": mana_fail,
-        "types_parse_ok": types_ok,
-        "types_parse_fail": types_fail,
-        "supported_cards": supported,
-        "stub_required": len(records) - supported,
-    }
-    metrics.update(report_keywords(keyword_counts))
-    return records, metrics, keyword_counts
+
+def make_records(entries: Sequence[SetCardEntry], cache: "CardClassCache") -> List[CardRecord]:
+    parsed_cards = cache.resolve([entry.class_path for entry in entries])
+    return [
+        CardRecord(
+            name=entry.name,
+            set_code=entry.set_code,
+            collector_number=entry.collector_number,
+            rarity=entry.rarity,
+            card_class=entry.card_class,
+            mana_cost=parsed.mana_cost,
+            types=parsed.types,
+            supertypes=parsed.supertypes,
+            subtypes=parsed.subtypes,
+            power=parsed.power,
+            toughness=parsed.toughness,
+            keywords=parsed.keywords,
+            mana_parse_ok=parsed.mana_parse_ok,
+            types_parse_ok=parsed.types_parse_ok,
+            source_path=cache.source_path(entry.class_path),
+            set_path=entry.set_path,
+        )
+        for entry, parsed in zip(entries, parsed_cards)
+    ]
+
+
+def parse_card_classes(
+    paths: Sequence[Path], jobs: int = 1, executor: Optional[Executor] = None
+) -> List[ParsedCard]:
+    if jobs <= 1 or len(paths) < 2:
+        return [parse_card_class(path) for path in paths]
+    # Executor.map yields results in submission order, so the output matches
+    # the serial run regardless of which worker finishes a chunk first.
+    chunksize = max(1, len(paths) // (jobs * PARSE_CHUNKS_PER_JOB))
+    if executor is not None:
+        return list(executor.map(parse_card_class, paths, chunksize=chunksize))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(parse_card_class, paths, chunksize=chunksize))
+
+
+class CardClassCache:
+    def __init__(self, jobs: int = 1) -> None:
+        self.jobs = jobs
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._parsed: Dict[Path, ParsedCard] = {}
+        self._source_paths: Dict[Path, str] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __enter__(self) -> "CardClassCache":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def resolve(self, paths: Sequence[Path]) -> List[ParsedCard]:
+        missing = [path for path in dict.fromkeys(paths) if path not in self._parsed]
+        if self.jobs > 1 and self._executor is None and len(missing) > 1:
+            self._executor = ProcessPoolExecutor(max_workers=self.jobs)
+        for path, parsed in zip(missing, parse_card_classes(missing, self.jobs, self._executor)):
+            self._parsed[path] = parsed
+        self.misses += len(missing)
+        self.hits += len(paths) - len(missing)
+        return [self._parsed[path] for path in paths]
+
+    def source_path(self, path: Path) -> str:
+        if path not in self._source_paths:
+            self._source_paths[path] = str(path) if path.exists() else ""
+        return self._source_paths[path]
+
+    def paths(self) -> List[Path]:
+        return list(self._parsed)
 
 
 def count_supported(records: Sequence[CardRecord]) -> int:
-    supported = 0
-    for record in records:
-        try:
-            get_definition(record.name)
-        except KeyError:
-            continue
-        supported += 1
-    return supported
+    supported_names = registered_names()
+    return sum(1 for record in records if record.name in supported_names)
 
 
 def report_keywords(keyword_counts: Counter[str]) -> Dict[str, int]:
@@ -217,20 +376,6 @@ def keyword_top_unknown_magic(keyword_counts: Counter[str], limit: int = 50) ->
         for kw, count in keyword_counts.items()
         if classify_keyword(kw) == "unknown_magic"
     ]
-    recognized = sum(
-        count for keyword, count in keyword_counts.items() if keyword in KNOWN_KEYWORDS
-    )
-    unknown = sum(
-        count for keyword, count in keyword_counts.items() if keyword not in KNOWN_KEYWORDS
-    )
-    return {
-        "keywords_recognized": recognized,
-        "keywords_unknown": unknown,
-    }
-
-
-def keyword_top_unknown(keyword_counts: Counter[str], limit: int = 50) -> List[Tuple[str, int]]:
-    unknown = [(kw, count) for kw, count in keyword_counts.items() if kw not in KNOWN_KEYWORDS]
     unknown.sort(key=lambda item: (-item[1], item[0]))
     return unknown[:limit]
 
@@ -270,13 +415,7 @@ def write_catalog_report(
         "# MAGE Catalog Report (Phase B1)",
         "",
         "## Parse/Schema Stats",
-def write_catalog_report(report_path: Path, metrics: Dict[str, int], keyword_counts: Counter[str]) -> None:
-    report_path.parent.mkdir(parents=True, exist_ok=True)
-    unknown_top = keyword_top_unknown(keyword_counts)
-    lines = [
-        "# MAGE Catalog Report (Phase B1)",
         "",
-        "## Summary",
         f"- Total cards: {metrics['total_cards']}",
         f"- Mana parse ok: {metrics['mana_parse_ok']}",
         f"- Mana parse fail: {metrics['mana_parse_fail']}",
@@ -287,6 +426,8 @@ def write_catalog_report(report_path: Path, metrics: Dict[str, int], keyword_cou
         f"- Magic keywords recognized: {metrics['magic_keywords_recognized']}",
         f"- Magic keywords unknown: {metrics['magic_keywords_unknown']}",
         f"- MAGE constructs seen: {metrics['mage_constructs_total']}",
+        f"- Unique card classes: {metrics['unique_card_classes']}",
+        f"- Reprint hits: {metrics['reprint_hits']} ({reprint_hit_rate(metrics):.1%})",
     ]
     if set_counts:
         lines.append(f"- Total sets: {set_counts['sets_total']}")
@@ -318,43 +459,137 @@ def write_catalog_report(report_path: Path, metrics: Dict[str, int], keyword_cou
     report_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
 
 
+def reprint_hit_rate(metrics: Dict[str, int]) -> float:
+    if not metrics["total_cards"]:
+        return 0.0
+    return metrics["reprint_hits"] / metrics["total_cards"]
+
+
 def load_metrics_from_sqlite(path: Path) -> tuple[Dict[str, int], Counter[str], Dict[str, int]]:
     conn = sqlite3.connect(path)
     try:
-        total_cards = conn.execute("SELECT COUNT(*) FROM cards").fetchone()[0]
-        mana_ok = conn.execute("SELECT COUNT(*) FROM cards WHERE mana_parse_ok = 1").fetchone()[0]
-        types_ok = conn.execute("SELECT COUNT(*) FROM cards WHERE types_parse_ok = 1").fetchone()[0]
-        keyword_counts = Counter()
-        for (keywords_json,) in conn.execute("SELECT keywords FROM cards"):
-            if not keywords_json:
-                continue
-            for keyword in json.loads(keywords_json):
-                keyword_counts[keyword] += 1
-        supported = 0
-        for (name,) in conn.execute("SELECT name FROM cards"):
-            try:
-                get_definition(name)
-            except KeyError:
-                continue
-            supported += 1
-        metrics = {
-            "total_cards": total_cards,
-            "mana_parse_ok": mana_ok,
-            "mana_parse_fail": total_cards - mana_ok,
-            "types_parse_ok": types_ok,
-            "types_parse_fail": total_cards - types_ok,
-            "supported_cards": supported,
-            "stub_required": total_cards - supported,
-        }
-        metrics.update(report_keywords(keyword_counts))
-        set_counts = {
-            "sets_total": conn.execute("SELECT COUNT(DISTINCT set_code) FROM cards").fetchone()[0],
-        }
+        return load_metrics(conn)
+    finally:
+        conn.close()
+
+
+def load_metrics(conn: sqlite3.Connection) -> tuple[Dict[str, int], Counter[str], Dict[str, int]]:
+    cached = read_catalog_meta(conn)
+    if cached is not None:
+        return cached
+    return compute_metrics(conn)
+
+
+def compute_metrics(conn: sqlite3.Connection) -> tuple[Dict[str, int], Counter[str], Dict[str, int]]:
+    conn.execute("CREATE TEMP TABLE IF NOT EXISTS registry_names (name TEXT PRIMARY KEY)")
+    conn.execute("DELETE FROM registry_names")
+    conn.executemany(
+        "INSERT INTO registry_names (name) VALUES (?)", [(name,) for name in sorted(registered_names())]
+    )
+    row = conn.execute(
+        """
+        SELECT
+            COUNT(*),
+            COALESCE(SUM(mana_parse_ok), 0),
+            COALESCE(SUM(types_parse_ok), 0),
+            COUNT(DISTINCT card_class),
+            COUNT(DISTINCT set_code),
+            COUNT(registry_names.name)
+        FROM cards
+        LEFT JOIN registry_names USING (name)
+        """
+    ).fetchone()
+    total_cards, mana_ok, types_ok, unique_classes, sets_total, supported = row
+    keyword_counts = load_keyword_counts(conn)
+    metrics = {
+        "total_cards": total_cards,
+        "mana_parse_ok": mana_ok,
+        "mana_parse_fail": total_cards - mana_ok,
+        "types_parse_ok": types_ok,
+        "types_parse_fail": total_cards - types_ok,
+        "supported_cards": supported,
+        "stub_required": total_cards - supported,
+        "unique_card_classes": unique_classes,
+        "reprint_hits": total_cards - unique_classes,
+    }
+    metrics.update(report_keywords(keyword_counts))
+    return metrics, keyword_counts, {"sets_total": sets_total}
+
+
+def registry_key() -> str:
+    names = "\n".join(sorted(registered_names()))
+    return hashlib.sha256(names.encode("utf-8")).hexdigest()
+
+
+def read_catalog_meta(
+    conn: sqlite3.Connection,
+) -> Optional[tuple[Dict[str, int], Counter[str], Dict[str, int]]]:
+    table = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='catalog_meta'"
+    ).fetchone()
+    if table is None:
+        return None
+    meta = dict(conn.execute("SELECT key, value FROM catalog_meta"))
+    # Supported counts depend on the registry, so metrics cached under a
+    # different set of card definitions are recomputed.
+    if meta.get("registry") != registry_key() or "metrics" not in meta:
+        return None
+    return (
+        json.loads(meta["metrics"]),
+        Counter(json.loads(meta["keyword_counts"])),
+        json.loads(meta["set_counts"]),
+    )
+
+
+def write_catalog_meta(
+    conn: sqlite3.Connection,
+    metrics: Dict[str, int],
+    keyword_counts: Counter[str],
+    set_counts: Dict[str, int],
+) -> None:
+    conn.execute("CREATE TABLE IF NOT EXISTS catalog_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+    conn.executemany(
+        "INSERT OR REPLACE INTO catalog_meta (key, value) VALUES (?, ?)",
+        [
+            ("registry", registry_key()),
+            ("metrics", json.dumps(metrics, sort_keys=True)),
+            ("keyword_counts", json.dumps(dict(sorted(keyword_counts.items())))),
+            ("set_counts", json.dumps(set_counts, sort_keys=True)),
+        ],
+    )
+
+
+def cached_catalog_meta(path: Path) -> Optional[tuple[Dict[str, int], Counter[str], Dict[str, int]]]:
+    conn = sqlite3.connect(path)
+    try:
+        return read_catalog_meta(conn)
+    finally:
+        conn.close()
+
+
+def refresh_catalog_meta(path: Path) -> tuple[Dict[str, int], Counter[str], Dict[str, int]]:
+    conn = sqlite3.connect(path)
+    try:
+        metrics, keyword_counts, set_counts = compute_metrics(conn)
+        write_catalog_meta(conn, metrics, keyword_counts, set_counts)
+        conn.commit()
         return metrics, keyword_counts, set_counts
     finally:
         conn.close()
 
 
+def load_keyword_counts(conn: sqlite3.Connection) -> Counter[str]:
+    rows = conn.execute(
+        """
+        SELECT keyword, SUM(printings)
+        FROM card_keywords
+        JOIN (SELECT card_class, COUNT(*) AS printings FROM cards GROUP BY card_class) USING (card_class)
+        GROUP BY keyword
+        """
+    )
+    return Counter({keyword: count for keyword, count in rows})
+
+
 def load_top_sets(path: Path, limit: int = 10) -> List[Tuple[str, int]]:
     conn = sqlite3.connect(path)
     try:
@@ -396,19 +631,29 @@ def validate_catalog(path: Path, strict: bool = False, report_path: Optional[Pat
         }
         if "cards" not in tables:
             return False, ["Missing cards table"]
+        missing_tables = CATALOG_TABLES - tables
+        if missing_tables:
+            return False, [f"Missing tables: {sorted(missing_tables)}"]
         columns = {row[1] for row in conn.execute("PRAGMA table_info(cards)")}
         missing = EXPECTED_COLUMNS - columns
         if missing:
             return False, [f"Missing columns: {sorted(missing)}"]
-        total = conn.execute("SELECT COUNT(*) FROM cards").fetchone()[0]
+        total, nulls = conn.execute(
+            """
+            SELECT
+                COUNT(*),
+                COALESCE(SUM(name IS NULL OR set_code IS NULL OR collector_number IS NULL), 0)
+            FROM cards
+            """
+        ).fetchone()
         if total <= 0:
             messages.append("Catalog is empty")
-        nulls = conn.execute(
-            "SELECT COUNT(*) FROM cards WHERE name IS NULL OR set_code IS NULL OR collector_number IS NULL"
-        ).fetchone()[0]
         if nulls:
             messages.append(f"{nulls} cards missing required fields")
-        metrics, keyword_counts, _ = load_metrics_from_sqlite(path)
+        metrics, _, _ = load_metrics(conn)
+        stale = metrics["total_cards"] != total
+        if stale:
+            messages.append(f"Catalog metadata is stale: {metrics['total_cards']} vs {total} cards")
         messages.append(f"Total cards: {metrics['total_cards']}")
         messages.append(f"Mana parse ok: {metrics['mana_parse_ok']}")
         messages.append(f"Types parse ok: {metrics['types_parse_ok']}")
@@ -421,7 +666,7 @@ def validate_catalog(path: Path, strict: bool = False, report_path: Optional[Pat
                         messages.append(f"Report mismatch for {key}: {value} vs {metrics[key]}")
                         mismatches = True
         if strict:
-            if total <= 0 or nulls or mismatches:
+            if total <= 0 or nulls or stale or mismatches:
                 return False, messages
     finally:
         conn.close()
@@ -446,22 +691,13 @@ def parse_report_metrics(report_path: Path) -> Dict[str, int]:
             metrics["supported_cards"] = int(line.split(":")[1].strip())
         if line.startswith("- Stub required:"):
             metrics["stub_required"] = int(line.split(":")[1].strip())
+        if line.startswith("- Unique card classes:"):
+            metrics["unique_card_classes"] = int(line.split(":")[1].strip())
+        if line.startswith("- Reprint hits:"):
+            metrics["reprint_hits"] = int(line.split(":")[1].split()[0])
     return metrics
 
 
-        f"- Keywords recognized: {metrics['keywords_recognized']}",
-        f"- Keywords unknown: {metrics['keywords_unknown']}",
-        f"- Fully supported: {metrics['supported_cards']}",
-        f"- Stub required: {metrics['stub_required']}",
-        "",
-        "## Top 50 Unknown Keywords",
-        "",
-    ]
-    for keyword, count in unknown_top:
-        lines.append(f"- {keyword}: {count}")
-    report_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
-
-
 @dataclass
 class ParsedCard:
     mana_cost: Optional[str]
@@ -476,7 +712,9 @@ class ParsedCard:
 
 
 def parse_card_class(path: Path) -> ParsedCard:
-    if not path.exists():
+    try:
+        content = path.read_text(encoding="utf-8", errors="ignore")
+    except FileNotFoundError:
         return ParsedCard(
             mana_cost=None,
             types=(),
@@ -488,7 +726,50 @@ def parse_card_class(path: Path) -> ParsedCard:
             mana_parse_ok=False,
             types_parse_ok=False,
         )
-    content = path.read_text(encoding="utf-8", errors="ignore")
+    return parse_card_source(content)
+
+
+def parse_card_source(content: str) -> ParsedCard:
+    types: Sequence[str] = ()
+    mana_cost: Optional[str] = None
+    for index, match in enumerate(CARD_TYPE_TOKEN_RE.finditer(content)):
+        if index == 0:
+            types = TYPE_TOKEN_RE.findall(match.group(1))
+        if match.group(2) is not None:
+            mana_cost = match.group(2).strip()
+            break
+    power: Optional[int] = None
+    toughness: Optional[int] = None
+    for match in STAT_TOKEN_RE.finditer(content):
+        if match.group(1) == "power":
+            if power is None:
+                power = int(match.group(2))
+        elif toughness is None:
+            toughness = int(match.group(2))
+        if power is not None and toughness is not None:
+            break
+    keywords = set(ABILITY_RE.findall(content))
+    for match in ABILITY_INSTANCE_SUFFIX_RE.finditer(content):
+        end = match.start()
+        start = end
+        while start > 0 and content[start - 1] in IDENTIFIER_CHARS:
+            start -= 1
+        if start < end:
+            keywords.add(content[start:end] + "Ability")
+    return ParsedCard(
+        mana_cost=mana_cost,
+        types=types,
+        supertypes=SUPERTYPE_RE.findall(content),
+        subtypes=SUBTYPE_RE.findall(content),
+        power=power,
+        toughness=toughness,
+        keywords=sorted(keywords),
+        mana_parse_ok=mana_cost is None or validate_mana_cost(mana_cost),
+        types_parse_ok=bool(types),
+    )
+
+
+def parse_card_source_reference(content: str) -> ParsedCard:
     types = parse_types(content)
     supertypes = SUPERTYPE_RE.findall(content)
     subtypes = SUBTYPE_RE.findall(content)
@@ -554,8 +835,13 @@ def write_sqlite(path: Path, records: Iterable[CardRecord]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     if path.exists():
         path.unlink()
-    conn = sqlite3.connect(path)
+    conn = sqlite3.connect(path, isolation_level=None)
     try:
+        # The file is rebuilt from scratch on failure, so the build skips the
+        # rollback journal and fsyncs entirely.
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.execute("PRAGMA temp_store = MEMORY")
         conn.execute(
             """
             CREATE TABLE cards (
@@ -573,52 +859,399 @@ def write_sqlite(path: Path, records: Iterable[CardRecord]) -> None:
                 keywords TEXT,
                 mana_parse_ok INTEGER NOT NULL,
                 types_parse_ok INTEGER NOT NULL,
-                source_path TEXT
+                source_path TEXT,
+                set_path TEXT
             )
             """
         )
-        conn.executemany(
+        conn.execute(
             """
-            INSERT INTO cards (
-                name,
-                set_code,
-                collector_number,
-                rarity,
-                card_class,
-                mana_cost,
-                types,
-                supertypes,
-                subtypes,
-                power,
-                toughness,
-                keywords,
-                mana_parse_ok,
-                types_parse_ok,
-                source_path
+            CREATE TABLE source_files (
+                path TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                mtime INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                sha256 TEXT NOT NULL
             )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            [
-                (
-                    record.name,
-                    record.set_code,
-                    record.collector_number,
-                    record.rarity,
-                    record.card_class,
-                    record.mana_cost,
-                    json.dumps(record.types),
-                    json.dumps(record.supertypes),
-                    json.dumps(record.subtypes),
-                    record.power,
-                    record.toughness,
-                    json.dumps(record.keywords),
-                    int(record.mana_parse_ok),
-                    int(record.types_parse_ok),
-                    record.source_path,
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE card_classes (
+                card_class TEXT PRIMARY KEY,
+                mana_cost TEXT,
+                power INTEGER,
+                toughness INTEGER,
+                mana_parse_ok INTEGER NOT NULL,
+                types_parse_ok INTEGER NOT NULL,
+                source_path TEXT
+            )
+            """
+        )
+        for table, column in CLASS_VALUE_TABLES:
+            conn.execute(
+                f"""
+                CREATE TABLE {table} (
+                    card_class TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    {column} TEXT NOT NULL
                 )
+                """
+            )
+        written_classes: Set[str] = set()
+        batch: List[CardRecord] = []
+        for record in records:
+            batch.append(record)
+            if len(batch) >= WRITE_BATCH_SIZE:
+                write_batch(conn, batch, written_classes)
+                batch = []
+        write_batch(conn, batch, written_classes)
+        conn.execute("BEGIN")
+        create_indexes(conn)
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+
+
+def write_batch(
+    conn: sqlite3.Connection, records: Sequence[CardRecord], written_classes: Set[str]
+) -> None:
+    if not records:
+        return
+    new_classes: Dict[str, CardRecord] = {}
+    for record in records:
+        if record.card_class not in written_classes:
+            written_classes.add(record.card_class)
+            new_classes[record.card_class] = record
+    conn.execute("BEGIN")
+    insert_records(conn, records)
+    insert_card_classes(conn, new_classes.values())
+    conn.execute("COMMIT")
+
+
+def create_indexes(conn: sqlite3.Connection) -> None:
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_cards_name ON cards (name)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_cards_card_class ON cards (card_class)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_cards_set_path ON cards (set_path)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_cards_set_code ON cards (set_code)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_cards_printing ON cards (set_code, collector_number)")
+    for table, column in CLASS_VALUE_TABLES:
+        conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_{column} ON {table} ({column}, card_class)")
+        conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_card_class ON {table} (card_class)")
+
+
+def insert_card_classes(conn: sqlite3.Connection, records: Iterable[CardRecord]) -> None:
+    records = list(records)
+    conn.executemany(
+        """
+        INSERT INTO card_classes (
+            card_class,
+            mana_cost,
+            power,
+            toughness,
+            mana_parse_ok,
+            types_parse_ok,
+            source_path
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+        (
+            (
+                record.card_class,
+                record.mana_cost,
+                record.power,
+                record.toughness,
+                int(record.mana_parse_ok),
+                int(record.types_parse_ok),
+                record.source_path,
+            )
+            for record in records
+        ),
+    )
+    for table, column in CLASS_VALUE_TABLES:
+        conn.executemany(
+            f"INSERT INTO {table} (card_class, position, {column}) VALUES (?, ?, ?)",
+            (
+                (record.card_class, position, value)
                 for record in records
-            ],
+                for position, value in enumerate(getattr(record, column + "s"))
+            ),
+        )
+
+
+def delete_card_classes(conn: sqlite3.Connection, card_classes: Iterable[str]) -> None:
+    keys = [(card_class,) for card_class in card_classes]
+    conn.executemany("DELETE FROM card_classes WHERE card_class = ?", keys)
+    for table, _ in CLASS_VALUE_TABLES:
+        conn.executemany(f"DELETE FROM {table} WHERE card_class = ?", keys)
+
+
+def class_record(card_class: str, parsed: ParsedCard, source_path: str) -> CardRecord:
+    return CardRecord(
+        name="",
+        set_code="",
+        collector_number="",
+        rarity="",
+        card_class=card_class,
+        mana_cost=parsed.mana_cost,
+        types=parsed.types,
+        supertypes=parsed.supertypes,
+        subtypes=parsed.subtypes,
+        power=parsed.power,
+        toughness=parsed.toughness,
+        keywords=parsed.keywords,
+        mana_parse_ok=parsed.mana_parse_ok,
+        types_parse_ok=parsed.types_parse_ok,
+        source_path=source_path,
+    )
+
+
+@lru_cache(maxsize=JSON_CACHE_SIZE)
+def encode_strings(values: Tuple[str, ...]) -> str:
+    return json.dumps(list(values))
+
+
+def insert_records(conn: sqlite3.Connection, records: Iterable[CardRecord]) -> None:
+    conn.executemany(
+        """
+        INSERT INTO cards (
+            name,
+            set_code,
+            collector_number,
+            rarity,
+            card_class,
+            mana_cost,
+            types,
+            supertypes,
+            subtypes,
+            power,
+            toughness,
+            keywords,
+            mana_parse_ok,
+            types_parse_ok,
+            source_path,
+            set_path
         )
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        (
+            (
+                record.name,
+                record.set_code,
+                record.collector_number,
+                record.rarity,
+                record.card_class,
+                record.mana_cost,
+                encode_strings(tuple(record.types)),
+                encode_strings(tuple(record.supertypes)),
+                encode_strings(tuple(record.subtypes)),
+                record.power,
+                record.toughness,
+                encode_strings(tuple(record.keywords)),
+                int(record.mana_parse_ok),
+                int(record.types_parse_ok),
+                record.source_path,
+                record.set_path,
+            )
+            for record in records
+        ),
+    )
+
+
+def fingerprint_file(mage_root: Path, path: Path, kind: str) -> Optional[SourceFingerprint]:
+    try:
+        stat = path.stat()
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return None
+    return SourceFingerprint(
+        path=source_key(mage_root, path),
+        kind=kind,
+        mtime=stat.st_mtime_ns,
+        size=stat.st_size,
+        sha256=hashlib.sha256(data).hexdigest(),
+    )
+
+
+def fingerprint_sources(mage_root: Path, class_paths: Iterable[Path]) -> Iterator[SourceFingerprint]:
+    for set_file in sorted(set_dir_for(mage_root).glob("*.java")):
+        fingerprint = fingerprint_file(mage_root, set_file, "set")
+        if fingerprint:
+            yield fingerprint
+    for class_path in sorted(class_paths):
+        fingerprint = fingerprint_file(mage_root, class_path, "card")
+        if fingerprint:
+            yield fingerprint
+
+
+def write_fingerprints(path: Path, fingerprints: Iterable[SourceFingerprint]) -> None:
+    conn = sqlite3.connect(path)
+    try:
+        upsert_fingerprints(conn, fingerprints)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def upsert_fingerprints(conn: sqlite3.Connection, fingerprints: Iterable[SourceFingerprint]) -> None:
+    conn.executemany(
+        "INSERT OR REPLACE INTO source_files (path, kind, mtime, size, sha256) VALUES (?, ?, ?, ?, ?)",
+        ((fp.path, fp.kind, fp.mtime, fp.size, fp.sha256) for fp in fingerprints),
+    )
+
+
+def supports_incremental(path: Path) -> bool:
+    if not path.exists():
+        return False
+    conn = sqlite3.connect(path)
+    try:
+        tables = {
+            row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        }
+        return CATALOG_TABLES <= tables
+    finally:
+        conn.close()
+
+
+def detect_change(
+    mage_root: Path,
+    path: Path,
+    kind: str,
+    stored: Dict[str, Tuple[int, int, str]],
+) -> tuple[bool, Optional[SourceFingerprint]]:
+    key = source_key(mage_root, path)
+    previous = stored.get(key)
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return previous is not None, None
+    if previous and previous[0] == stat.st_mtime_ns and previous[1] == stat.st_size:
+        return False, None
+    fingerprint = fingerprint_file(mage_root, path, kind)
+    if fingerprint is None:
+        return previous is not None, None
+    return previous is None or previous[2] != fingerprint.sha256, fingerprint
+
+
+def update_sqlite(mage_root: Path, path: Path, jobs: int = 1) -> Dict[str, int]:
+    card_dir = card_dir_for(mage_root)
+    conn = sqlite3.connect(path)
+    try:
+        stored: Dict[str, Tuple[int, int, str]] = {}
+        stored_sets: List[str] = []
+        stored_classes: List[str] = []
+        for key, kind, mtime, size, sha256 in conn.execute(
+            "SELECT path, kind, mtime, size, sha256 FROM source_files"
+        ):
+            stored[key] = (mtime, size, sha256)
+            if kind == "set":
+                stored_sets.append(key)
+            elif kind == "card":
+                stored_classes.append(key)
+        refreshed: List[SourceFingerprint] = []
+        removed: List[str] = []
+
+        set_files = sorted(set_dir_for(mage_root).glob("*.java"))
+        current_sets = {source_key(mage_root, set_file) for set_file in set_files}
+        changed_sets: List[Path] = []
+        for set_file in set_files:
+            changed, fingerprint = detect_change(mage_root, set_file, "set", stored)
+            if changed:
+                changed_sets.append(set_file)
+            if fingerprint:
+                refreshed.append(fingerprint)
+        removed_sets = [key for key in stored_sets if key not in current_sets]
+        removed.extend(removed_sets)
+        stale_sets = [source_key(mage_root, set_file) for set_file in changed_sets] + removed_sets
+        conn.executemany("DELETE FROM cards WHERE set_path = ?", [(key,) for key in stale_sets])
+
+        changed_classes: List[str] = []
+        checked_classes = set()
+        for (card_class,) in conn.execute("SELECT DISTINCT card_class FROM cards ORDER BY card_class").fetchall():
+            checked_classes.add(card_class)
+            class_path = class_path_for(card_dir, card_class)
+            changed, fingerprint = detect_change(mage_root, class_path, "card", stored)
+            if changed:
+                changed_classes.append(card_class)
+                if fingerprint is None:
+                    removed.append(source_key(mage_root, class_path))
+            if fingerprint:
+                refreshed.append(fingerprint)
+
+        class_records: Dict[str, CardRecord] = {}
+        with CardClassCache(jobs=jobs) as cache:
+            class_paths = [class_path_for(card_dir, card_class) for card_class in changed_classes]
+            for card_class, class_path, parsed in zip(
+                changed_classes, class_paths, cache.resolve(class_paths)
+            ):
+                class_records[card_class] = class_record(card_class, parsed, cache.source_path(class_path))
+                conn.execute(
+                    """
+                    UPDATE cards SET
+                        mana_cost = ?,
+                        types = ?,
+                        supertypes = ?,
+                        subtypes = ?,
+                        power = ?,
+                        toughness = ?,
+                        keywords = ?,
+                        mana_parse_ok = ?,
+                        types_parse_ok = ?,
+                        source_path = ?
+                    WHERE card_class = ?
+                    """,
+                    (
+                        parsed.mana_cost,
+                        encode_strings(tuple(parsed.types)),
+                        encode_strings(tuple(parsed.supertypes)),
+                        encode_strings(tuple(parsed.subtypes)),
+                        parsed.power,
+                        parsed.toughness,
+                        encode_strings(tuple(parsed.keywords)),
+                        int(parsed.mana_parse_ok),
+                        int(parsed.types_parse_ok),
+                        cache.source_path(class_path),
+                        card_class,
+                    ),
+                )
+
+            new_records = make_records(list(scan_set_files(mage_root, changed_sets)), cache)
+        insert_records(conn, new_records)
+        for record in new_records:
+            class_records.setdefault(record.card_class, record)
+        orphaned = [
+            row[0]
+            for row in conn.execute(
+                "SELECT card_class FROM card_classes WHERE card_class NOT IN (SELECT card_class FROM cards)"
+            )
+        ]
+        delete_card_classes(conn, list(class_records) + orphaned)
+        insert_card_classes(conn, class_records.values())
+        create_indexes(conn)
+        for card_class in sorted({record.card_class for record in new_records} - checked_classes):
+            class_path = class_path_for(card_dir, card_class)
+            _, fingerprint = detect_change(mage_root, class_path, "card", stored)
+            if fingerprint:
+                refreshed.append(fingerprint)
+
+        # A class whose last printing went with a changed or removed set is no
+        # longer tracked, whether or not its file still exists.
+        live_classes = {
+            source_key(mage_root, class_path_for(card_dir, row[0]))
+            for row in conn.execute("SELECT DISTINCT card_class FROM cards")
+        }
+        removed.extend(key for key in stored_classes if key not in live_classes)
+        conn.executemany("DELETE FROM source_files WHERE path = ?", [(key,) for key in removed])
+        upsert_fingerprints(conn, refreshed)
+        stats = {
+            "sets_changed": len(changed_sets),
+            "sets_removed": len(removed_sets),
+            "classes_changed": len(changed_classes),
+            "cards_inserted": len(new_records),
+        }
+        if any(stats.values()):
+            conn.execute("DROP TABLE IF EXISTS catalog_meta")
         conn.commit()
+        return stats
     finally:
         conn.close()
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from typing import Dict
+import os
+import sqlite3
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, FrozenSet, Optional, Tuple
 
 from py_mage.cards.basic import (
     forest_definition,
@@ -8,19 +12,172 @@ from py_mage.cards.basic import (
     lightning_bolt_definition,
     mountain_definition,
 )
+from py_mage.cards.catalog import (
+    BASIC_LAND_NAMES,
+    CATALOG_ROW_QUERY,
+    PRINTING_QUERY,
+    CatalogRow,
+    basic_land_definition,
+    definition_from_row,
+)
+from py_mage.cards.compiled import CompiledCatalog, is_compiled_catalog
 from py_mage.core.card import CardDefinition
 
 
-_REGISTRY: Dict[str, CardDefinition] = {
-    "Forest": forest_definition(),
-    "Mountain": mountain_definition(),
-    "Grizzly Bears": grizzly_bears_definition(),
-    "Lightning Bolt": lightning_bolt_definition(),
+DEFAULT_CATALOG_PATH = Path(__file__).resolve().parents[2] / "data" / "mage_catalog.sqlite"
+DEFAULT_COMPILED_PATH = DEFAULT_CATALOG_PATH.with_suffix(".cards")
+DEFINITION_CACHE_SIZE = 4096
+
+_FACTORIES: Dict[str, Callable[[], CardDefinition]] = {
+    "Forest": forest_definition,
+    "Mountain": mountain_definition,
+    "Grizzly Bears": grizzly_bears_definition,
+    "Lightning Bolt": lightning_bolt_definition,
 }
 
 
+class CardRegistry:
+    def __init__(
+        self, catalog_path: Optional[Path] = None, cache_size: int = DEFINITION_CACHE_SIZE
+    ) -> None:
+        self.catalog_path = catalog_path
+        self.cache_size = cache_size
+        self._builtin: Dict[str, CardDefinition] = {}
+        self._cache: "OrderedDict[str, Optional[CardDefinition]]" = OrderedDict()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+        self._compiled: Optional[CompiledCatalog] = None
+        self._compiled_checked = False
+        self._printings: Dict[Tuple[str, str], Optional[str]] = {}
+
+    def get(self, name: str) -> CardDefinition:
+        definition = self._builtin.get(name)
+        if definition is not None:
+            return definition
+        factory = _FACTORIES.get(name)
+        if factory is not None:
+            definition = self._builtin[name] = factory()
+            return definition
+        definition = basic_land_definition(name)
+        if definition is not None:
+            self._builtin[name] = definition
+            return definition
+        if name in self._cache:
+            self._cache.move_to_end(name)
+            definition = self._cache[name]
+        else:
+            definition = self._load(name)
+            self._cache[name] = definition
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        if definition is None:
+            raise KeyError(f"Unknown card: {name}")
+        return definition
+
+    def printing_name(self, set_code: str, collector_number: str) -> Optional[str]:
+        key = (set_code, collector_number)
+        if key in self._printings:
+            return self._printings[key]
+        conn = self._connection()
+        if conn is None:
+            return None
+        row = conn.execute(PRINTING_QUERY, key).fetchone()
+        name = self._printings[key] = None if row is None else row[0]
+        return name
+
+    def fingerprint(self) -> str:
+        # Identifies the catalog files lookups read, for keying derived caches.
+        parts = []
+        for path in {self.catalog_path, self._sqlite_path()}:
+            if path is not None and path.exists():
+                stat = path.stat()
+                parts.append(f"{path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}")
+        return "|".join(sorted(parts)) or "builtin"
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if self._compiled is not None:
+            self._compiled.close()
+            self._compiled = None
+        self._compiled_checked = False
+        self._printings.clear()
+
+    def _load(self, name: str) -> Optional[CardDefinition]:
+        row = self._lookup(name)
+        if row is None:
+            return None
+        return definition_from_row(name, row)
+
+    def _lookup(self, name: str) -> Optional[CatalogRow]:
+        compiled = self._compiled_catalog()
+        if compiled is not None:
+            return compiled.lookup(name)
+        conn = self._connection()
+        if conn is None:
+            return None
+        return conn.execute(CATALOG_ROW_QUERY, (name,)).fetchone()
+
+    def _compiled_catalog(self) -> Optional[CompiledCatalog]:
+        # The mapping is read-only, so unlike the sqlite connection it can be
+        # shared with forked workers through the page cache.
+        if not self._compiled_checked:
+            self._compiled_checked = True
+            if self.catalog_path is not None and is_compiled_catalog(self.catalog_path):
+                self._compiled = CompiledCatalog(self.catalog_path)
+        return self._compiled
+
+    def _sqlite_path(self) -> Optional[Path]:
+        # A compiled catalog has no printings, so those are read from the
+        # sqlite catalog it was compiled from when it sits next to it.
+        if self._compiled_catalog() is not None:
+            return self.catalog_path.with_suffix(".sqlite")
+        return self.catalog_path
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        # Connections must not cross a fork, so pool workers open their own.
+        if self._conn is not None and self._conn_pid == os.getpid():
+            return self._conn
+        path = self._sqlite_path()
+        if path is None or not path.exists():
+            return None
+        self._conn = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+        self._conn_pid = os.getpid()
+        return self._conn
+
+
+def default_catalog_path() -> Path:
+    # cards import-mage only rewrites the sqlite catalog, so a compiled file
+    # older than it is stale and ignored until it is recompiled.
+    if not DEFAULT_COMPILED_PATH.exists():
+        return DEFAULT_CATALOG_PATH
+    if DEFAULT_CATALOG_PATH.exists():
+        if DEFAULT_CATALOG_PATH.stat().st_mtime_ns > DEFAULT_COMPILED_PATH.stat().st_mtime_ns:
+            return DEFAULT_CATALOG_PATH
+    return DEFAULT_COMPILED_PATH
+
+
+_DEFAULT_REGISTRY = CardRegistry(default_catalog_path())
+
+
 def get_definition(name: str) -> CardDefinition:
-    try:
-        return _REGISTRY[name]
-    except KeyError as exc:
-        raise KeyError(f"Unknown card: {name}") from exc
+    return _DEFAULT_REGISTRY.get(name)
+
+
+def printing_name(set_code: str, collector_number: str) -> Optional[str]:
+    return _DEFAULT_REGISTRY.printing_name(set_code, collector_number)
+
+
+def catalog_fingerprint() -> str:
+    return _DEFAULT_REGISTRY.fingerprint()
+
+
+def configure_catalog(path: Optional[Path], cache_size: int = DEFINITION_CACHE_SIZE) -> None:
+    global _DEFAULT_REGISTRY
+    _DEFAULT_REGISTRY.close()
+    _DEFAULT_REGISTRY = CardRegistry(path, cache_size=cache_size)
+
+
+def registered_names() -> FrozenSet[str]:
+    return frozenset(_FACTORIES) | frozenset(BASIC_LAND_NAMES)
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from array import array
+from dataclasses import dataclass
+from itertools import groupby
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from py_mage.cards.catalog import enum_label
+
+
+SEARCH_DOCS_TABLE = "card_search_docs"
+SEARCH_FTS_TABLE = "card_search"
+SEARCH_TRIGRAMS_TABLE = "card_search_trigrams"
+DEFAULT_SEARCH_LIMIT = 20
+POSTING_TYPECODE = "I"
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    name: str
+    type_line: str
+    keywords: str
+
+
+def build_search_index(path: Path, fts5: Optional[bool] = None) -> None:
+    conn = sqlite3.connect(path, isolation_level=None)
+    try:
+        if fts5 is None:
+            fts5 = fts5_available(conn)
+        conn.execute("BEGIN")
+        conn.execute(f"DROP TABLE IF EXISTS {SEARCH_FTS_TABLE}")
+        conn.execute(f"DROP TABLE IF EXISTS {SEARCH_TRIGRAMS_TABLE}")
+        conn.execute(f"DROP TABLE IF EXISTS {SEARCH_DOCS_TABLE}")
+        conn.execute(
+            f"""
+            CREATE TABLE {SEARCH_DOCS_TABLE} (
+                id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL COLLATE NOCASE,
+                type_line TEXT NOT NULL,
+                keywords TEXT NOT NULL
+            )
+            """
+        )
+        conn.executemany(
+            f"INSERT INTO {SEARCH_DOCS_TABLE} (id, name, type_line, keywords) VALUES (?, ?, ?, ?)",
+            ((doc_id, *document) for doc_id, document in enumerate(iter_documents(conn), start=1)),
+        )
+        conn.execute(f"CREATE INDEX idx_{SEARCH_DOCS_TABLE}_name ON {SEARCH_DOCS_TABLE} (name)")
+        if fts5:
+            conn.execute(
+                f"""
+                CREATE VIRTUAL TABLE {SEARCH_FTS_TABLE} USING fts5(
+                    name, type_line, keywords,
+                    content='{SEARCH_DOCS_TABLE}', content_rowid='id', tokenize='trigram'
+                )
+                """
+            )
+            conn.execute(f"INSERT INTO {SEARCH_FTS_TABLE} ({SEARCH_FTS_TABLE}) VALUES ('rebuild')")
+        else:
+            conn.execute(
+                f"""
+                CREATE TABLE {SEARCH_TRIGRAMS_TABLE} (
+                    trigram TEXT PRIMARY KEY,
+                    doc_ids BLOB NOT NULL
+                ) WITHOUT ROWID
+                """
+            )
+            conn.executemany(
+                f"INSERT INTO {SEARCH_TRIGRAMS_TABLE} (trigram, doc_ids) VALUES (?, ?)",
+                (
+                    (trigram, doc_ids.tobytes())
+                    for trigram, doc_ids in sorted(trigram_postings(conn).items())
+                ),
+            )
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+
+
+def has_search_index(path: Path) -> bool:
+    conn = sqlite3.connect(path)
+    try:
+        row = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (SEARCH_DOCS_TABLE,)
+        ).fetchone()
+        return row is not None
+    finally:
+        conn.close()
+
+
+def trigram_postings(conn: sqlite3.Connection) -> Dict[str, "array[int]"]:
+    postings: Dict[str, "array[int]"] = {}
+    rows = conn.execute(f"SELECT id, name, type_line, keywords FROM {SEARCH_DOCS_TABLE} ORDER BY id")
+    for doc_id, *values in rows:
+        for trigram in set().union(*(trigrams(value.lower()) for value in values)):
+            posting = postings.get(trigram)
+            if posting is None:
+                posting = postings[trigram] = array(POSTING_TYPECODE)
+            posting.append(doc_id)
+    return postings
+
+
+def fts5_available(conn: sqlite3.Connection) -> bool:
+    try:
+        conn.execute("CREATE VIRTUAL TABLE temp.fts5_probe USING fts5(value, tokenize='trigram')")
+    except sqlite3.OperationalError:
+        return False
+    conn.execute("DROP TABLE temp.fts5_probe")
+    return True
+
+
+def iter_documents(conn: sqlite3.Connection) -> Iterator[Tuple[str, str, str]]:
+    rows = conn.execute(
+        """
+        SELECT name, types, supertypes, subtypes, keywords
+        FROM cards
+        ORDER BY name, set_code, collector_number
+        """
+    )
+    # One document per card name, described by its first printing like the registry.
+    for name, printings in groupby(rows, key=lambda row: row[0]):
+        _, types_json, supertypes_json, subtypes_json, keywords_json = next(printings)
+        yield (
+            name,
+            type_line(
+                json.loads(supertypes_json or "[]"),
+                json.loads(types_json or "[]"),
+                json.loads(subtypes_json or "[]"),
+            ),
+            " ".join(dict.fromkeys(json.loads(keywords_json or "[]"))),
+        )
+
+
+def type_line(supertypes: Iterable[str], types: Iterable[str], subtypes: Iterable[str]) -> str:
+    line = " ".join(enum_label(value) for value in [*supertypes, *types])
+    subtype_labels = " ".join(enum_label(value) for value in subtypes)
+    if subtype_labels:
+        line = f"{line} — {subtype_labels}"
+    return line
+
+
+def trigrams(value: str) -> Set[str]:
+    return {value[index : index + 3] for index in range(len(value) - 2)}
+
+
+def search_cards(path: Path, query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[SearchHit]:
+    conn = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        return search_connection(conn, query, limit)
+    finally:
+        conn.close()
+
+
+def search_connection(conn: sqlite3.Connection, query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[SearchHit]:
+    terms = query.lower().split()
+    if not terms or limit <= 0:
+        return []
+    tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
+    if SEARCH_DOCS_TABLE not in tables:
+        raise ValueError("Catalog has no search index; re-run cards import-mage")
+    indexed = [term for term in terms if len(term) >= 3]
+    # FTS5 trigram matches are exact substrings; everything else is re-checked.
+    unverified = terms
+    conditions: List[str] = []
+    params: List[object] = []
+    if not indexed:
+        # Terms shorter than a trigram can only be answered as a name prefix.
+        conditions.append("docs.name LIKE ? ESCAPE '\\'")
+        params.append(escape_like(terms[0]) + "%")
+    elif SEARCH_FTS_TABLE in tables:
+        conditions.append(
+            f"docs.id IN (SELECT rowid FROM {SEARCH_FTS_TABLE} WHERE {SEARCH_FTS_TABLE} MATCH ?)"
+        )
+        params.append(" ".join('"' + term.replace('"', '""') + '"' for term in indexed))
+        unverified = [term for term in terms if len(term) < 3]
+    else:
+        doc_ids = trigram_candidates(conn, indexed)
+        if not doc_ids:
+            return []
+        conditions.append("docs.id IN (SELECT value FROM json_each(?))")
+        params.append(json.dumps(doc_ids))
+    for term in unverified:
+        conditions.append("instr(lower(docs.name || char(10) || docs.type_line || char(10) || docs.keywords), ?) > 0")
+        params.append(term)
+    phrase = " ".join(terms)
+    name_terms = " AND ".join("instr(lower(docs.name), ?) > 0" for _ in terms)
+    rows = conn.execute(
+        f"""
+        SELECT docs.name, docs.type_line, docs.keywords
+        FROM {SEARCH_DOCS_TABLE} AS docs
+        WHERE {" AND ".join(conditions)}
+        ORDER BY
+            CASE
+                WHEN docs.name = ? THEN 0
+                WHEN docs.name LIKE ? ESCAPE '\\' THEN 1
+                WHEN {name_terms} THEN 2
+                ELSE 3
+            END,
+            length(docs.name),
+            docs.id
+        LIMIT ?
+        """,
+        (*params, phrase, escape_like(phrase) + "%", *terms, limit),
+    )
+    return [SearchHit(*row) for row in rows]
+
+
+def escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def trigram_candidates(conn: sqlite3.Connection, terms: List[str]) -> List[int]:
+    postings: List[Set[int]] = []
+    for trigram in sorted(set().union(*(trigrams(term) for term in terms))):
+        row = conn.execute(
+            f"SELECT doc_ids FROM {SEARCH_TRIGRAMS_TABLE} WHERE trigram = ?", (trigram,)
+        ).fetchone()
+        if row is None:
+            return []
+        doc_ids = array(POSTING_TYPECODE)
+        doc_ids.frombytes(row[0])
+        postings.append(set(doc_ids))
+    postings.sort(key=len)
+    return sorted(set.intersection(*postings))
@@ -3,6 +3,7 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
+from py_mage.cards.compiled import compile_catalog
 from py_mage.cards.mage_import import (
     import_mage_cards,
     load_metrics_from_sqlite,
@@ -11,8 +12,12 @@ from py_mage.cards.mage_import import (
     write_catalog_report,
     write_catalog_report_json,
 )
-from py_mage.cards.mage_import import import_mage_cards, write_catalog_report
-from py_mage.validation.runner import dump_state, run_script, run_smoke
+from py_mage.cards.search import DEFAULT_SEARCH_LIMIT, search_cards
+from py_mage.decks import DEFAULT_DECK_CACHE_DIR
+from py_mage.simulation.engine import DEFAULT_MAX_TURNS, DEFAULT_POLICY, format_report, simulate
+from py_mage.simulation.policy import POLICIES
+from py_mage.validation.bench import bench_clone
+from py_mage.validation.runner import STATE_FORMATS, dump_state, format_log, replay_batch, run_script, run_smoke
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -25,17 +30,34 @@ def build_parser() -> argparse.ArgumentParser:
     smoke = validate_sub.add_parser("smoke", help="Run deterministic smoke scenario")
     smoke.add_argument("--seed", type=int, required=True)
     smoke.add_argument("--assert-invariants", action="store_true")
+    smoke.add_argument("--full-sba-scan", action="store_true", help="Rescan everything on each SBA check")
 
     dump_state_cmd = validate_sub.add_parser("dump-state", help="Dump state to JSON")
     dump_state_cmd.add_argument("--out", type=Path, required=True)
     dump_state_cmd.add_argument("--seed", type=int, default=123)
     dump_state_cmd.add_argument("--assert-invariants", action="store_true")
+    dump_state_cmd.add_argument("--full-sba-scan", action="store_true", help="Rescan everything on each SBA check")
+    dump_state_cmd.add_argument("--format", choices=STATE_FORMATS, default="json", help="State file format")
 
     replay = validate_sub.add_parser("replay", help="Replay an action script")
     replay.add_argument("input", type=Path)
     replay.add_argument("--out", type=Path, required=True)
     replay.add_argument("--log", type=Path, required=True)
     replay.add_argument("--assert-invariants", action="store_true")
+    replay.add_argument("--full-sba-scan", action="store_true", help="Rescan everything on each SBA check")
+    replay.add_argument("--format", choices=STATE_FORMATS, default="json", help="State file format")
+
+    replay_batch_cmd = validate_sub.add_parser(
+        "replay-batch", help="Replay every scenario under a directory and compare with expected output"
+    )
+    replay_batch_cmd.add_argument("root", type=Path)
+    replay_batch_cmd.add_argument("--jobs", type=int, default=1, help="Worker processes (default: 1)")
+    replay_batch_cmd.add_argument("--no-invariants", action="store_true", help="Skip invariant checks")
+    replay_batch_cmd.add_argument("--full-sba-scan", action="store_true", help="Rescan everything on each SBA check")
+
+    bench_clone_cmd = validate_sub.add_parser("bench-clone", help="Time GameState.clone on a large board")
+    bench_clone_cmd.add_argument("--permanents", type=int, default=200)
+    bench_clone_cmd.add_argument("--forks", type=int, default=200)
 
     cards = subparsers.add_parser("cards", help="Card catalog tools")
     cards_sub = cards.add_subparsers(dest="cards_cmd", required=True)
@@ -52,6 +74,17 @@ def build_parser() -> argparse.ArgumentParser:
         default=Path.cwd(),
         help="Path to the MAGE repository root",
     )
+    import_cmd.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes used to parse card classes",
+    )
+    import_cmd.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Re-parse only source files changed since the previous import",
+    )
 
     validate_cmd = cards_sub.add_parser("validate", help="Validate a catalog")
     validate_cmd.add_argument("--in", dest="catalog_path", type=Path, required=True)
@@ -67,6 +100,28 @@ def build_parser() -> argparse.ArgumentParser:
     report_cmd.add_argument("--out", type=Path, required=True)
     report_cmd.add_argument("--format", choices=["md", "json"], default="md")
 
+    compile_cmd = cards_sub.add_parser("compile", help="Compile a catalog for fast lookups")
+    compile_cmd.add_argument("--in", dest="catalog_path", type=Path, required=True)
+    compile_cmd.add_argument("--out", type=Path, required=True)
+
+    search_cmd = cards_sub.add_parser("search", help="Search a catalog by name, type line or keyword")
+    search_cmd.add_argument("query")
+    search_cmd.add_argument("--in", dest="catalog_path", type=Path, required=True)
+    search_cmd.add_argument("--limit", type=int, default=DEFAULT_SEARCH_LIMIT)
+
+    simulate_cmd = subparsers.add_parser("simulate", help="Play games between two decks and report results")
+    simulate_cmd.add_argument("--decks", type=Path, nargs=2, required=True, metavar="DECK")
+    simulate_cmd.add_argument("--games", type=int, default=100)
+    simulate_cmd.add_argument("--seed", type=int, default=0)
+    simulate_cmd.add_argument("--jobs", type=int, default=1, help="Worker processes (default: 1)")
+    simulate_cmd.add_argument("--policy", choices=sorted(POLICIES), default=DEFAULT_POLICY)
+    simulate_cmd.add_argument(
+        "--max-turns", type=int, default=DEFAULT_MAX_TURNS, help="Turns, counted per player, before a draw"
+    )
+    simulate_cmd.add_argument("--catalog", type=Path, help="Card catalog (default: py_mage/data/mage_catalog)")
+    simulate_cmd.add_argument("--deck-cache", type=Path, default=DEFAULT_DECK_CACHE_DIR)
+    simulate_cmd.add_argument("--no-deck-cache", action="store_true", help="Resolve decks without the cache")
+
     return parser
 
 
@@ -75,20 +130,49 @@ def main() -> None:
     args = parser.parse_args()
 
     if args.command == "validate" and args.validate_cmd == "smoke":
-        state, log = run_smoke(seed=args.seed, assert_invariants=args.assert_invariants)
+        state, log = run_smoke(
+            seed=args.seed, assert_invariants=args.assert_invariants, full_sba_scan=args.full_sba_scan
+        )
         print("\n".join(log))
         return
     if args.command == "validate" and args.validate_cmd == "dump-state":
-        state, _ = run_smoke(seed=args.seed, assert_invariants=args.assert_invariants)
-        dump_state(state, args.out)
+        state, _ = run_smoke(
+            seed=args.seed, assert_invariants=args.assert_invariants, full_sba_scan=args.full_sba_scan
+        )
+        dump_state(state, args.out, format=args.format)
         return
     if args.command == "validate" and args.validate_cmd == "replay":
-        state, log = run_script(args.input, assert_invariants=args.assert_invariants)
-        dump_state(state, args.out)
-        args.log.write_text("\n".join(log) + "\n", encoding="utf-8")
+        state, log = run_script(
+            args.input, assert_invariants=args.assert_invariants, full_sba_scan=args.full_sba_scan
+        )
+        dump_state(state, args.out, format=args.format)
+        args.log.write_text(format_log(log), encoding="utf-8")
+        return
+    if args.command == "validate" and args.validate_cmd == "replay-batch":
+        results = replay_batch(
+            args.root,
+            jobs=args.jobs,
+            assert_invariants=not args.no_invariants,
+            full_sba_scan=args.full_sba_scan,
+        )
+        failures = [result for result in results if not result.passed]
+        for result in failures:
+            print(f"FAIL {result.scenario}: {'; '.join(result.mismatches)}")
+        print(f"{len(results) - len(failures)}/{len(results)} scenarios passed")
+        if failures or not results:
+            raise SystemExit(1)
+        return
+    if args.command == "validate" and args.validate_cmd == "bench-clone":
+        result = bench_clone(permanents=args.permanents, forks=args.forks)
+        print(f"Permanents: {result['permanents']}")
+        print(f"clone(): {result['clone_us']:.1f} us per fork")
+        print(f"deepcopy: {result['deepcopy_us']:.1f} us per fork")
+        print(f"Speedup: {result['speedup']:.1f}x")
         return
     if args.command == "cards" and args.cards_cmd == "import-mage":
-        metrics, keyword_counts = import_mage_cards(args.mage_root, args.out)
+        metrics, keyword_counts = import_mage_cards(
+            args.mage_root, args.out, jobs=args.jobs, incremental=args.incremental
+        )
         top_sets = load_top_sets(args.out, limit=10)
         set_counts = load_metrics_from_sqlite(args.out)[2]
         write_catalog_report(args.report, metrics, keyword_counts, set_counts, top_sets)
@@ -113,8 +197,29 @@ def main() -> None:
             write_catalog_report(args.out, metrics, keyword_counts, set_counts, top_sets)
         print(f"Wrote report to {args.out}")
         return
-        write_catalog_report(args.report, metrics, keyword_counts)
-        print(f"Wrote catalog to {args.out}")
-        print(f"Wrote report to {args.report}")
+    if args.command == "cards" and args.cards_cmd == "compile":
+        count = compile_catalog(args.catalog_path, args.out)
+        print(f"Compiled {count} cards to {args.out}")
+        return
+    if args.command == "cards" and args.cards_cmd == "search":
+        try:
+            hits = search_cards(args.catalog_path, args.query, limit=args.limit)
+        except ValueError as exc:
+            raise SystemExit(str(exc))
+        for hit in hits:
+            print(f"{hit.name}\t{hit.type_line}")
+        return
+    if args.command == "simulate":
+        report = simulate(
+            args.decks,
+            games=args.games,
+            seed=args.seed,
+            jobs=args.jobs,
+            policy=args.policy,
+            max_turns=args.max_turns,
+            deck_cache=None if args.no_deck_cache else args.deck_cache,
+            catalog=args.catalog,
+        )
+        print("\n".join(format_report(report)))
         return
     parser.print_help()
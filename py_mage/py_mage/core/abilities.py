@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, Optional, TYPE_CHECKING
+from typing import Callable, Iterable, Optional, TYPE_CHECKING
 
 
 Effect = Callable[["GameState", "StackItem"], None]
 
+FIRST_STRIKE = "First Strike"
+DOUBLE_STRIKE = "Double Strike"
+TRAMPLE = "Trample"
+
 
 @dataclass
 class Ability:
@@ -30,6 +34,21 @@ class ActivatedAbility(Ability):
         game_state.stack.push(StackItem(self.source, self, controller=self.source.controller))
 
 
+def no_effect(game_state: "GameState", stack_item: "StackItem") -> None:
+    return None
+
+
+@dataclass
+class KeywordAbility(Ability):
+    # Static keywords such as first strike or trample are checked by name and
+    # never go on the stack.
+    effect: Effect = no_effect
+
+
+def has_keyword(abilities: Iterable[Ability], keyword: str) -> bool:
+    return any(isinstance(ability, KeywordAbility) and ability.name == keyword for ability in abilities)
+
+
 if TYPE_CHECKING:
     from py_mage.core.card import Card
     from py_mage.core.game_state import GameState
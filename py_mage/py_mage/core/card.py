@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Callable, Iterable, List, Optional, Sequence, TYPE_CHECKING
+from typing import Callable, Iterable, Optional, Sequence, Tuple, TYPE_CHECKING
 
 from py_mage.core.mana import ManaCost
 
@@ -20,22 +20,89 @@ class CardDefinition:
 AbilityFactory = Callable[["Card", "GameState"], Iterable["Ability"]]
 
 
-@dataclass
+# Cards compare by identity: a TableCard keeps its live tapped and damage
+# values in the permanent table rather than in its own slots.
+@dataclass(slots=True, init=False, eq=False)
 class Card:
     definition: CardDefinition
     owner: "Player"
     controller: "Player"
-    tapped: bool = False
-    damage: int = 0
-    zone: Optional[str] = None
-    timestamp: int = 0
-
-    def __post_init__(self) -> None:
-        self.types = list(self.definition.types)
-        self.subtypes = list(self.definition.subtypes)
-        self.power = self.definition.power
-        self.toughness = self.definition.toughness
-        self.abilities: List[Ability] = []
+    _tapped: bool
+    _damage: int
+    zone: Optional[str]
+    timestamp: int
+    # Characteristics start out shared with the definition and are replaced,
+    # never mutated, when an effect changes them.
+    types: Tuple[str, ...] = field(repr=False)
+    subtypes: Tuple[str, ...] = field(repr=False)
+    power: Optional[int] = field(repr=False)
+    _toughness: Optional[int] = field(repr=False)
+    abilities: Tuple["Ability", ...] = field(repr=False)
+    table: Optional["PermanentTable"] = field(repr=False)
+    row: int = field(repr=False)
+    watcher: Optional["StateBasedActions"] = field(repr=False)
+    hasher: Optional["StateHasher"] = field(repr=False)
+
+    def __init__(
+        self,
+        definition: CardDefinition,
+        owner: "Player",
+        controller: "Player",
+        tapped: bool = False,
+        damage: int = 0,
+        zone: Optional[str] = None,
+        timestamp: int = 0,
+    ) -> None:
+        self.definition = definition
+        self.owner = owner
+        self.controller = controller
+        self._tapped = tapped
+        self._damage = damage
+        self.zone = zone
+        self.timestamp = timestamp
+        self.types = as_tuple(definition.types)
+        self.subtypes = as_tuple(definition.subtypes)
+        self.power = definition.power
+        self._toughness = definition.toughness
+        self.abilities = ()
+        self.table = None
+        self.row = -1
+        self.watcher = None
+        self.hasher = None
+
+    @property
+    def tapped(self) -> bool:
+        return self._tapped
+
+    @tapped.setter
+    def tapped(self, value: bool) -> None:
+        self._tapped = value
+        if self.hasher is not None:
+            self.hasher.card_changed(self)
+
+    # Damage and toughness are the inputs of the lethal-damage check, so writes
+    # are reported to the state-based action tracker watching this card.
+    @property
+    def damage(self) -> int:
+        return self._damage
+
+    @damage.setter
+    def damage(self, value: int) -> None:
+        self._damage = value
+        if self.watcher is not None:
+            self.watcher.card_changed(self)
+        if self.hasher is not None:
+            self.hasher.card_changed(self)
+
+    @property
+    def toughness(self) -> Optional[int]:
+        return self._toughness
+
+    @toughness.setter
+    def toughness(self, value: Optional[int]) -> None:
+        self._toughness = value
+        if self.watcher is not None:
+            self.watcher.card_changed(self)
 
     @property
     def name(self) -> str:
@@ -48,11 +115,30 @@ class Card:
     def is_type(self, card_type: str) -> bool:
         return card_type in self.types
 
+    def add_type(self, card_type: str) -> None:
+        if card_type not in self.types:
+            self.types = (*self.types, card_type)
+
+    def add_subtype(self, subtype: str) -> None:
+        if subtype not in self.subtypes:
+            self.subtypes = (*self.subtypes, subtype)
+
+    def add_ability(self, ability: "Ability") -> None:
+        self.abilities = (*self.abilities, ability)
+
     def clone_for_stack(self) -> "Card":
         return Card(definition=self.definition, owner=self.owner, controller=self.controller)
 
 
+def as_tuple(values: Sequence[str]) -> Tuple[str, ...]:
+    # tuple() returns tuples unchanged, so definitions built with tuples share them.
+    return tuple(values)
+
+
 if TYPE_CHECKING:
     from py_mage.core.abilities import Ability
     from py_mage.core.game_state import GameState
+    from py_mage.core.hashing import StateHasher
+    from py_mage.core.permanents import PermanentTable
+    from py_mage.core.sba import StateBasedActions
     from py_mage.core.player import Player
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Dict, TYPE_CHECKING, TypeVar
+
+from py_mage.core.abilities import Ability
+from py_mage.core.card import Card
+from py_mage.core.hashing import StateHasher
+from py_mage.core.mana import ManaPool
+from py_mage.core.player import Player
+from py_mage.core.sba import StateBasedActions
+from py_mage.core.stack import Stack, StackItem
+from py_mage.core.zones import Zone
+
+
+ZONE_NAMES = ("library", "hand", "battlefield", "graveyard", "exile")
+
+T = TypeVar("T")
+
+
+class StateCloner:
+    # Definitions, mana costs and characteristic tuples are immutable and shared;
+    # every mutable game object is copied once and references are remapped.
+    # Card state is copied eagerly on fork rather than on first write; see
+    # MIGRATION_PLAN.md for why that is enough.
+    def __init__(self) -> None:
+        self._players: Dict[int, Player] = {}
+        self._cards: Dict[int, Card] = {}
+        self._abilities: Dict[int, Ability] = {}
+
+    def clone(self, game_state: "GameState") -> "GameState":
+        fork = self._clone(game_state)
+        if game_state.permanent_table is not None:
+            fork.use_permanent_table()
+        if game_state.hasher is not None:
+            fork.hasher = StateHasher(fork)
+        return fork
+
+    def _clone(self, game_state: "GameState") -> "GameState":
+        players = [self._player_shell(player) for player in game_state.players]
+        for source, target in zip(game_state.players, players):
+            for zone_name in ZONE_NAMES:
+                zone = getattr(source, zone_name)
+                setattr(target, zone_name, Zone(zone.name, zone.cards.mapped(self.card)))
+        stack = Stack()
+        stack.items = [
+            StackItem(self.card(item.source), self.ability(item.ability), self.ref(item.controller))
+            for item in game_state.stack.items
+        ]
+        combat = game_state.combat.mapped(self.card, self.player)
+        return replace(
+            game_state,
+            players=players,
+            stack=stack,
+            turn_manager=replace(game_state.turn_manager, steps=list(game_state.turn_manager.steps)),
+            priority_manager=replace(game_state.priority_manager),
+            continuous_effects=game_state.continuous_effects.copy(),
+            replacement_effects=game_state.replacement_effects.copy(),
+            event_bus=game_state.event_bus.copy(remap=self.ref),
+            sba=StateBasedActions(full_scan=game_state.sba.full_scan),
+            combat=combat,
+            permanent_table=None,
+            hasher=None,
+        )
+
+    def player(self, player: Player) -> Player:
+        return self._players.get(id(player), player)
+
+    def card(self, card: Card) -> Card:
+        clone = self._cards.get(id(card))
+        if clone is None:
+            clone = self._cards[id(card)] = Card.__new__(Card)
+            clone.definition = card.definition
+            clone.owner = self._players.get(id(card.owner), card.owner)
+            clone.controller = self._players.get(id(card.controller), card.controller)
+            clone._tapped = card.tapped
+            clone._damage = card.damage
+            clone.zone = card.zone
+            clone.timestamp = card.timestamp
+            clone.types = card.types
+            clone.subtypes = card.subtypes
+            clone.power = card.power
+            clone._toughness = card.toughness
+            clone.abilities = tuple(map(self.ability, card.abilities)) if card.abilities else ()
+            clone.table = None
+            clone.row = -1
+            clone.watcher = None
+            clone.hasher = None
+        return clone
+
+    def ability(self, ability: Ability) -> Ability:
+        clone = self._abilities.get(id(ability))
+        if clone is None:
+            clone = self._abilities[id(ability)] = object.__new__(type(ability))
+            clone.__dict__.update(ability.__dict__)
+            clone.source = self.card(ability.source)
+            clone.target = self.ref(ability.target)
+        return clone
+
+    def ref(self, value: T) -> T:
+        if isinstance(value, Card):
+            return self.card(value)
+        if isinstance(value, Player):
+            return self.player(value)
+        return value
+
+    def _player_shell(self, player: Player) -> Player:
+        clone = Player(
+            name=player.name,
+            life=player.life,
+            mana_pool=ManaPool(dict(player.mana_pool.amounts)),
+            has_lost=player.has_lost,
+        )
+        self._players[id(player)] = clone
+        return clone
+
+
+def clone_game_state(game_state: "GameState") -> "GameState":
+    return StateCloner().clone(game_state)
+
+
+if TYPE_CHECKING:
+    from py_mage.core.game_state import GameState
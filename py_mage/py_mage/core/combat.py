@@ -1,18 +1,175 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List, Tuple
+from typing import Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from py_mage.core.abilities import DOUBLE_STRIKE, FIRST_STRIKE, TRAMPLE, has_keyword
+
+
+REGULAR = "regular"
+
+
+@dataclass(slots=True)
+class CombatGroup:
+    attacker: "Card"
+    defender: "Player"
+    # Blockers in damage assignment order. An attacker stays blocked after its
+    # blockers leave the battlefield (rule 509.1h).
+    blockers: List["Card"] = field(default_factory=list)
+    blocked: bool = False
+
+
+@dataclass(slots=True)
+class Block:
+    blocker: "Card"
+    attackers: List["Card"] = field(default_factory=list)
 
 
 @dataclass
 class CombatState:
-    attackers: List[Tuple["Card", "Player"]] = field(default_factory=list)
-    blockers: List[Tuple["Card", List["Card"]]] = field(default_factory=list)
+    # Groups are keyed by attacker identity and blocks by blocker identity, so
+    # lookups in either direction never scan the declarations.
+    groups: Dict[int, CombatGroup] = field(default_factory=dict)
+    blocks: Dict[int, Block] = field(default_factory=dict)
+
+    @property
+    def attackers(self) -> List[Tuple["Card", "Player"]]:
+        return [(group.attacker, group.defender) for group in self.groups.values()]
+
+    @property
+    def blockers(self) -> List[Tuple["Card", List["Card"]]]:
+        return [(group.attacker, group.blockers) for group in self.groups.values() if group.blocked]
+
+    def declare_attacker(self, attacker: "Card", defender: "Player") -> None:
+        if id(attacker) in self.groups:
+            raise ValueError(f"{attacker.name} is already attacking")
+        self.groups[id(attacker)] = CombatGroup(attacker, defender)
+
+    def declare_blockers(self, attacker: "Card", blockers: List["Card"]) -> None:
+        group = self.groups.get(id(attacker))
+        if group is None:
+            raise ValueError(f"{attacker.name} is not attacking")
+        for blocker in blockers:
+            group.blockers.append(blocker)
+            block = self.blocks.get(id(blocker))
+            if block is None:
+                block = self.blocks[id(blocker)] = Block(blocker)
+            block.attackers.append(attacker)
+        group.blocked = group.blocked or bool(blockers)
+
+    def group(self, attacker: "Card") -> Optional[CombatGroup]:
+        return self.groups.get(id(attacker))
+
+    def blocking(self, blocker: "Card") -> List["Card"]:
+        block = self.blocks.get(id(blocker))
+        return [] if block is None else block.attackers
 
     def clear(self) -> None:
-        self.attackers.clear()
-        self.blockers.clear()
+        self.groups.clear()
+        self.blocks.clear()
+
+    def mapped(
+        self, card: Callable[["Card"], "Card"], player: Callable[["Player"], "Player"]
+    ) -> "CombatState":
+        clone = CombatState()
+        for group in self.groups.values():
+            attacker = card(group.attacker)
+            clone.groups[id(attacker)] = CombatGroup(
+                attacker, player(group.defender), [card(blocker) for blocker in group.blockers], group.blocked
+            )
+        for block in self.blocks.values():
+            blocker = card(block.blocker)
+            clone.blocks[id(blocker)] = Block(blocker, [card(attacker) for attacker in block.attackers])
+        return clone
+
+    def resolve(self, game_state: "GameState") -> List[str]:
+        # Rule 510: if any creature in combat has first or double strike there
+        # are two damage steps, with state-based actions checked in between.
+        results: List[str] = []
+        combatants = self._combatants()
+        strikes = {
+            id(card): strike_kind(game_state.characteristics(card).abilities) for card in combatants
+        }
+        if any(kind != REGULAR for kind in strikes.values()):
+            self._deal_damage(game_state, lambda card: strikes[id(card)] != REGULAR)
+            results.extend(game_state.check_state_based_actions())
+            self._deal_damage(game_state, lambda card: strikes[id(card)] != FIRST_STRIKE)
+        else:
+            self._deal_damage(game_state, lambda card: True)
+        return results
+
+    def _combatants(self) -> List["Card"]:
+        return [group.attacker for group in self.groups.values()] + [
+            block.blocker for block in self.blocks.values()
+        ]
+
+    def _deal_damage(self, game_state: "GameState", deals_damage: Callable[["Card"], bool]) -> None:
+        # Every assignment in a step is computed from the same board and then
+        # dealt simultaneously (rule 510.2).
+        to_cards: List[Tuple["Card", int]] = []
+        to_players: List[Tuple["Player", int]] = []
+        for group in self.groups.values():
+            attacker = group.attacker
+            if not in_combat(attacker) or not deals_damage(attacker):
+                continue
+            characteristics = game_state.characteristics(attacker)
+            power = characteristics.power or 0
+            if power <= 0:
+                continue
+            if not group.blocked:
+                to_players.append((group.defender, power))
+                continue
+            blockers = [blocker for blocker in group.blockers if in_combat(blocker)]
+            trample = has_keyword(characteristics.abilities, TRAMPLE)
+            if not blockers:
+                if trample:
+                    to_players.append((group.defender, power))
+                continue
+            remaining = power
+            for blocker in blockers:
+                amount = min(remaining, lethal_damage(game_state, blocker))
+                if amount:
+                    to_cards.append((blocker, amount))
+                    remaining -= amount
+            if remaining:
+                if trample:
+                    to_players.append((group.defender, remaining))
+                else:
+                    to_cards.append((blockers[0], remaining))
+        for block in self.blocks.values():
+            blocker = block.blocker
+            if not in_combat(blocker) or not deals_damage(blocker):
+                continue
+            power = game_state.characteristics(blocker).power or 0
+            target = next((attacker for attacker in block.attackers if in_combat(attacker)), None)
+            if target is not None and power > 0:
+                to_cards.append((target, power))
+        for card, amount in to_cards:
+            card.damage += amount
+        for player, amount in to_players:
+            player.life -= amount
+
+
+def strike_kind(abilities: Tuple["Ability", ...]) -> str:
+    if has_keyword(abilities, DOUBLE_STRIKE):
+        return DOUBLE_STRIKE
+    if has_keyword(abilities, FIRST_STRIKE):
+        return FIRST_STRIKE
+    return REGULAR
+
+
+def lethal_damage(game_state: "GameState", card: "Card") -> int:
+    toughness = game_state.characteristics(card).toughness or 0
+    return max(toughness - card.damage, 0)
+
+
+def in_combat(card: "Card") -> bool:
+    # Creatures removed from the battlefield mid-combat neither deal nor receive damage.
+    return card in card.controller.battlefield
 
 
-from py_mage.core.card import Card  # noqa: E402
-from py_mage.core.player import Player  # noqa: E402
+if TYPE_CHECKING:
+    from py_mage.core.abilities import Ability
+    from py_mage.core.card import Card
+    from py_mage.core.game_state import GameState
+    from py_mage.core.player import Player
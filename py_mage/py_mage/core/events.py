@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Callable, DefaultDict, Dict, Iterable, List, TYPE_CHECKING
+from dataclasses import dataclass, replace
+from itertools import count
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TYPE_CHECKING
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GameEvent:
     name: str
     payload: Dict[str, Any]
@@ -12,22 +13,168 @@ class GameEvent:
 
 EventHandler = Callable[["GameState", GameEvent], Iterable["Ability"]]
 
+NO_ABILITIES: Tuple["Ability", ...] = ()
+# Payload keys that subscriptions can filter on, most selective first. Source
+# and controller match by identity, zones by name.
+FILTER_KEYS = ("source", "controller", "zone_to", "zone_from")
+
+
+@dataclass(frozen=True, slots=True)
+class Subscription:
+    event_name: str
+    handler: EventHandler
+    sequence: int
+    source: Optional["Card"] = None
+    controller: Optional["Player"] = None
+    zone_from: Optional[str] = None
+    zone_to: Optional[str] = None
+
+    def index_key(self) -> Tuple[Optional[str], Any]:
+        for key in FILTER_KEYS:
+            value = getattr(self, key)
+            if value is not None:
+                return key, value if isinstance(value, str) else id(value)
+        return None, None
+
+    def matches(self, payload: Dict[str, Any]) -> bool:
+        if self.source is not None and payload.get("source") is not self.source:
+            return False
+        if self.controller is not None and payload.get("controller") is not self.controller:
+            return False
+        if self.zone_from is not None and payload.get("zone_from") != self.zone_from:
+            return False
+        if self.zone_to is not None and payload.get("zone_to") != self.zone_to:
+            return False
+        return True
+
+
+class EventChannel:
+    # Subscriptions for one event name, bucketed by their most selective filter
+    # so dispatch only looks at handlers that can match the payload.
+    __slots__ = ("unfiltered", "indexed")
+
+    def __init__(self) -> None:
+        self.unfiltered: List[Subscription] = []
+        self.indexed: Dict[str, Dict[Any, List[Subscription]]] = {}
+
+    def add(self, subscription: Subscription) -> None:
+        key, value = subscription.index_key()
+        if key is None:
+            self.unfiltered.append(subscription)
+        else:
+            self.indexed.setdefault(key, {}).setdefault(value, []).append(subscription)
+
+    def remove(self, subscription: Subscription) -> None:
+        key, value = subscription.index_key()
+        if key is None:
+            self.unfiltered.remove(subscription)
+            return
+        bucket = self.indexed[key][value]
+        bucket.remove(subscription)
+        if not bucket:
+            del self.indexed[key][value]
+            if not self.indexed[key]:
+                del self.indexed[key]
+
+    def is_empty(self) -> bool:
+        return not self.unfiltered and not self.indexed
+
+    def candidates(self, payload: Dict[str, Any]) -> List[Subscription]:
+        buckets = [self.unfiltered] if self.unfiltered else []
+        for key, index in self.indexed.items():
+            value = payload.get(key)
+            if value is None:
+                continue
+            bucket = index.get(value if isinstance(value, str) else id(value))
+            if bucket:
+                buckets.append(bucket)
+        if len(buckets) == 1:
+            return list(buckets[0])
+        # Handlers run in subscription order regardless of bucket.
+        return sorted((item for bucket in buckets for item in bucket), key=lambda item: item.sequence)
+
+    def subscriptions(self) -> Iterator[Subscription]:
+        yield from self.unfiltered
+        for index in self.indexed.values():
+            for bucket in index.values():
+                yield from bucket
+
+    def copy(self) -> "EventChannel":
+        clone = EventChannel()
+        clone.unfiltered = list(self.unfiltered)
+        clone.indexed = {
+            key: {value: list(bucket) for value, bucket in index.items()} for key, index in self.indexed.items()
+        }
+        return clone
+
 
 class EventBus:
     def __init__(self) -> None:
-        self._handlers: DefaultDict[str, List[EventHandler]] = DefaultDict(list)
+        self._channels: Dict[str, EventChannel] = {}
+        self._sequence = count()
+
+    def subscribe(
+        self,
+        event_name: str,
+        handler: EventHandler,
+        source: Optional["Card"] = None,
+        controller: Optional["Player"] = None,
+        zone_from: Optional[str] = None,
+        zone_to: Optional[str] = None,
+    ) -> Subscription:
+        subscription = Subscription(
+            event_name, handler, next(self._sequence), source, controller, zone_from, zone_to
+        )
+        channel = self._channels.get(event_name)
+        if channel is None:
+            channel = self._channels[event_name] = EventChannel()
+        channel.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        channel = self._channels[subscription.event_name]
+        channel.remove(subscription)
+        if channel.is_empty():
+            del self._channels[subscription.event_name]
+
+    def has_subscribers(self, event_name: str) -> bool:
+        return event_name in self._channels
 
-    def subscribe(self, event_name: str, handler: EventHandler) -> None:
-        self._handlers[event_name].append(handler)
+    def copy(self, remap: Optional[Callable[[Any], Any]] = None) -> "EventBus":
+        # remap translates source/controller filters, e.g. onto a cloned game's objects.
+        clone = EventBus()
+        clone._sequence = count(next(self._sequence))
+        if remap is None:
+            clone._channels = {name: channel.copy() for name, channel in self._channels.items()}
+            return clone
+        for name, channel in self._channels.items():
+            target = clone._channels[name] = EventChannel()
+            for subscription in sorted(channel.subscriptions(), key=lambda item: item.sequence):
+                target.add(
+                    replace(
+                        subscription,
+                        source=remap(subscription.source),
+                        controller=remap(subscription.controller),
+                    )
+                )
+        return clone
 
-    def emit(self, game_state: "GameState", event_name: str, **payload: Any) -> List["Ability"]:
-        event = GameEvent(name=event_name, payload=payload)
+    def emit(self, game_state: "GameState", event_name: str, **payload: Any) -> Sequence["Ability"]:
+        channel = self._channels.get(event_name)
+        if channel is None:
+            return NO_ABILITIES
         abilities: List["Ability"] = []
-        for handler in self._handlers[event_name]:
-            abilities.extend(handler(game_state, event))
+        event: Optional[GameEvent] = None
+        for subscription in channel.candidates(payload):
+            if subscription.matches(payload):
+                if event is None:
+                    event = GameEvent(name=event_name, payload=payload)
+                abilities.extend(subscription.handler(game_state, event))
         return abilities
 
 
 if TYPE_CHECKING:
     from py_mage.core.abilities import Ability
+    from py_mage.core.card import Card
     from py_mage.core.game_state import GameState
+    from py_mage.core.player import Player
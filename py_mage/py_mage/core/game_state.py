@@ -6,7 +6,9 @@ from typing import Iterable, List, Optional
 from py_mage.core.abilities import Ability
 from py_mage.core.combat import CombatState
 from py_mage.core.events import EventBus
-from py_mage.core.layers import ContinuousEffects
+from py_mage.core.hashing import StateHasher
+from py_mage.core.layers import Characteristics, ContinuousEffects
+from py_mage.core.permanents import PermanentTable
 from py_mage.core.priority import PriorityManager
 from py_mage.core.replacement import ReplacementEffects
 from py_mage.core.sba import StateBasedActions
@@ -27,6 +29,12 @@ class GameState:
     combat: CombatState = field(default_factory=CombatState)
     active_player_index: int = 0
     timestamp_counter: int = 0
+    turn_number: int = 1
+    permanent_table: Optional[PermanentTable] = None
+    hasher: Optional[StateHasher] = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.sba.watch(self)
 
     def active_player(self) -> "Player":
         return self.players[self.active_player_index]
@@ -44,8 +52,12 @@ class GameState:
     def advance_step(self) -> Step:
         step = self.turn_manager.advance()
         if step == Step.UNTAP:
-            for card in self.active_player().battlefield.cards:
-                card.tapped = False
+            # The whole-board untap bypasses the per-card hooks the hash relies on.
+            if self.permanent_table is not None and self.hasher is None:
+                self.permanent_table.untap(self.active_player())
+            else:
+                for card in self.active_player().battlefield.cards:
+                    card.tapped = False
             self.active_player().mana_pool.clear()
             self.combat.clear()
         if step == Step.DRAW:
@@ -53,32 +65,39 @@ class GameState:
         self.priority_manager.reset()
         return step
 
+    def pass_turn(self) -> Step:
+        # Hands the turn to the next player still in the game and runs its untap step.
+        count = len(self.players)
+        index = self.active_player_index
+        for offset in range(1, count + 1):
+            index = (self.active_player_index + offset) % count
+            if not self.players[index].has_lost:
+                break
+        self.active_player_index = index
+        self.turn_number += 1
+        self.turn_manager.current_index = len(self.turn_manager.steps) - 1
+        return self.advance_step()
+
     def declare_attackers(self, attackers: list["Card"], defender: "Player") -> None:
         for attacker in attackers:
-            self.combat.attackers.append((attacker, defender))
+            self.combat.declare_attacker(attacker, defender)
 
     def declare_blockers(self, assignments: list[tuple["Card", list["Card"]]]) -> None:
         for attacker, blockers in assignments:
-            self.combat.blockers.append((attacker, list(blockers)))
-
-    def resolve_combat(self) -> None:
-        for attacker, defender in self.combat.attackers:
-            blockers = []
-            for blocker_attacker, assigned in self.combat.blockers:
-                if blocker_attacker is attacker:
-                    blockers = assigned
-                    break
-            if not blockers:
-                defender.life -= attacker.power or 0
-                continue
-            primary_blocker = blockers[0]
-            primary_blocker.damage += attacker.power or 0
-            attacker.damage += primary_blocker.power or 0
+            self.combat.declare_blockers(attacker, blockers)
+
+    def resolve_combat(self) -> List[str]:
+        # Returns the state-based action results between first-strike and regular damage.
+        results = self.combat.resolve(self)
         self.combat.clear()
+        return results
 
     def apply_continuous_effects(self) -> None:
         self.continuous_effects.apply(self)
 
+    def characteristics(self, card: "Card") -> Characteristics:
+        return self.continuous_effects.characteristics(self, card)
+
     def check_state_based_actions(self) -> List[str]:
         return self.sba.check(self)
 
@@ -92,7 +111,19 @@ class GameState:
         item.ability.resolve(self, item)
         if item.source.is_type("Instant") or item.source.is_type("Sorcery"):
             item.source.owner.graveyard.add(item.source)
-        self.event_bus.emit(self, "resolved", item=item)
+            self.zone_changed(item.source, "Stack", "Graveyard")
+        if self.event_bus.has_subscribers("resolved"):
+            self.event_bus.emit(self, "resolved", item=item, source=item.source, controller=item.controller)
+
+    def zone_changed(self, card: "Card", zone_from: str, zone_to: str) -> None:
+        if zone_from == "Battlefield" or zone_to == "Battlefield":
+            self.continuous_effects.board_changed()
+        if zone_from == "Battlefield":
+            self.continuous_effects.card_left(card)
+        if self.event_bus.has_subscribers("zone_change"):
+            self.event_bus.emit(
+                self, "zone_change", source=card, controller=card.controller, zone_from=zone_from, zone_to=zone_to
+            )
 
     def pass_priority(self) -> None:
         all_passed = self.priority_manager.pass_priority(len(self.players))
@@ -102,13 +133,44 @@ class GameState:
             else:
                 self.advance_step()
 
-    def cast_spell(self, player: "Player", card: "Card", ability: Ability) -> None:
-        if not player.mana_pool.can_pay(card.mana_cost):
+    def cast_spell(self, player: "Player", card: "Card", ability: Ability, x: int = 0) -> None:
+        payment = player.mana_pool.payment(card.mana_cost, x=x, life=max(player.life, 0))
+        if payment is None:
             raise ValueError("Cannot pay mana cost")
-        player.mana_pool.pay(card.mana_cost)
+        player.mana_pool.spend(payment)
+        if payment.life:
+            player.life -= payment.life
         player.hand.remove(card)
+        self.zone_changed(card, "Hand", "Stack")
         self.add_to_stack(card, ability, controller=player)
 
+    def play_land(self, player: "Player", card: "Card") -> None:
+        player.hand.remove(card)
+        player.battlefield.add(card)
+        card.zone = "Battlefield"
+        self.zone_changed(card, "Hand", "Battlefield")
+        for factory in card.definition.abilities:
+            for ability in factory(card, self):
+                card.add_ability(ability)
+
+    def use_permanent_table(self) -> PermanentTable:
+        if self.permanent_table is None:
+            self.permanent_table = PermanentTable(self.players)
+            for player in self.players:
+                player.battlefield.bind(self.permanent_table, player)
+        return self.permanent_table
+
+    def state_hash(self) -> int:
+        # The first call hashes the whole state; later changes update it incrementally.
+        if self.hasher is None:
+            self.hasher = StateHasher(self)
+        return self.hasher.state_hash(self)
+
+    def clone(self) -> "GameState":
+        from py_mage.core.clone import clone_game_state
+
+        return clone_game_state(self)
+
     def next_timestamp(self) -> int:
         self.timestamp_counter += 1
         return self.timestamp_counter
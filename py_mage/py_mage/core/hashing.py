@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from hashlib import blake2b
+from typing import Dict, Tuple, TYPE_CHECKING
+
+
+MASK64 = (1 << 64) - 1
+ZOBRIST_CACHE_SIZE = 1 << 16
+HASHED_ZONES = ("library", "hand", "battlefield", "graveyard", "exile")
+
+
+@lru_cache(maxsize=ZOBRIST_CACHE_SIZE)
+def zobrist(*parts: object) -> int:
+    # Keys come from a digest rather than hash(), so they agree across
+    # processes and runs.
+    return int.from_bytes(blake2b(repr(parts).encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class StateHasher:
+    # Zobrist-style hashing: every card in a zone, life total and mana pool
+    # amount contributes a 64-bit key, and the hash is their sum modulo 2**64.
+    # Sums rather than XOR keep duplicates, such as two Forests in hand, from
+    # cancelling out. Zones, cards, players and pools report their changes
+    # here, so the hash is kept up to date in O(1) per change. Zones are
+    # hashed as multisets; library order is not part of the hash.
+    def __init__(self, game_state: "GameState") -> None:
+        self.value = 0
+        self.seats: Dict[int, int] = {}
+        self.cards: Dict[int, Tuple["Card", int, str, int]] = {}
+        for seat, player in enumerate(game_state.players):
+            self.seats[id(player)] = seat
+            self.seats[id(player.mana_pool)] = seat
+            player.hasher = self
+            player.mana_pool.hasher = self
+            self.value += zobrist("life", seat, player.life)
+            for symbol, amount in player.mana_pool.amounts.items():
+                self.value += mana_key(seat, symbol, amount)
+            for zone_name in HASHED_ZONES:
+                zone = getattr(player, zone_name)
+                self.seats[id(zone)] = seat
+                zone.hasher = self
+                for card in zone.cards:
+                    self.card_added(zone, card)
+        self.value &= MASK64
+
+    def card_added(self, zone: "Zone", card: "Card") -> None:
+        seat = self.seats[id(zone)]
+        term = card_key(seat, zone.name, card)
+        self.cards[id(card)] = (card, seat, zone.name, term)
+        card.hasher = self
+        self.value = (self.value + term) & MASK64
+
+    def card_removed(self, card: "Card") -> None:
+        entry = self.cards.pop(id(card), None)
+        if entry is not None:
+            card.hasher = None
+            self.value = (self.value - entry[3]) & MASK64
+
+    def card_changed(self, card: "Card") -> None:
+        entry = self.cards.get(id(card))
+        if entry is None:
+            return
+        _, seat, zone_name, old = entry
+        term = card_key(seat, zone_name, card)
+        if term != old:
+            self.cards[id(card)] = (card, seat, zone_name, term)
+            self.value = (self.value + term - old) & MASK64
+
+    def life_changed(self, player: "Player", old: int, new: int) -> None:
+        seat = self.seats[id(player)]
+        self.value = (self.value + zobrist("life", seat, new) - zobrist("life", seat, old)) & MASK64
+
+    def mana_changed(self, pool: "ManaPool", symbol: str, old: int, new: int) -> None:
+        seat = self.seats[id(pool)]
+        self.value = (self.value + mana_key(seat, symbol, new) - mana_key(seat, symbol, old)) & MASK64
+
+    def state_hash(self, game_state: "GameState") -> int:
+        # Turn position, losses and the stack are few and cheap to fold in on demand.
+        value = self.value + zobrist("step", game_state.turn_manager.current_index)
+        value += zobrist("active", game_state.active_player_index)
+        for seat, player in enumerate(game_state.players):
+            if player.has_lost:
+                value += zobrist("lost", seat)
+        for position, item in enumerate(game_state.stack.items):
+            controller = -1 if item.controller is None else self.seats.get(id(item.controller), -1)
+            value += zobrist("stack", position, item.source.name, item.ability.name, controller)
+        return value & MASK64
+
+
+def card_key(seat: int, zone_name: str, card: "Card") -> int:
+    return zobrist("card", seat, zone_name, card.name, card.tapped, card.damage)
+
+
+def mana_key(seat: int, symbol: str, amount: int) -> int:
+    return zobrist("mana", seat, symbol, amount) if amount else 0
+
+
+if TYPE_CHECKING:
+    from py_mage.core.card import Card
+    from py_mage.core.game_state import GameState
+    from py_mage.core.mana import ManaPool
+    from py_mage.core.player import Player
+    from py_mage.core.zones import Zone
@@ -31,16 +31,15 @@ def check_invariants(game_state: "GameState") -> None:
 
 def _check_combat(game_state: "GameState") -> None:
     for attacker, defender in game_state.combat.attackers:
-        if attacker not in attacker.controller.battlefield.cards:
+        if attacker not in attacker.controller.battlefield:
             raise AssertionError("Attacker is not on the battlefield")
         if defender not in game_state.players:
             raise AssertionError("Defender is not a player in the game")
-    attackers = [attacker for attacker, _ in game_state.combat.attackers]
     for attacker, blockers in game_state.combat.blockers:
-        if attacker not in attackers:
+        if game_state.combat.group(attacker) is None:
             raise AssertionError("Blocker assigned to non-attacking creature")
         for blocker in blockers:
-            if blocker not in blocker.controller.battlefield.cards:
+            if blocker not in blocker.controller.battlefield:
                 raise AssertionError("Blocker is not on the battlefield")
 
 
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass
 from enum import Enum
-from typing import Callable, List, TYPE_CHECKING
+from typing import Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple, TYPE_CHECKING
 
 
 class Layer(Enum):
@@ -16,27 +17,173 @@ class Layer(Enum):
 
 
 LayerEffect = Callable[["GameState"], None]
+CharacteristicFilter = Callable[["GameState", "Card", "Characteristics"], bool]
+CharacteristicEffect = Callable[["GameState", "Card", "Characteristics"], None]
 
 
-@dataclass
+@dataclass(slots=True)
+class Characteristics:
+    controller: "Player"
+    types: Tuple[str, ...]
+    subtypes: Tuple[str, ...]
+    abilities: Tuple["Ability", ...]
+    power: Optional[int]
+    toughness: Optional[int]
+
+    @classmethod
+    def of(cls, card: "Card") -> "Characteristics":
+        return cls(card.controller, card.types, card.subtypes, card.abilities, card.power, card.toughness)
+
+    def is_type(self, card_type: str) -> bool:
+        return card_type in self.types
+
+
+@dataclass(eq=False)
 class ContinuousEffect:
+    # apply mutates the game directly when effects are applied. modify instead
+    # computes a card's characteristics on query, for the cards that
+    # applies_to accepts. provides/depends_on name what an effect changes and
+    # what it reads, for rule 613.8 dependency ordering within a layer.
     layer: Layer
-    apply: LayerEffect
+    apply: Optional[LayerEffect]
     timestamp: int
     description: str = ""
+    modify: Optional[CharacteristicEffect] = None
+    applies_to: Optional[CharacteristicFilter] = None
+    provides: FrozenSet[str] = frozenset()
+    depends_on: FrozenSet[str] = frozenset()
+    # Set when the result depends on other permanents, e.g. "for each creature".
+    board_dependent: bool = False
+
+
+@dataclass(slots=True)
+class CachedCharacteristics:
+    card: "Card"
+    base: Tuple[object, ...]
+    characteristics: Characteristics
 
 
 class ContinuousEffects:
+    # Effects are kept per layer in timestamp order as they are added, and the
+    # dependency-ordered sequence is rebuilt only when the effect set changes.
+    # Computed characteristics are cached per card until an effect is added or
+    # removed, the card's own base values change, or, for board-dependent
+    # effects, the battlefield changes. A card's entry is dropped when it
+    # leaves the battlefield, so departed cards and tokens are not kept alive.
     def __init__(self) -> None:
-        self.effects: List[ContinuousEffect] = []
+        self._layers: Dict[Layer, List[ContinuousEffect]] = {layer: [] for layer in Layer}
+        self._ordered: Optional[List[ContinuousEffect]] = None
+        self._modifiers: List[ContinuousEffect] = []
+        self._board_dependent = 0
+        self._cache: Dict[int, CachedCharacteristics] = {}
+        self.version = 0
+
+    @property
+    def effects(self) -> List[ContinuousEffect]:
+        return list(self.ordered())
+
+    def __len__(self) -> int:
+        return sum(len(effects) for effects in self._layers.values())
+
+    def __iter__(self) -> Iterator[ContinuousEffect]:
+        return iter(self.ordered())
 
     def add(self, effect: ContinuousEffect) -> None:
-        self.effects.append(effect)
+        effects = self._layers[effect.layer]
+        effects.insert(bisect_right(effects, effect.timestamp, key=lambda item: item.timestamp), effect)
+        if effect.board_dependent:
+            self._board_dependent += 1
+        self._changed()
+
+    def remove(self, effect: ContinuousEffect) -> None:
+        effects = self._layers[effect.layer]
+        for index, candidate in enumerate(effects):
+            if candidate is effect:
+                del effects[index]
+                break
+        else:
+            raise ValueError(f"Continuous effect {effect.description!r} is not active")
+        if effect.board_dependent:
+            self._board_dependent -= 1
+        self._changed()
+
+    def copy(self) -> "ContinuousEffects":
+        clone = ContinuousEffects()
+        clone._layers = {layer: list(effects) for layer, effects in self._layers.items()}
+        clone._ordered = self._ordered
+        clone._modifiers = self._modifiers
+        clone._board_dependent = self._board_dependent
+        clone.version = self.version
+        return clone
+
+    def ordered(self) -> List[ContinuousEffect]:
+        if self._ordered is None:
+            self._ordered = [effect for layer in Layer for effect in dependency_order(self._layers[layer])]
+            self._modifiers = [effect for effect in self._ordered if effect.modify is not None]
+        return self._ordered
+
+    def modifies_characteristics(self) -> bool:
+        self.ordered()
+        return bool(self._modifiers)
+
+    def invalidate(self) -> None:
+        self.version += 1
+        self._cache.clear()
+
+    def board_changed(self) -> None:
+        if self._board_dependent:
+            self.invalidate()
+
+    def card_left(self, card: "Card") -> None:
+        entry = self._cache.get(id(card))
+        if entry is not None and entry.card is card:
+            del self._cache[id(card)]
 
     def apply(self, game_state: "GameState") -> None:
-        for effect in sorted(self.effects, key=lambda item: (item.layer.value, item.timestamp)):
-            effect.apply(game_state)
+        for effect in self.ordered():
+            if effect.apply is not None:
+                effect.apply(game_state)
+
+    def characteristics(self, game_state: "GameState", card: "Card") -> Characteristics:
+        base = (id(card.controller), card.types, card.subtypes, card.abilities, card.power, card.toughness)
+        entry = self._cache.get(id(card))
+        if entry is not None and entry.card is card and entry.base == base:
+            return entry.characteristics
+        result = Characteristics.of(card)
+        self.ordered()
+        for effect in self._modifiers:
+            if effect.applies_to is None or effect.applies_to(game_state, card, result):
+                effect.modify(game_state, card, result)
+        self._cache[id(card)] = CachedCharacteristics(card, base, result)
+        return result
+
+    def _changed(self) -> None:
+        self._ordered = None
+        self.invalidate()
+
+
+def dependency_order(effects: List[ContinuousEffect]) -> List[ContinuousEffect]:
+    # Rule 613.8: an effect that depends on another is applied after it, and
+    # otherwise timestamp order holds. Effects caught in a dependency loop fall
+    # back to timestamp order (613.8b).
+    if not any(effect.depends_on for effect in effects):
+        return effects
+    remaining = list(effects)
+    ordered: List[ContinuousEffect] = []
+    while remaining:
+        for index, effect in enumerate(remaining):
+            if not effect.depends_on or not any(
+                other is not effect and effect.depends_on & other.provides for other in remaining
+            ):
+                break
+        else:
+            index = 0
+        ordered.append(remaining.pop(index))
+    return ordered
 
 
 if TYPE_CHECKING:
+    from py_mage.core.abilities import Ability
+    from py_mage.core.card import Card
     from py_mage.core.game_state import GameState
+    from py_mage.core.player import Player
@@ -1,66 +1,248 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
-from typing import Dict
+from functools import lru_cache
+from itertools import product
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple, TYPE_CHECKING
 
 
-@dataclass(frozen=True)
+# Pool and requirement vectors are indexed in this order.
+MANA_SYMBOLS = ("W", "U", "B", "R", "G", "C")
+SYMBOL_INDEX = {symbol: index for index, symbol in enumerate(MANA_SYMBOLS)}
+COLORLESS_INDEX = SYMBOL_INDEX["C"]
+PHYREXIAN = "P"
+TWO_GENERIC = "2"
+LIFE_PER_PHYREXIAN = 2
+VARIABLE_SYMBOLS = ("X", "Y", "Z")
+# Snow sources are not modelled, so {S} is paid like generic mana.
+SNOW = "S"
+PAYMENT_CACHE_SIZE = 1 << 16
+
+SYMBOL_RE = re.compile(r"\{([^}]*)\}")
+
+ManaVector = Tuple[int, ...]
+NO_MANA: ManaVector = (0,) * len(MANA_SYMBOLS)
+
+_INTERNED: Dict["ManaCost", "ManaCost"] = {}
+
+
+@dataclass(frozen=True, slots=True)
+class ManaRequirement:
+    # Precompiled form of a cost: mana of exact types, generic mana, the number
+    # of X symbols, and each distinct hybrid symbol with how often it appears.
+    fixed: ManaVector
+    generic: int
+    x: int
+    choices: Tuple[Tuple[Tuple[str, ...], int], ...]
+
+
+@dataclass(frozen=True, slots=True)
 class ManaCost:
     generic: int = 0
-    colored: Dict[str, int] = field(default_factory=dict)
+    # Counts of mana of exact types, indexed like MANA_SYMBOLS. A mapping such
+    # as {"G": 1} is accepted and converted.
+    colored: ManaVector = NO_MANA
+    # One tuple of alternatives per hybrid or phyrexian symbol, e.g. {2/G} is ("2", "G").
+    hybrid: Tuple[Tuple[str, ...], ...] = ()
+    x: int = 0
+    mana_value: int = field(init=False, repr=False, compare=False)
+    requirement: ManaRequirement = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if isinstance(self.colored, Mapping):
+            object.__setattr__(self, "colored", mana_vector(self.colored))
+        # Mana value: X counts as zero and {2/G} as two.
+        hybrid = sum(2 if TWO_GENERIC in alternatives else 1 for alternatives in self.hybrid)
+        object.__setattr__(self, "mana_value", self.generic + sum(self.colored) + hybrid)
+        counts: Dict[Tuple[str, ...], int] = {}
+        for alternatives in self.hybrid:
+            counts[alternatives] = counts.get(alternatives, 0) + 1
+        requirement = ManaRequirement(self.colored, self.generic, self.x, tuple(counts.items()))
+        object.__setattr__(self, "requirement", requirement)
 
     @classmethod
     def from_string(cls, value: str) -> "ManaCost":
-        generic = 0
-        colored: Dict[str, int] = {}
-        for symbol in value.replace("{", "").split("}"):
-            if not symbol:
-                continue
-            if symbol.isdigit():
-                generic += int(symbol)
-            else:
-                colored[symbol] = colored.get(symbol, 0) + 1
-        return cls(generic=generic, colored=colored)
+        return parse_mana_cost(value)
 
     def total(self) -> int:
-        return self.generic + sum(self.colored.values())
+        return self.mana_value
+
+    def amounts(self) -> Dict[str, int]:
+        return {symbol: amount for symbol, amount in zip(MANA_SYMBOLS, self.colored) if amount}
+
+
+@lru_cache(maxsize=None)
+def parse_mana_cost(value: str) -> ManaCost:
+    generic = 0
+    x = 0
+    colored = [0] * len(MANA_SYMBOLS)
+    hybrid: List[Tuple[str, ...]] = []
+    for symbol in SYMBOL_RE.findall(value):
+        if symbol.isdigit():
+            generic += int(symbol)
+        elif symbol in SYMBOL_INDEX:
+            colored[SYMBOL_INDEX[symbol]] += 1
+        elif symbol in VARIABLE_SYMBOLS:
+            x += 1
+        elif symbol == SNOW:
+            generic += 1
+        elif "/" in symbol:
+            hybrid.append(parse_hybrid(symbol))
+        else:
+            raise ValueError(f"Unknown mana symbol {{{symbol}}}")
+    return intern_cost(ManaCost(generic=generic, colored=tuple(colored), hybrid=tuple(hybrid), x=x))
+
+
+def intern_cost(cost: ManaCost) -> ManaCost:
+    # Equal costs written differently, e.g. "{G}{1}" and "{1}{G}", share one instance.
+    return _INTERNED.setdefault(cost, cost)
+
+
+def mana_vector(amounts: Mapping[str, int]) -> ManaVector:
+    vector = [0] * len(MANA_SYMBOLS)
+    for symbol, amount in amounts.items():
+        if symbol not in SYMBOL_INDEX:
+            raise ValueError(f"Unknown mana symbol {{{symbol}}}")
+        vector[SYMBOL_INDEX[symbol]] += amount
+    return tuple(vector)
+
+
+def parse_hybrid(symbol: str) -> Tuple[str, ...]:
+    alternatives = tuple(symbol.split("/"))
+    for alternative in alternatives:
+        if alternative not in SYMBOL_INDEX and alternative not in (PHYREXIAN, TWO_GENERIC):
+            raise ValueError(f"Unknown mana symbol {{{symbol}}}")
+    return alternatives
+
+
+@dataclass(frozen=True, slots=True)
+class ManaPayment:
+    spent: ManaVector
+    life: int = 0
+
+    def amounts(self) -> Dict[str, int]:
+        return {symbol: amount for symbol, amount in zip(MANA_SYMBOLS, self.spent) if amount}
 
 
 @dataclass
 class ManaPool:
     amounts: Dict[str, int] = field(default_factory=dict)
+    hasher: Optional["StateHasher"] = field(default=None, repr=False, compare=False)
 
     def add(self, symbol: str, amount: int = 1) -> None:
-        self.amounts[symbol] = self.amounts.get(symbol, 0) + amount
+        old = self.amounts.get(symbol, 0)
+        self.amounts[symbol] = old + amount
+        if self.hasher is not None:
+            self.hasher.mana_changed(self, symbol, old, old + amount)
 
     def clear(self) -> None:
+        if self.hasher is not None:
+            for symbol, amount in self.amounts.items():
+                self.hasher.mana_changed(self, symbol, amount, 0)
         self.amounts.clear()
 
-    def can_pay(self, cost: ManaCost) -> bool:
-        if sum(self.amounts.values()) < cost.total():
-            return False
-        for symbol, amount in cost.colored.items():
-            if self.amounts.get(symbol, 0) < amount:
-                return False
-        return True
+    def vector(self) -> ManaVector:
+        amounts = self.amounts
+        return tuple(amounts.get(symbol, 0) for symbol in MANA_SYMBOLS)
+
+    def payment(self, cost: ManaCost, x: int = 0, life: int = 0) -> Optional[ManaPayment]:
+        # life is the most life the payer may spend on phyrexian symbols.
+        return solve_payment(cost.requirement, self.vector(), x, life)
+
+    def can_pay(self, cost: ManaCost, x: int = 0, life: int = 0) -> bool:
+        pool = self.vector()
+        if not cost.hybrid:
+            return sum(pool) >= cost.mana_value + cost.x * x and all(map(int.__ge__, pool, cost.colored))
+        return solve_payment(cost.requirement, pool, x, life) is not None
 
-    def pay(self, cost: ManaCost) -> None:
-        if not self.can_pay(cost):
+    def pay(self, cost: ManaCost, x: int = 0, life: int = 0) -> ManaPayment:
+        payment = self.payment(cost, x, life)
+        if payment is None:
             raise ValueError("Insufficient mana")
-        for symbol, amount in cost.colored.items():
-            self.amounts[symbol] -= amount
-        remaining = cost.generic
-        for symbol in list(self.amounts.keys()):
-            if remaining <= 0:
-                break
-            spend = min(self.amounts[symbol], remaining)
-            self.amounts[symbol] -= spend
-            remaining -= spend
-        if remaining > 0:
-            raise ValueError("Could not spend generic mana")
+        self.spend(payment)
+        return payment
+
+    def spend(self, payment: ManaPayment) -> None:
+        for symbol, amount in zip(MANA_SYMBOLS, payment.spent):
+            if amount:
+                old = self.amounts[symbol]
+                self.amounts[symbol] = old - amount
+                if self.hasher is not None:
+                    self.hasher.mana_changed(self, symbol, old, old - amount)
         self._cleanup()
 
     def _cleanup(self) -> None:
         for symbol in list(self.amounts.keys()):
             if self.amounts[symbol] == 0:
                 del self.amounts[symbol]
+
+
+@lru_cache(maxsize=PAYMENT_CACHE_SIZE)
+def solve_payment(requirement: ManaRequirement, pool: ManaVector, x: int = 0, life: int = 0) -> Optional[ManaPayment]:
+    # Tries every way to pay the hybrid symbols and keeps the feasible payment
+    # that pays the least life, then leaves the most mana, then leaves the
+    # most distinct types of mana. Generic mana is spent from colorless first,
+    # then from whichever type has the most left.
+    available = sum(pool)
+    base_generic = requirement.generic + requirement.x * x
+    if available < base_generic + sum(requirement.fixed):
+        return None
+    best: Optional[Tuple[Tuple[int, int, int], ManaPayment]] = None
+    for specific, generic, life_paid in hybrid_options(requirement):
+        if life_paid > life:
+            continue
+        generic += base_generic
+        left = [have - need for have, need in zip(pool, specific)]
+        if min(left) < 0 or sum(left) < generic:
+            continue
+        spent = list(specific)
+        spend_generic(left, spent, generic)
+        score = (life_paid, -sum(left), -sum(1 for amount in left if amount))
+        if best is None or score < best[0]:
+            best = (score, ManaPayment(tuple(spent), life_paid))
+    return None if best is None else best[1]
+
+
+def hybrid_options(requirement: ManaRequirement) -> Iterator[Tuple[List[int], int, int]]:
+    per_symbol = [list(splits(count, len(alternatives))) for alternatives, count in requirement.choices]
+    for split in product(*per_symbol):
+        specific = list(requirement.fixed)
+        generic = 0
+        life = 0
+        for (alternatives, _), amounts in zip(requirement.choices, split):
+            for alternative, amount in zip(alternatives, amounts):
+                if not amount:
+                    continue
+                if alternative == TWO_GENERIC:
+                    generic += 2 * amount
+                elif alternative == PHYREXIAN:
+                    life += LIFE_PER_PHYREXIAN * amount
+                else:
+                    specific[SYMBOL_INDEX[alternative]] += amount
+        yield specific, generic, life
+
+
+def splits(total: int, parts: int) -> Iterator[Tuple[int, ...]]:
+    if parts == 1:
+        yield (total,)
+        return
+    for first in range(total, -1, -1):
+        for rest in splits(total - first, parts - 1):
+            yield (first, *rest)
+
+
+def spend_generic(left: List[int], spent: List[int], generic: int) -> None:
+    colorless = min(left[COLORLESS_INDEX], generic)
+    left[COLORLESS_INDEX] -= colorless
+    spent[COLORLESS_INDEX] += colorless
+    generic -= colorless
+    while generic:
+        index = max(range(COLORLESS_INDEX), key=left.__getitem__)
+        left[index] -= 1
+        spent[index] += 1
+        generic -= 1
+
+
+if TYPE_CHECKING:
+    from py_mage.core.hashing import StateHasher
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+from array import array
+from typing import Dict, List, Optional, Sequence, TYPE_CHECKING
+
+from py_mage.core.card import Card
+
+
+NO_VALUE = 2**31 - 1
+NO_PLAYER = 255
+
+
+class PermanentTable:
+    # Struct-of-arrays storage for the battlefield. Attached cards become
+    # TableCard views whose hot characteristics live in these columns. Boolean
+    # columns are int bitsets indexed by row, so whole-board updates are a
+    # single mask operation.
+    def __init__(self, players: Sequence["Player"]) -> None:
+        self.players = list(players)
+        self._player_index: Dict[int, int] = {id(player): index for index, player in enumerate(self.players)}
+        self.tapped_bits = 0
+        self.lethal_bits = 0
+        self.holder_bits = [0] * len(self.players)
+        self.damage = array("i")
+        self.power = array("i")
+        self.toughness = array("i")
+        self.controller = array("B")
+        self.holder = array("B")
+        self.timestamp = array("q")
+        self.cards: List[Optional[Card]] = []
+        self._free: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self.cards) - len(self._free)
+
+    def player_index(self, player: "Player") -> int:
+        return self._player_index[id(player)]
+
+    def attach(self, card: Card, holder: "Player") -> None:
+        if type(card) is TableCard:
+            raise ValueError(f"Card {card.name} is already on a permanent table")
+        holder_index = self.player_index(holder)
+        values = (
+            card.damage,
+            NO_VALUE if card.power is None else card.power,
+            NO_VALUE if card.toughness is None else card.toughness,
+            self.player_index(card.controller),
+            holder_index,
+            card.timestamp,
+        )
+        if self._free:
+            row = self._free.pop()
+            self.cards[row] = card
+            (
+                self.damage[row],
+                self.power[row],
+                self.toughness[row],
+                self.controller[row],
+                self.holder[row],
+                self.timestamp[row],
+            ) = values
+        else:
+            row = len(self.cards)
+            self.cards.append(card)
+            for column, value in zip(
+                (self.damage, self.power, self.toughness, self.controller, self.holder, self.timestamp), values
+            ):
+                column.append(value)
+        self.holder_bits[holder_index] |= 1 << row
+        self.set_tapped(row, card.tapped)
+        self.update_lethal(row)
+        card.table = self
+        card.row = row
+        card.__class__ = TableCard
+
+    def detach(self, card: Card) -> None:
+        if type(card) is not TableCard or card.table is not self:
+            raise ValueError(f"Card {card.name} is not on this permanent table")
+        row = card.row
+        tapped, damage, power, toughness = card.tapped, card.damage, card.power, card.toughness
+        controller, timestamp = card.controller, card.timestamp
+        card.__class__ = Card
+        card.table = None
+        card.row = -1
+        card.tapped, card.damage, card.power, card.toughness = tapped, damage, power, toughness
+        card.controller, card.timestamp = controller, timestamp
+        mask = ~(1 << row)
+        self.holder_bits[self.holder[row]] &= mask
+        self.tapped_bits &= mask
+        self.lethal_bits &= mask
+        self.cards[row] = None
+        self.damage[row] = 0
+        self.toughness[row] = NO_VALUE
+        self.controller[row] = NO_PLAYER
+        self.holder[row] = NO_PLAYER
+        self._free.append(row)
+
+    def set_tapped(self, row: int, tapped: bool) -> None:
+        if tapped:
+            self.tapped_bits |= 1 << row
+        else:
+            self.tapped_bits &= ~(1 << row)
+
+    def update_lethal(self, row: int) -> None:
+        if self.damage[row] >= self.toughness[row]:
+            self.lethal_bits |= 1 << row
+        else:
+            self.lethal_bits &= ~(1 << row)
+
+    def untap(self, holder: "Player") -> None:
+        self.tapped_bits &= ~self.holder_bits[self.player_index(holder)]
+
+    def lethally_damaged(self) -> List[Card]:
+        cards = []
+        bits = self.lethal_bits
+        while bits:
+            low = bits & -bits
+            cards.append(self.cards[low.bit_length() - 1])
+            bits ^= low
+        return cards
+
+
+class TableCard(Card):
+    __slots__ = ()
+
+    @property
+    def tapped(self) -> bool:
+        return bool(self.table.tapped_bits >> self.row & 1)
+
+    @tapped.setter
+    def tapped(self, value: bool) -> None:
+        self.table.set_tapped(self.row, value)
+        if self.hasher is not None:
+            self.hasher.card_changed(self)
+
+    @property
+    def damage(self) -> int:
+        return self.table.damage[self.row]
+
+    @damage.setter
+    def damage(self, value: int) -> None:
+        self.table.damage[self.row] = value
+        self.table.update_lethal(self.row)
+        if self.hasher is not None:
+            self.hasher.card_changed(self)
+
+    @property
+    def power(self) -> Optional[int]:
+        value = self.table.power[self.row]
+        return None if value == NO_VALUE else value
+
+    @power.setter
+    def power(self, value: Optional[int]) -> None:
+        self.table.power[self.row] = NO_VALUE if value is None else value
+
+    @property
+    def toughness(self) -> Optional[int]:
+        value = self.table.toughness[self.row]
+        return None if value == NO_VALUE else value
+
+    @toughness.setter
+    def toughness(self, value: Optional[int]) -> None:
+        self.table.toughness[self.row] = NO_VALUE if value is None else value
+        self.table.update_lethal(self.row)
+
+    @property
+    def controller(self) -> "Player":
+        return self.table.players[self.table.controller[self.row]]
+
+    @controller.setter
+    def controller(self, value: "Player") -> None:
+        self.table.controller[self.row] = self.table.player_index(value)
+
+    @property
+    def timestamp(self) -> int:
+        return self.table.timestamp[self.row]
+
+    @timestamp.setter
+    def timestamp(self, value: int) -> None:
+        self.table.timestamp[self.row] = value
+
+
+if TYPE_CHECKING:
+    from py_mage.core.player import Player
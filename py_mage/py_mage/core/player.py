@@ -1,25 +1,70 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from typing import Optional, TYPE_CHECKING
 
 from py_mage.core.mana import ManaPool
 from py_mage.core.zones import Zone
 
 
-@dataclass
+@dataclass(slots=True, init=False)
 class Player:
     name: str
-    life: int = 20
-    mana_pool: ManaPool = field(default_factory=ManaPool)
-    library: Zone = field(default_factory=lambda: Zone("Library"))
-    hand: Zone = field(default_factory=lambda: Zone("Hand"))
-    battlefield: Zone = field(default_factory=lambda: Zone("Battlefield"))
-    graveyard: Zone = field(default_factory=lambda: Zone("Graveyard"))
-    exile: Zone = field(default_factory=lambda: Zone("Exile"))
-    has_lost: bool = False
+    _life: int
+    mana_pool: ManaPool
+    library: Zone
+    hand: Zone
+    battlefield: Zone
+    graveyard: Zone
+    exile: Zone
+    has_lost: bool
+    watcher: Optional["StateBasedActions"] = field(repr=False, compare=False)
+    hasher: Optional["StateHasher"] = field(repr=False, compare=False)
+
+    def __init__(
+        self,
+        name: str,
+        life: int = 20,
+        mana_pool: Optional[ManaPool] = None,
+        library: Optional[Zone] = None,
+        hand: Optional[Zone] = None,
+        battlefield: Optional[Zone] = None,
+        graveyard: Optional[Zone] = None,
+        exile: Optional[Zone] = None,
+        has_lost: bool = False,
+    ) -> None:
+        self.name = name
+        self._life = life
+        self.mana_pool = mana_pool if mana_pool is not None else ManaPool()
+        self.library = library if library is not None else Zone("Library")
+        self.hand = hand if hand is not None else Zone("Hand")
+        self.battlefield = battlefield if battlefield is not None else Zone("Battlefield")
+        self.graveyard = graveyard if graveyard is not None else Zone("Graveyard")
+        self.exile = exile if exile is not None else Zone("Exile")
+        self.has_lost = has_lost
+        self.watcher = None
+        self.hasher = None
+
+    @property
+    def life(self) -> int:
+        return self._life
+
+    @life.setter
+    def life(self, value: int) -> None:
+        old = self._life
+        self._life = value
+        if self.watcher is not None:
+            self.watcher.life_changed(self)
+        if self.hasher is not None:
+            self.hasher.life_changed(self, old, value)
 
     def draw(self) -> None:
         if not self.library.cards:
             self.has_lost = True
             return
-        self.hand.add(self.library.cards.pop())
+        self.hand.add(self.library.pop())
+
+
+if TYPE_CHECKING:
+    from py_mage.core.hashing import StateHasher
+    from py_mage.core.sba import StateBasedActions
@@ -20,6 +20,11 @@ class ReplacementEffects:
     def add(self, effect: Replacement) -> None:
         self.effects.append(effect)
 
+    def copy(self) -> "ReplacementEffects":
+        clone = ReplacementEffects()
+        clone.effects = list(self.effects)
+        return clone
+
     def handle(self, game_state: "GameState", event: "GameEvent") -> bool:
         for effect in self.effects:
             if effect.applies(game_state, event):
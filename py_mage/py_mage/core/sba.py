@@ -1,12 +1,84 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import List, TYPE_CHECKING
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple, TYPE_CHECKING
 
 
 @dataclass
 class StateBasedActions:
+    # Setters on Card.damage/toughness and Player.life report changes here, so a
+    # check only re-examines what changed since the previous one. full_scan
+    # restores the exhaustive check for debugging. Continuous effects can change
+    # any card's toughness, so a change to them forces one full scan.
+    full_scan: bool = False
+    effects_version: int = field(default=0, repr=False, compare=False)
+    dirty_cards: Dict[int, "Card"] = field(default_factory=dict, repr=False, compare=False)
+    losing_players: Dict[int, "Player"] = field(default_factory=dict, repr=False, compare=False)
+
+    def watch(self, game_state: "GameState") -> None:
+        for player in game_state.players:
+            player.watcher = self
+            player.battlefield.watcher = self
+            self.life_changed(player)
+            for card in player.battlefield.cards:
+                card.watcher = self
+                self.dirty_cards[id(card)] = card
+
+    def card_changed(self, card: "Card") -> None:
+        self.dirty_cards[id(card)] = card
+
+    def life_changed(self, player: "Player") -> None:
+        if player.life <= 0:
+            self.losing_players[id(player)] = player
+        else:
+            self.losing_players.pop(id(player), None)
+
     def check(self, game_state: "GameState") -> List[str]:
+        effects = game_state.continuous_effects
+        if self.full_scan or effects.version != self.effects_version:
+            self.effects_version = effects.version
+            self.dirty_cards.clear()
+            return self.scan(game_state)
+        results: List[str] = []
+        if self.losing_players:
+            for player in game_state.players:
+                if id(player) in self.losing_players:
+                    player.has_lost = True
+                    results.append(f"{player.name} loses the game")
+        table = game_state.permanent_table
+        if table is not None and not effects.modifies_characteristics():
+            self.dirty_cards.clear()
+            lethal = table.lethally_damaged()
+        elif table is not None:
+            # Table writes bypass the watcher and the lethal bits use base toughness.
+            self.dirty_cards.clear()
+            lethal = [
+                card
+                for player in game_state.players
+                for card in player.battlefield.cards
+                if is_lethally_damaged(card, game_state)
+            ]
+        else:
+            lethal = [card for card in self.dirty_cards.values() if is_lethally_damaged(card, game_state)]
+            self.dirty_cards.clear()
+        if not lethal:
+            return results
+        # Destroy in the order a full scan would: by player, then battlefield position.
+        dying: List[Tuple[int, int, "Card", "Player"]] = []
+        for card in lethal:
+            for index, player in enumerate(game_state.players):
+                if card in player.battlefield:
+                    dying.append((index, player.battlefield.cards.index(card), card, player))
+                    break
+        dying.sort(key=lambda entry: entry[:2])
+        for _, _, card, player in dying:
+            player.battlefield.remove(card)
+            player.graveyard.add(card)
+            game_state.zone_changed(card, "Battlefield", "Graveyard")
+            results.append(f"{card.name} died")
+        return results
+
+    def scan(self, game_state: "GameState") -> List[str]:
         results: List[str] = []
         for player in game_state.players:
             if player.life <= 0:
@@ -14,12 +86,24 @@ class StateBasedActions:
                 results.append(f"{player.name} loses the game")
         for player in game_state.players:
             for card in list(player.battlefield.cards):
-                if card.toughness is not None and card.damage >= card.toughness:
+                if is_lethally_damaged(card, game_state):
                     player.battlefield.remove(card)
                     player.graveyard.add(card)
+                    game_state.zone_changed(card, "Battlefield", "Graveyard")
                     results.append(f"{card.name} died")
         return results
 
 
+def is_lethally_damaged(card: "Card", game_state: "GameState") -> bool:
+    effects = game_state.continuous_effects
+    if effects.modifies_characteristics():
+        toughness = effects.characteristics(game_state, card).toughness
+    else:
+        toughness = card.toughness
+    return toughness is not None and card.damage >= toughness
+
+
 if TYPE_CHECKING:
+    from py_mage.core.card import Card
     from py_mage.core.game_state import GameState
+    from py_mage.core.player import Player
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import List, Optional, TYPE_CHECKING
 
 
-@dataclass
+@dataclass(slots=True)
 class StackItem:
     source: "Card"
     ability: "Ability"
@@ -1,23 +1,147 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Iterable, List, TYPE_CHECKING
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Union, TYPE_CHECKING, overload
+
+
+class OrderedCards:
+    # Cards keyed by identity in insertion order, so membership and removal are
+    # O(1) while iteration, append and pop-from-the-end behave like a list.
+    __slots__ = ("_cards",)
+
+    def __init__(self, cards: Iterable["Card"] = ()) -> None:
+        self._cards: Dict[int, "Card"] = {}
+        self.extend(cards)
+
+    def append(self, card: "Card") -> None:
+        key = id(card)
+        if key in self._cards:
+            raise ValueError(f"Card {card.name} is already in this zone")
+        self._cards[key] = card
+
+    def extend(self, cards: Iterable["Card"]) -> None:
+        for card in cards:
+            self.append(card)
+
+    def remove(self, card: "Card") -> None:
+        if self._cards.get(id(card)) is not card:
+            raise ValueError(f"Card {card.name} is not in this zone")
+        del self._cards[id(card)]
+
+    def pop(self, index: int = -1) -> "Card":
+        if not self._cards:
+            raise IndexError("pop from empty zone")
+        if index == -1:
+            return self._cards.popitem()[1]
+        card = self[index]
+        del self._cards[id(card)]
+        return card
+
+    def clear(self) -> None:
+        self._cards.clear()
+
+    def mapped(self, transform: Callable[["Card"], "Card"]) -> "OrderedCards":
+        # For one-to-one transforms such as cloning, which cannot introduce duplicates.
+        result = OrderedCards()
+        for card in self._cards.values():
+            mapped = transform(card)
+            result._cards[id(mapped)] = mapped
+        return result
+
+    def index(self, card: "Card") -> int:
+        for position, candidate in enumerate(self._cards.values()):
+            if candidate is card:
+                return position
+        raise ValueError(f"Card {card.name} is not in this zone")
+
+    def __contains__(self, card: object) -> bool:
+        return self._cards.get(id(card)) is card
+
+    def __iter__(self) -> Iterator["Card"]:
+        return iter(self._cards.values())
+
+    def __reversed__(self) -> Iterator["Card"]:
+        return reversed(self._cards.values())
+
+    def __len__(self) -> int:
+        return len(self._cards)
+
+    @overload
+    def __getitem__(self, index: int) -> "Card": ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List["Card"]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union["Card", List["Card"]]:
+        if index == 0 and self._cards:
+            return next(iter(self._cards.values()))
+        if index == -1 and self._cards:
+            return next(reversed(self._cards.values()))
+        return list(self._cards.values())[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, OrderedCards):
+            return list(self) == list(other)
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"OrderedCards({list(self)!r})"
 
 
 @dataclass
 class Zone:
     name: str
-    cards: List["Card"] = field(default_factory=list)
+    cards: OrderedCards = field(default_factory=OrderedCards)
+    table: Optional["PermanentTable"] = field(default=None, repr=False, compare=False)
+    holder: Optional["Player"] = field(default=None, repr=False, compare=False)
+    watcher: Optional["StateBasedActions"] = field(default=None, repr=False, compare=False)
+    hasher: Optional["StateHasher"] = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.cards, OrderedCards):
+            self.cards = OrderedCards(self.cards)
 
     def add(self, card: "Card") -> None:
         self.cards.append(card)
+        if self.table is not None:
+            self.table.attach(card, self.holder)
+        if self.watcher is not None:
+            card.watcher = self.watcher
+            self.watcher.card_changed(card)
+        if self.hasher is not None:
+            self.hasher.card_added(self, card)
 
     def remove(self, card: "Card") -> None:
         self.cards.remove(card)
+        if self.table is not None:
+            self.table.detach(card)
+        if self.hasher is not None:
+            self.hasher.card_removed(card)
+
+    def pop(self) -> "Card":
+        card = self.cards[-1]
+        self.remove(card)
+        return card
 
     def extend(self, cards: Iterable["Card"]) -> None:
-        self.cards.extend(cards)
+        for card in cards:
+            self.add(card)
+
+    def bind(self, table: "PermanentTable", holder: "Player") -> None:
+        self.table = table
+        self.holder = holder
+        for card in self.cards:
+            table.attach(card, holder)
+
+    def __contains__(self, card: object) -> bool:
+        return card in self.cards
 
 
 if TYPE_CHECKING:
     from py_mage.core.card import Card
+    from py_mage.core.hashing import StateHasher
+    from py_mage.core.permanents import PermanentTable
+    from py_mage.core.player import Player
+    from py_mage.core.sba import StateBasedActions
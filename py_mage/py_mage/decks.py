@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+from dataclasses import asdict, dataclass, field, replace
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from py_mage.cards.registry import catalog_fingerprint, get_definition, printing_name
+from py_mage.core.card import Card, CardDefinition
+from py_mage.core.mana import ManaCost
+from py_mage.core.player import Player
+
+
+DECK_LINE_RE = re.compile(r"^(\d+)\s+(?:\[([^:\]]+):([^\]]+)\]\s*)?(.+?)\s*$")
+SIDEBOARD_PREFIX = "SB:"
+NAME_PREFIX = "NAME:"
+COMMENT_PREFIXES = ("//", "#")
+DECK_CACHE_VERSION = 1
+DEFAULT_DECK_CACHE_DIR = Path(__file__).resolve().parents[1] / "data" / "deck_cache"
+
+
+@dataclass(frozen=True)
+class DeckEntry:
+    count: int
+    name: str
+    set_code: Optional[str] = None
+    collector_number: Optional[str] = None
+
+
+@dataclass
+class Deck:
+    name: str
+    main: List[DeckEntry] = field(default_factory=list)
+    sideboard: List[DeckEntry] = field(default_factory=list)
+
+    def size(self) -> int:
+        return sum(entry.count for entry in self.main)
+
+
+def parse_deck(text: str, name: str = "") -> Deck:
+    deck = Deck(name)
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not line or line.startswith(COMMENT_PREFIXES):
+            continue
+        if line.startswith(NAME_PREFIX):
+            deck.name = line[len(NAME_PREFIX):].strip() or deck.name
+            continue
+        entries = deck.main
+        if line.startswith(SIDEBOARD_PREFIX):
+            entries = deck.sideboard
+            line = line[len(SIDEBOARD_PREFIX):].strip()
+        match = DECK_LINE_RE.match(line)
+        # Other headers such as AUTHOR: or LAYOUT are not deck contents.
+        if match is None:
+            continue
+        count, set_code, number, card_name = match.groups()
+        entries.append(DeckEntry(int(count), card_name, set_code, number))
+    return deck
+
+
+def resolve_deck(deck: Deck) -> Deck:
+    main = [resolve_printing(entry) for entry in deck.main]
+    sideboard = [resolve_printing(entry) for entry in deck.sideboard]
+    return Deck(deck.name, main, sideboard)
+
+
+def resolve_printing(entry: DeckEntry) -> DeckEntry:
+    # [SET:NUM] names the printing; the catalog's name for it wins over the
+    # name written in the deck, which older decks sometimes spell differently.
+    if entry.set_code is None or entry.collector_number is None:
+        return entry
+    name = printing_name(entry.set_code, entry.collector_number)
+    if name is None or name == entry.name:
+        return entry
+    return replace(entry, name=name)
+
+
+def load_deck(path: Path, cache_dir: Optional[Path] = None) -> Deck:
+    data = path.read_bytes()
+    if cache_dir is None:
+        return resolve_deck(parse_deck(data.decode("utf-8", errors="replace"), name=path.stem))
+    cached = cache_dir / f"{deck_cache_key(data, path.stem)}.json"
+    try:
+        return deck_from_json(json.loads(cached.read_text(encoding="utf-8")))
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    deck = resolve_deck(parse_deck(data.decode("utf-8", errors="replace"), name=path.stem))
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = cached.with_name(f"{cached.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(asdict(deck)), encoding="utf-8")
+    # Workers may resolve the same deck at once; the rename keeps readers
+    # from seeing a partial file.
+    os.replace(tmp_path, cached)
+    return deck
+
+
+def deck_cache_key(data: bytes, name: str) -> str:
+    # Resolution depends on the deck text, the fallback name and the catalog,
+    # so a changed file or a rebuilt catalog gets a new entry.
+    digest = hashlib.sha256(f"{DECK_CACHE_VERSION}\n{catalog_fingerprint()}\n{name}\n".encode("utf-8"))
+    digest.update(data)
+    return digest.hexdigest()
+
+
+def deck_from_json(data: Dict[str, Any]) -> Deck:
+    return Deck(
+        data["name"],
+        [DeckEntry(**entry) for entry in data["main"]],
+        [DeckEntry(**entry) for entry in data["sideboard"]],
+    )
+
+
+def resolve_entry(entry: DeckEntry) -> Tuple[CardDefinition, bool]:
+    try:
+        return get_definition(entry.name), True
+    except KeyError:
+        return unsupported_definition(entry.name), False
+
+
+@lru_cache(maxsize=None)
+def unsupported_definition(name: str) -> CardDefinition:
+    # Cards the registry cannot build still take up their library slot, as
+    # vanilla cards with no types that are never played.
+    return CardDefinition(name=name, mana_cost=ManaCost(), types=())
+
+
+def build_library(deck: Deck, owner: Player) -> Tuple[List[Card], int]:
+    # Returns the cards in deck order and how many of them are unsupported.
+    cards: List[Card] = []
+    unsupported = 0
+    for entry in deck.main:
+        definition, supported = resolve_entry(entry)
+        if not supported:
+            unsupported += entry.count
+        cards.extend(Card(definition, owner=owner, controller=owner) for _ in range(entry.count))
+    return cards, unsupported
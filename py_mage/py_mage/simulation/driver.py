@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from py_mage.cards.basic import make_creature_spell, make_lightning_bolt_spell
+from py_mage.core.abilities import ActivatedAbility
+from py_mage.core.card import Card
+from py_mage.core.game_state import GameState
+from py_mage.core.player import Player
+
+
+MAX_HAND_SIZE = 7
+CREATURE_SPELL = "creature"
+BOLT_SPELL = "bolt"
+BOLT_DAMAGE = 3
+
+
+@dataclass
+class GameDriver:
+    # Wraps a GameState with the actions a policy may take and the bookkeeping
+    # the engine does not track yet: land drops and summoning sickness.
+    game: GameState
+    entered: Dict[int, int] = field(default_factory=dict)
+    land_played_turn: int = 0
+
+    def opponent(self, player: Player) -> Player:
+        return next(other for other in self.game.players if other is not player and not other.has_lost)
+
+    def power(self, card: Card) -> int:
+        return self.game.characteristics(card).power or 0
+
+    def lethal_damage(self, card: Card) -> int:
+        return max((self.game.characteristics(card).toughness or 0) - card.damage, 0)
+
+    def creatures(self, player: Player) -> List[Card]:
+        return [card for card in player.battlefield.cards if self.game.characteristics(card).is_type("Creature")]
+
+    def untapped_creatures(self, player: Player) -> List[Card]:
+        return [card for card in self.creatures(player) if not card.tapped]
+
+    def can_attack(self, card: Card) -> bool:
+        return not card.tapped and self.entered.get(id(card)) != self.game.turn_number
+
+    def lands_in_hand(self, player: Player) -> List[Card]:
+        if self.land_played_turn == self.game.turn_number:
+            return []
+        return [card for card in player.hand.cards if card.is_type("Land")]
+
+    def play_land(self, player: Player, card: Card) -> None:
+        self.game.play_land(player, card)
+        self.land_played_turn = self.game.turn_number
+
+    def mana_sources(self, player: Player) -> List[ActivatedAbility]:
+        return [
+            ability
+            for card in player.battlefield.cards
+            if not card.tapped
+            for ability in card.abilities
+            if isinstance(ability, ActivatedAbility)
+        ]
+
+    def available_mana(self, player: Player) -> int:
+        return len(self.mana_sources(player)) + sum(player.mana_pool.amounts.values())
+
+    def tap_lands(self, player: Player) -> None:
+        for ability in self.mana_sources(player):
+            if not ability.source.tapped:
+                ability.activate(self.game)
+        self.resolve_stack()
+
+    def spell_kind(self, card: Card) -> Optional[str]:
+        if card.is_type("Creature"):
+            return CREATURE_SPELL
+        if card.name == "Lightning Bolt":
+            return BOLT_SPELL
+        return None
+
+    def castable(self, player: Player) -> List[Card]:
+        return [card for card in player.hand.cards if self.spell_kind(card) is not None]
+
+    def can_pay(self, player: Player, card: Card) -> bool:
+        return player.mana_pool.payment(card.mana_cost, life=max(player.life - 1, 0)) is not None
+
+    def bolt_targets(self, player: Player) -> List[Card]:
+        return [card for card in self.creatures(self.opponent(player)) if self.lethal_damage(card) <= BOLT_DAMAGE]
+
+    def cast(self, player: Player, card: Card, target: Optional[Card] = None) -> None:
+        if self.spell_kind(card) == BOLT_SPELL:
+            if target is None:
+                raise ValueError("Lightning Bolt needs a target")
+            ability = make_lightning_bolt_spell(card, target)
+        else:
+            ability = make_creature_spell(card)
+            self.entered[id(card)] = self.game.turn_number
+        self.game.cast_spell(player, card, ability)
+        self.resolve_stack()
+
+    def attack(self, attackers: List[Card], defender: Player) -> None:
+        for attacker in attackers:
+            attacker.tapped = True
+        self.game.declare_attackers(attackers, defender)
+
+    def discard(self, player: Player, card: Card) -> None:
+        player.hand.remove(card)
+        player.graveyard.add(card)
+        self.game.zone_changed(card, "Hand", "Graveyard")
+
+    def resolve_stack(self) -> None:
+        while not self.game.stack.is_empty():
+            for _ in self.game.players:
+                self.game.pass_priority()
+
+    def pass_step(self) -> None:
+        # With an empty stack, everyone passing priority moves to the next step.
+        for _ in self.game.players:
+            self.game.pass_priority()
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from py_mage.cards.registry import configure_catalog
+from py_mage.core.game_state import GameState
+from py_mage.core.player import Player
+from py_mage.core.turn import Step
+from py_mage.decks import Deck, build_library, load_deck
+from py_mage.simulation.driver import MAX_HAND_SIZE, GameDriver
+from py_mage.simulation.policy import POLICIES, Policy
+
+
+DEFAULT_POLICY = "greedy"
+# Turns are counted per player, so this is 40 turns each.
+DEFAULT_MAX_TURNS = 80
+SIMULATION_CHUNKS_PER_JOB = 4
+
+
+@dataclass(frozen=True)
+class GameResult:
+    seed: int
+    # Index of the winning deck, or None for a draw or a game that hit the turn limit.
+    winner: Optional[int]
+    turns: int
+
+
+@dataclass
+class SimulationReport:
+    decks: List[str]
+    results: List[GameResult] = field(default_factory=list)
+    seconds: float = 0.0
+    unsupported: List[int] = field(default_factory=list)
+    deck_sizes: List[int] = field(default_factory=list)
+
+    @property
+    def games(self) -> int:
+        return len(self.results)
+
+    @property
+    def turns(self) -> int:
+        return sum(result.turns for result in self.results)
+
+    @property
+    def draws(self) -> int:
+        return sum(1 for result in self.results if result.winner is None)
+
+    def wins(self, deck: int) -> int:
+        return sum(1 for result in self.results if result.winner == deck)
+
+    def games_per_second(self) -> float:
+        return self.games / self.seconds if self.seconds > 0 else 0.0
+
+    def turns_per_second(self) -> float:
+        return self.turns / self.seconds if self.seconds > 0 else 0.0
+
+
+def play_game(
+    decks: Sequence[Deck], policy: str = DEFAULT_POLICY, seed: int = 0, max_turns: int = DEFAULT_MAX_TURNS
+) -> GameResult:
+    rng = random.Random(seed)
+    players = [Player(deck.name) for deck in decks]
+    game = GameState(players=players)
+    for player, deck in zip(players, decks):
+        library, _ = build_library(deck, player)
+        rng.shuffle(library)
+        player.library.extend(library)
+    policies: List[Policy] = [POLICIES[policy](rng) for _ in players]
+    driver = GameDriver(game)
+    game.active_player_index = rng.randrange(len(players))
+    game.start()
+    # The starting player skips the draw of the first turn.
+    game.turn_manager.current_index = game.turn_manager.steps.index(Step.MAIN1)
+    while True:
+        step = game.turn_manager.current_step()
+        if not game_over(game):
+            play_step(driver, policies, step)
+            game.check_state_based_actions()
+        winner = game_over(game)
+        if winner is not None:
+            return GameResult(seed, winner[0] if winner else None, game.turn_number)
+        if step == Step.CLEANUP:
+            if game.turn_number >= max_turns:
+                return GameResult(seed, None, game.turn_number)
+            game.pass_turn()
+        else:
+            driver.pass_step()
+
+
+def play_step(driver: GameDriver, policies: Sequence[Policy], step: Step) -> None:
+    game = driver.game
+    player = game.active_player()
+    policy = policies[game.active_player_index]
+    if step == Step.MAIN1:
+        policy.main_phase(driver, player)
+    elif step == Step.DECLARE_ATTACKERS:
+        defender = driver.opponent(player)
+        attackers = policy.attackers(driver, player, defender)
+        if attackers:
+            driver.attack(attackers, defender)
+    elif step == Step.DECLARE_BLOCKERS and game.combat.groups:
+        defender = game.combat.attackers[0][1]
+        blocks = policies[game.players.index(defender)].blockers(
+            driver, defender, [attacker for attacker, _ in game.combat.attackers]
+        )
+        game.declare_blockers(blocks)
+    elif step == Step.COMBAT_DAMAGE and game.combat.groups:
+        game.resolve_combat()
+    elif step == Step.CLEANUP:
+        excess = len(player.hand.cards) - MAX_HAND_SIZE
+        if excess > 0:
+            for card in policy.discards(driver, player, excess):
+                driver.discard(player, card)
+
+
+def game_over(game: GameState) -> Optional[List[int]]:
+    # None while two or more players remain; otherwise the surviving player
+    # indexes, which is empty when everyone lost at once.
+    alive = [index for index, player in enumerate(game.players) if not player.has_lost and player.life > 0]
+    return alive if len(alive) < 2 else None
+
+
+def play_games(
+    deck_paths: Sequence[Path],
+    seeds: Sequence[int],
+    policy: str = DEFAULT_POLICY,
+    max_turns: int = DEFAULT_MAX_TURNS,
+    deck_cache: Optional[Path] = None,
+    catalog: Optional[Path] = None,
+) -> List[GameResult]:
+    # Workers may be spawned rather than forked, so they cannot rely on the
+    # parent's registry and configure their own.
+    if catalog is not None:
+        configure_catalog(catalog)
+    decks = [load_deck(path, cache_dir=deck_cache) for path in deck_paths]
+    return [play_game(decks, policy=policy, seed=seed, max_turns=max_turns) for seed in seeds]
+
+
+def game_seeds(seed: int, games: int) -> List[int]:
+    # Game seeds depend only on the run seed and the game index, so results
+    # do not change with the number of workers.
+    rng = random.Random(seed)
+    return [rng.getrandbits(63) for _ in range(games)]
+
+
+def simulate(
+    deck_paths: Sequence[Path],
+    games: int,
+    seed: int = 0,
+    jobs: int = 1,
+    policy: str = DEFAULT_POLICY,
+    max_turns: int = DEFAULT_MAX_TURNS,
+    deck_cache: Optional[Path] = None,
+    catalog: Optional[Path] = None,
+) -> SimulationReport:
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy: {policy}")
+    if catalog is not None:
+        configure_catalog(catalog)
+    decks = [load_deck(path, cache_dir=deck_cache) for path in deck_paths]
+    report = SimulationReport(decks=[deck.name for deck in decks])
+    probe = Player("probe")
+    for deck in decks:
+        library, unsupported = build_library(deck, probe)
+        report.deck_sizes.append(len(library))
+        report.unsupported.append(unsupported)
+    seeds = game_seeds(seed, games)
+    run = partial(
+        play_games, list(deck_paths), policy=policy, max_turns=max_turns, deck_cache=deck_cache, catalog=catalog
+    )
+    started = time.perf_counter()
+    if jobs <= 1 or games < 2:
+        report.results = run(seeds)
+    else:
+        size = max(1, -(-games // (jobs * SIMULATION_CHUNKS_PER_JOB)))
+        chunks = [seeds[start:start + size] for start in range(0, games, size)]
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            report.results = [result for chunk in pool.map(run, chunks) for result in chunk]
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+def format_report(report: SimulationReport) -> List[str]:
+    lines = [
+        f"Games: {report.games} in {report.seconds:.2f}s "
+        f"({report.games_per_second():.1f} games/s, {report.turns_per_second():.1f} turns/s)"
+    ]
+    width = max([len(name) for name in report.decks] + [len("Draws")])
+    lines.append(f"{'Deck':<{width}}  {'Wins':>6}  {'Win rate':>8}  Unsupported")
+    for index, name in enumerate(report.decks):
+        wins = report.wins(index)
+        lines.append(
+            f"{name:<{width}}  {wins:>6}  {rate(wins, report.games):>8}  "
+            f"{report.unsupported[index]}/{report.deck_sizes[index]}"
+        )
+    lines.append(f"{'Draws':<{width}}  {report.draws:>6}  {rate(report.draws, report.games):>8}")
+    return lines
+
+
+def rate(count: int, total: int) -> str:
+    return f"{100.0 * count / total:.1f}%" if total else "-"
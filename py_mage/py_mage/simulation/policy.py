@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import random
+from typing import Dict, List, Tuple, Type
+
+from py_mage.core.card import Card
+from py_mage.core.player import Player
+from py_mage.simulation.driver import BOLT_SPELL, GameDriver
+
+
+Blocks = List[Tuple[Card, List[Card]]]
+
+
+class Policy:
+    # Makes every decision for one player. The base policy never acts, so a
+    # subclass only overrides the decisions it cares about.
+    name = "pass"
+
+    def __init__(self, rng: random.Random) -> None:
+        self.rng = rng
+
+    def main_phase(self, driver: GameDriver, player: Player) -> None:
+        return None
+
+    def attackers(self, driver: GameDriver, player: Player, defender: Player) -> List[Card]:
+        return []
+
+    def blockers(self, driver: GameDriver, player: Player, attackers: List[Card]) -> Blocks:
+        return []
+
+    def discards(self, driver: GameDriver, player: Player, count: int) -> List[Card]:
+        return sorted(player.hand.cards, key=lambda card: card.mana_cost.mana_value, reverse=True)[:count]
+
+
+class GreedyPolicy(Policy):
+    # Plays a land, spends all its mana on the most expensive spells first,
+    # attacks with creatures that no untapped blocker can eat, and blocks when
+    # the block wins, trades, or prevents lethal damage.
+    name = "greedy"
+
+    def main_phase(self, driver: GameDriver, player: Player) -> None:
+        lands = driver.lands_in_hand(player)
+        if lands:
+            driver.play_land(player, lands[0])
+        spells = sorted(driver.castable(player), key=lambda card: card.mana_cost.mana_value, reverse=True)
+        if not spells or spells[-1].mana_cost.mana_value > driver.available_mana(player):
+            return
+        driver.tap_lands(player)
+        for card in spells:
+            if not driver.can_pay(player, card):
+                continue
+            if driver.spell_kind(card) == BOLT_SPELL:
+                targets = driver.bolt_targets(player)
+                if targets:
+                    driver.cast(player, card, max(targets, key=driver.power))
+                continue
+            driver.cast(player, card)
+
+    def attackers(self, driver: GameDriver, player: Player, defender: Player) -> List[Card]:
+        blockers = driver.untapped_creatures(defender)
+        return [
+            card
+            for card in driver.creatures(player)
+            if driver.can_attack(card)
+            and not any(eats(driver, blocker, card) for blocker in blockers)
+        ]
+
+    def blockers(self, driver: GameDriver, player: Player, attackers: List[Card]) -> Blocks:
+        available = driver.untapped_creatures(player)
+        incoming = sum(driver.power(attacker) for attacker in attackers)
+        blocks: Blocks = []
+        for attacker in sorted(attackers, key=driver.power, reverse=True):
+            if not available:
+                break
+            power = driver.power(attacker)
+            choice = (
+                next((card for card in available if eats(driver, card, attacker)), None)
+                or next((card for card in available if driver.lethal_damage(card) > power), None)
+                or next((card for card in available if driver.power(card) >= driver.lethal_damage(attacker)), None)
+            )
+            if choice is None and incoming >= player.life:
+                choice = min(available, key=driver.power)
+            if choice is None:
+                continue
+            available.remove(choice)
+            blocks.append((attacker, [choice]))
+            incoming -= power
+        return blocks
+
+
+class RandomPolicy(Policy):
+    # Takes legal actions uniformly at random; a baseline for the other policies.
+    name = "random"
+
+    def main_phase(self, driver: GameDriver, player: Player) -> None:
+        lands = driver.lands_in_hand(player)
+        if lands:
+            driver.play_land(player, self.rng.choice(lands))
+        spells = driver.castable(player)
+        if not spells:
+            return
+        driver.tap_lands(player)
+        self.rng.shuffle(spells)
+        for card in spells:
+            if not driver.can_pay(player, card):
+                continue
+            if driver.spell_kind(card) == BOLT_SPELL:
+                targets = driver.bolt_targets(player)
+                if targets:
+                    driver.cast(player, card, self.rng.choice(targets))
+                continue
+            driver.cast(player, card)
+
+    def attackers(self, driver: GameDriver, player: Player, defender: Player) -> List[Card]:
+        return [card for card in driver.creatures(player) if driver.can_attack(card) and self.rng.random() < 0.5]
+
+    def blockers(self, driver: GameDriver, player: Player, attackers: List[Card]) -> Blocks:
+        chosen: Dict[int, List[Card]] = {}
+        for card in driver.untapped_creatures(player):
+            if self.rng.random() < 0.5:
+                attacker = self.rng.choice(attackers)
+                chosen.setdefault(id(attacker), []).append(card)
+        return [(attacker, chosen[id(attacker)]) for attacker in attackers if id(attacker) in chosen]
+
+
+def eats(driver: GameDriver, blocker: Card, attacker: Card) -> bool:
+    # The blocker kills the attacker and survives.
+    return driver.power(blocker) >= driver.lethal_damage(attacker) and driver.lethal_damage(blocker) > driver.power(
+        attacker
+    )
+
+
+POLICIES: Dict[str, Type[Policy]] = {
+    policy.name: policy for policy in (Policy, GreedyPolicy, RandomPolicy)
+}
@@ -0,0 +1,29 @@
+import pytest
+
+from py_mage.cards.basic import grizzly_bears_definition
+from py_mage.core.card import Card
+from py_mage.core.events import GameEvent
+from py_mage.core.player import Player
+from py_mage.core.stack import StackItem
+
+
+def test_cards_share_definition_characteristics_until_written():
+    player = Player("A")
+    definition = grizzly_bears_definition()
+    first = Card(definition, owner=player, controller=player)
+    second = Card(definition, owner=player, controller=player)
+    assert first.types is second.types is definition.types
+    first.add_type("Artifact")
+    first.add_subtype("Warrior")
+    assert first.types == ("Creature", "Artifact")
+    assert first.subtypes == ("Bear", "Warrior")
+    assert second.types is definition.types and second.subtypes is definition.subtypes
+
+
+def test_engine_objects_have_no_instance_dict():
+    player = Player("A")
+    card = Card(grizzly_bears_definition(), owner=player, controller=player)
+    for value in (card, player, StackItem(card, None, controller=player), GameEvent("cast", {})):
+        assert not hasattr(value, "__dict__")
+    with pytest.raises(AttributeError):
+        card.counters = 1
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from py_mage.cards.mage_import import CardRecord, write_sqlite
+from py_mage.cards.search import build_search_index, search_cards
+
+
+def record(name: str, set_code: str, types: list[str], subtypes: list[str], keywords: list[str]) -> CardRecord:
+    return CardRecord(
+        name=name,
+        set_code=set_code,
+        collector_number="1",
+        rarity="COMMON",
+        card_class=f"mage.cards.t.{name.replace(' ', '')}{set_code}",
+        mana_cost=None,
+        types=types,
+        supertypes=[],
+        subtypes=subtypes,
+        power=None,
+        toughness=None,
+        keywords=keywords,
+        mana_parse_ok=True,
+        types_parse_ok=True,
+        source_path="",
+    )
+
+
+RECORDS = [
+    record("Lightning Bolt", "LEA", ["INSTANT"], [], []),
+    record("Lightning Bolt", "M10", ["INSTANT"], [], []),
+    record("Lightning Dragon", "USG", ["CREATURE"], ["DRAGON"], ["FlyingAbility"]),
+    record("Chain Lightning", "LEG", ["SORCERY"], [], []),
+    record("Serra Angel", "LEA", ["CREATURE"], ["ANGEL"], ["FlyingAbility", "VigilanceAbility"]),
+    record("Bolt Bend", "WAR", ["INSTANT"], [], []),
+    record("Li_ght", "TST", ["INSTANT"], [], []),
+]
+
+
+@pytest.fixture(params=[True, False], ids=["fts5", "trigram"])
+def catalog(request: pytest.FixtureRequest, tmp_path: Path) -> Path:
+    path = tmp_path / "catalog.sqlite"
+    write_sqlite(path, RECORDS)
+    build_search_index(path, fts5=request.param)
+    return path
+
+
+def names(path: Path, query: str, limit: int = 20) -> list[str]:
+    return [hit.name for hit in search_cards(path, query, limit=limit)]
+
+
+def test_search_ranks_name_matches_first(catalog: Path) -> None:
+    assert names(catalog, "lightning") == ["Lightning Bolt", "Lightning Dragon", "Chain Lightning"]
+    assert names(catalog, "lightning bolt") == ["Lightning Bolt"]
+    assert names(catalog, "bolt") == ["Bolt Bend", "Lightning Bolt"]
+    assert names(catalog, "lightning", limit=1) == ["Lightning Bolt"]
+
+
+def test_search_matches_type_line_and_keywords(catalog: Path) -> None:
+    assert names(catalog, "flying") == ["Serra Angel", "Lightning Dragon"]
+    assert names(catalog, "creature dragon") == ["Lightning Dragon"]
+    assert [hit.type_line for hit in search_cards(catalog, "serra")] == ["Creature — Angel"]
+    assert names(catalog, "vigilanceability flying") == ["Serra Angel"]
+
+
+def test_short_queries_match_name_prefixes(catalog: Path) -> None:
+    assert names(catalog, "li") == ["Li_ght", "Lightning Bolt", "Lightning Dragon"]
+    assert names(catalog, "li_") == ["Li_ght"]
+    assert names(catalog, "bolt b") == ["Bolt Bend", "Lightning Bolt"]
+    assert names(catalog, "bolt xy") == []
+    assert names(catalog, "zzz") == []
+    assert names(catalog, "  ") == []
+
+
+def test_search_index_has_one_document_per_name(catalog: Path) -> None:
+    conn = sqlite3.connect(catalog)
+    assert conn.execute("SELECT COUNT(*) FROM card_search_docs").fetchone() == (6,)
+    conn.close()
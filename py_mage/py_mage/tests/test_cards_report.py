@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import sqlite3
 import subprocess
 import sys
 from pathlib import Path
 
-from py_mage.cards.mage_import import import_mage_cards
+from py_mage.cards.mage_import import (
+    compute_metrics,
+    import_mage_cards,
+    load_metrics_from_sqlite,
+    validate_catalog,
+)
 
 
 def run_report(catalog: Path, out_path: Path) -> None:
@@ -47,3 +53,41 @@ def test_metrics_split(tmp_path: Path) -> None:
     assert "## Parse/Schema Stats" in data
     magic_section = data.split("## Magic Keywords", 1)[1].split("## MAGE Ability/Effect Types", 1)[0]
     assert "SimpleActivatedAbility" not in magic_section
+
+
+def test_import_metrics_match_catalog(tmp_path: Path) -> None:
+    mage_root = Path(__file__).resolve().parents[3]
+    catalog = tmp_path / "catalog.sqlite"
+    metrics, keyword_counts = import_mage_cards(mage_root, catalog)
+    loaded, loaded_keyword_counts, _ = load_metrics_from_sqlite(catalog)
+    assert keyword_counts == loaded_keyword_counts
+    assert metrics["unique_card_classes"] == loaded["unique_card_classes"]
+    assert metrics["reprint_hits"] == loaded["reprint_hits"]
+    assert metrics["unique_card_classes"] + metrics["reprint_hits"] == metrics["total_cards"]
+    assert metrics["reprint_hits"] > 0
+
+
+def test_catalog_meta_caches_metrics(tmp_path: Path) -> None:
+    mage_root = Path(__file__).resolve().parents[3]
+    catalog = tmp_path / "catalog.sqlite"
+    import_mage_cards(mage_root, catalog)
+    conn = sqlite3.connect(catalog)
+    try:
+        keys = {row[0] for row in conn.execute("SELECT key FROM catalog_meta")}
+        computed = compute_metrics(conn)
+    finally:
+        conn.close()
+    assert {"registry", "metrics", "keyword_counts", "set_counts"} <= keys
+    assert load_metrics_from_sqlite(catalog) == computed
+
+    ok, _ = validate_catalog(catalog, strict=True)
+    assert ok
+    conn = sqlite3.connect(catalog)
+    try:
+        conn.execute("DELETE FROM cards WHERE set_code = 'LEA'")
+        conn.commit()
+    finally:
+        conn.close()
+    ok, messages = validate_catalog(catalog, strict=True)
+    assert not ok
+    assert any(message.startswith("Catalog metadata is stale") for message in messages)
@@ -0,0 +1,45 @@
+from py_mage.core.invariants import check_invariants
+from py_mage.validation.bench import bench_clone, build_board
+from py_mage.validation.state import serialize_game_state
+
+
+def test_clone_matches_original_and_shares_definitions():
+    game = build_board(40)
+    fork = game.clone()
+    assert serialize_game_state(fork) == serialize_game_state(game)
+    for original, copy in zip(game.players[0].battlefield.cards, fork.players[0].battlefield.cards):
+        assert copy is not original
+        assert copy.definition is original.definition
+        assert copy.types is original.types
+        assert copy.controller is fork.players[0]
+        assert all(ability.source is copy for ability in copy.abilities)
+    check_invariants(fork)
+
+
+def test_clone_is_independent_of_original():
+    game = build_board(40)
+    fork = game.clone()
+    forest = fork.players[0].battlefield.cards[2]
+    ability = forest.abilities[0]
+    ability.activate(fork)
+    fork.pass_priority()
+    fork.pass_priority()
+    assert forest.tapped and fork.players[0].mana_pool.amounts == {"G": 1}
+    assert not game.players[0].battlefield.cards[2].tapped
+    assert game.players[0].mana_pool.amounts == {}
+
+    fork.pass_priority()
+    fork.pass_priority()
+    assert fork.stack.is_empty() and len(game.stack.items) == 1
+    assert len(fork.players[0].battlefield.cards) == 21
+    assert len(game.players[0].battlefield.cards) == 20
+    fork.event_bus.subscribe("resolved", lambda state, event: [])
+    assert not game.event_bus.has_subscribers("resolved")
+    check_invariants(fork)
+    check_invariants(game)
+
+
+def test_bench_clone_reports_fork_cost():
+    result = bench_clone(permanents=20, forks=10)
+    assert result["permanents"] == 20
+    assert result["clone_us"] > 0 and result["deepcopy_us"] > 0
@@ -0,0 +1,103 @@
+import pytest
+
+from py_mage.core.abilities import DOUBLE_STRIKE, FIRST_STRIKE, TRAMPLE, KeywordAbility
+from py_mage.core.card import Card, CardDefinition
+from py_mage.core.game_state import GameState
+from py_mage.core.mana import ManaCost
+from py_mage.core.player import Player
+
+
+def creature(player, power, toughness, *keywords):
+    definition = CardDefinition(
+        name=f"{power}/{toughness}", mana_cost=ManaCost(), types=("Creature",), power=power, toughness=toughness
+    )
+    card = Card(definition, owner=player, controller=player)
+    for keyword in keywords:
+        card.add_ability(KeywordAbility(keyword, card))
+    player.battlefield.add(card)
+    return card
+
+
+def duel():
+    attacker, defender = Player("A"), Player("B")
+    return GameState(players=[attacker, defender]), attacker, defender
+
+
+def fight(game, attacker, blockers):
+    game.declare_attackers([attacker], game.players[1])
+    if blockers is not None:
+        game.declare_blockers([(attacker, blockers)])
+    results = game.resolve_combat()
+    return results + game.check_state_based_actions()
+
+
+def test_attacker_assigns_lethal_damage_to_blockers_in_order():
+    game, a, b = duel()
+    attacker = creature(a, 5, 5)
+    first, second = creature(b, 2, 3), creature(b, 2, 3)
+    assert fight(game, attacker, [first, second]) == ["2/3 died"]
+    assert (first.damage, second.damage, attacker.damage) == (3, 2, 4)
+    assert second in b.battlefield and b.life == 20
+    assert not game.combat.groups
+
+
+def test_trample_assigns_excess_damage_to_the_defender():
+    game, a, b = duel()
+    attacker = creature(a, 6, 6, TRAMPLE)
+    blocker = creature(b, 1, 2)
+    fight(game, attacker, [blocker])
+    assert (blocker.damage, b.life) == (2, 16)
+
+
+def test_first_strike_kills_blockers_before_they_deal_damage():
+    game, a, b = duel()
+    attacker = creature(a, 3, 3, FIRST_STRIKE, TRAMPLE)
+    blocker = creature(b, 5, 1)
+    assert fight(game, attacker, [blocker]) == ["5/1 died"]
+    assert (attacker.damage, b.life) == (0, 18)
+
+
+def test_double_strike_deals_damage_in_both_steps():
+    game, a, b = duel()
+    attacker = creature(a, 2, 2, DOUBLE_STRIKE)
+    fight(game, attacker, None)
+    assert b.life == 16
+
+    blocked = creature(a, 2, 2, DOUBLE_STRIKE, TRAMPLE)
+    blocker = creature(b, 0, 4)
+    game.declare_attackers([blocked], b)
+    game.declare_blockers([(blocked, [blocker])])
+    game.resolve_combat()
+    assert (blocker.damage, b.life) == (4, 16)
+
+
+def test_blocked_attacker_without_trample_deals_no_damage_once_blockers_are_gone():
+    game, a, b = duel()
+    attacker = creature(a, 4, 4)
+    blocker = creature(b, 1, 1)
+    game.declare_attackers([attacker], b)
+    game.declare_blockers([(attacker, [blocker])])
+    b.battlefield.remove(blocker)
+    game.resolve_combat()
+    assert (attacker.damage, b.life) == (0, 20)
+
+
+def test_blocking_requires_a_declared_attacker():
+    game, a, b = duel()
+    attacker, blocker = creature(a, 1, 1), creature(b, 1, 1)
+    with pytest.raises(ValueError):
+        game.declare_blockers([(attacker, [blocker])])
+
+
+def test_swarm_combat_resolves_every_pair():
+    game, a, b = duel()
+    attackers = [creature(a, 1, 1) for _ in range(500)]
+    blockers = [creature(b, 1, 2) for _ in range(250)]
+    game.declare_attackers(attackers, b)
+    game.declare_blockers(list(zip(attackers, [[blocker] for blocker in blockers])))
+    fork = game.clone()
+    game.resolve_combat()
+    assert b.life == 20 - 250
+    assert all(blocker.damage == 1 for blocker in blockers)
+    assert all(attacker.damage == 1 for attacker in attackers[:250])
+    assert len(fork.combat.groups) == 500 and len(fork.combat.blocks) == 250
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+import py_mage.decks as decks
+from py_mage.cards.compiled import compile_catalog
+from py_mage.cards.mage_import import write_sqlite
+from py_mage.cards.registry import configure_catalog, default_catalog_path
+from py_mage.core.player import Player
+from py_mage.decks import build_library, load_deck
+from py_mage.tests.test_registry import record
+
+
+SAMPLE_DECKS = Path(__file__).resolve().parents[3] / "Mage.Client" / "release" / "sample-decks"
+DECK = "NAME:Giants\n// Creatures\n3 [TST:7] Hill Gaint\n2 [TST:99] Grizzly Bears\nSB: 1 [TST:8] Tundra\n"
+
+
+@pytest.fixture
+def catalog(tmp_path: Path):
+    path = tmp_path / "catalog.sqlite"
+    write_sqlite(
+        path,
+        [
+            record("Hill Giant", ["CREATURE"], [], collector_number="7", mana_cost="{3}{R}", power=3, toughness=3),
+            record("Tundra", ["LAND"], ["BlueManaAbility", "WhiteManaAbility"], collector_number="8"),
+        ],
+    )
+    configure_catalog(path)
+    yield path
+    configure_catalog(default_catalog_path())
+
+
+def test_catalog_indexes_printings(catalog: Path) -> None:
+    conn = sqlite3.connect(catalog)
+    try:
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT name FROM cards WHERE set_code = 'TST' AND collector_number = '7'"
+        ).fetchall()
+    finally:
+        conn.close()
+    assert "idx_cards_printing" in str(plan)
+
+
+def test_printings_resolve_against_the_catalog(catalog: Path, tmp_path: Path) -> None:
+    path = tmp_path / "giants.dck"
+    path.write_text(DECK, encoding="utf-8")
+    deck = load_deck(path)
+    assert deck.name == "Giants"
+    assert [(entry.count, entry.name) for entry in deck.main] == [(3, "Hill Giant"), (2, "Grizzly Bears")]
+    assert [entry.name for entry in deck.sideboard] == ["Tundra"]
+    library, unsupported = build_library(deck, Player("A"))
+    assert [card.name for card in library] == ["Hill Giant"] * 3 + ["Grizzly Bears"] * 2
+    assert unsupported == 0
+
+
+def test_compiled_catalog_reads_printings_from_its_sqlite_catalog(catalog: Path, tmp_path: Path) -> None:
+    compiled = catalog.with_suffix(".cards")
+    compile_catalog(catalog, compiled)
+    configure_catalog(compiled)
+    path = tmp_path / "giants.dck"
+    path.write_text(DECK, encoding="utf-8")
+    assert load_deck(path).main[0].name == "Hill Giant"
+
+
+def test_parsed_decks_are_cached_by_content(catalog: Path, tmp_path: Path, monkeypatch) -> None:
+    cache = tmp_path / "cache"
+    path = tmp_path / "giants.dck"
+    path.write_text(DECK, encoding="utf-8")
+    deck = load_deck(path, cache_dir=cache)
+    assert len(list(cache.glob("*.json"))) == 1
+
+    def fail(set_code: str, collector_number: str) -> None:
+        raise AssertionError("cached decks are not resolved again")
+
+    monkeypatch.setattr(decks, "printing_name", fail)
+    assert load_deck(path, cache_dir=cache) == deck
+
+    path.write_text(DECK.replace("3 [TST:7]", "4 [TST:7]"), encoding="utf-8")
+    monkeypatch.undo()
+    assert load_deck(path, cache_dir=cache).main[0].count == 4
+    assert len(list(cache.glob("*.json"))) == 2
+
+
+@pytest.mark.skipif(not SAMPLE_DECKS.exists(), reason="MAGE sample decks not available")
+def test_sample_decks_parse() -> None:
+    paths = sorted(SAMPLE_DECKS.rglob("*.dck"))
+    parsed = [load_deck(path) for path in paths]
+    assert len(parsed) > 1000
+    assert all(entry.set_code for deck in parsed for entry in deck.main)
+    assert sum(deck.size() for deck in parsed) > 60 * 1000
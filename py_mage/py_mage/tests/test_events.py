@@ -0,0 +1,88 @@
+from py_mage.cards.basic import grizzly_bears_definition, lightning_bolt_definition, make_lightning_bolt_spell
+from py_mage.core.card import Card
+from py_mage.core.events import NO_ABILITIES, EventBus
+from py_mage.core.game_state import GameState
+from py_mage.core.player import Player
+from py_mage.validation.bench import build_board
+
+
+def recorder(calls, label):
+    def handler(state, event):
+        calls.append((label, event.payload.get("zone_to")))
+        return []
+
+    return handler
+
+
+def test_filtered_handlers_only_see_matching_events():
+    game = build_board(4)
+    bears, other = game.players[0].battlefield.cards[-2:]
+    calls = []
+    bus = game.event_bus
+    bus.subscribe("zone_change", recorder(calls, "any"))
+    bus.subscribe("zone_change", recorder(calls, "bears"), source=bears)
+    bus.subscribe("zone_change", recorder(calls, "opponent"), controller=game.players[1])
+    bus.subscribe("zone_change", recorder(calls, "dies"), source=bears, zone_to="Graveyard")
+
+    game.zone_changed(bears, "Battlefield", "Exile")
+    game.zone_changed(other, "Battlefield", "Graveyard")
+    game.zone_changed(bears, "Battlefield", "Graveyard")
+    assert calls == [
+        ("any", "Exile"),
+        ("bears", "Exile"),
+        ("any", "Graveyard"),
+        ("any", "Graveyard"),
+        ("bears", "Graveyard"),
+        ("dies", "Graveyard"),
+    ]
+
+
+def test_unsubscribe_drops_empty_channels():
+    bus = EventBus()
+    assert bus.emit(None, "resolved") is NO_ABILITIES
+    first = bus.subscribe("resolved", lambda state, event: ["a"], zone_to="Stack")
+    second = bus.subscribe("resolved", lambda state, event: ["b"])
+    assert bus.emit(None, "resolved", zone_to="Stack") == ["a", "b"]
+    bus.unsubscribe(first)
+    assert bus.emit(None, "resolved", zone_to="Stack") == ["b"]
+    bus.unsubscribe(second)
+    assert not bus.has_subscribers("resolved")
+
+
+def test_zone_change_events_follow_a_spell_and_a_death():
+    player = Player("A")
+    opponent = Player("B")
+    bears = Card(grizzly_bears_definition(), owner=opponent, controller=opponent)
+    bolt = Card(lightning_bolt_definition(), owner=player, controller=player)
+    opponent.battlefield.add(bears)
+    player.hand.add(bolt)
+    player.mana_pool.add("R", 1)
+    game = GameState(players=[player, opponent])
+    calls = []
+
+    def record(state, event):
+        calls.append((event.payload["source"].name, event.payload["zone_from"], event.payload["zone_to"]))
+        return []
+
+    game.event_bus.subscribe("zone_change", record)
+    game.cast_spell(player, bolt, make_lightning_bolt_spell(bolt, bears))
+    game.pass_priority()
+    game.pass_priority()
+    game.check_state_based_actions()
+    assert calls == [
+        ("Lightning Bolt", "Hand", "Stack"),
+        ("Lightning Bolt", "Stack", "Graveyard"),
+        ("Grizzly Bears", "Battlefield", "Graveyard"),
+    ]
+
+
+def test_copied_bus_is_independent_and_remaps_filters():
+    game = build_board(4)
+    calls = []
+    source = game.players[0].battlefield.cards[-1]
+    game.event_bus.subscribe("zone_change", recorder(calls, "source"), source=source)
+    fork = game.clone()
+    fork.event_bus.subscribe("zone_change", recorder(calls, "fork"))
+    fork.zone_changed(fork.players[0].battlefield.cards[-1], "Battlefield", "Exile")
+    game.zone_changed(source, "Battlefield", "Exile")
+    assert calls == [("source", "Exile"), ("fork", "Exile"), ("source", "Exile")]
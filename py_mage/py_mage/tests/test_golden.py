@@ -1,54 +1,47 @@
 from __future__ import annotations
 
 import json
+import shutil
 import subprocess
 import sys
 from pathlib import Path
 
+import pytest
 
-GOLDEN_DIR = Path(__file__).parent / "golden"
-
+from py_mage.validation.runner import find_scenarios, replay_batch, replay_scenario
 
-def run_replay(scenario: str, tmp_path: Path) -> tuple[str, dict]:
-    scenario_dir = GOLDEN_DIR / scenario
-    input_path = scenario_dir / "input.json"
-    out_state = tmp_path / f"{scenario}_state.json"
-    out_log = tmp_path / f"{scenario}_log.txt"
-    subprocess.run(
-        [
-            sys.executable,
-            "-m",
-            "py_mage",
-            "validate",
-            "replay",
-            str(input_path),
-            "--out",
-            str(out_state),
-            "--log",
-            str(out_log),
-            "--assert-invariants",
-        ],
-        check=True,
-    )
-    return out_log.read_text(encoding="utf-8"), json.loads(out_state.read_text(encoding="utf-8"))
 
+GOLDEN_DIR = Path(__file__).parent / "golden"
 
-def assert_golden(scenario: str, tmp_path: Path) -> None:
-    scenario_dir = GOLDEN_DIR / scenario
-    expected_log = (scenario_dir / "expected_log.txt").read_text(encoding="utf-8")
-    expected_state = json.loads((scenario_dir / "expected_state.json").read_text(encoding="utf-8"))
-    actual_log, actual_state = run_replay(scenario, tmp_path)
-    assert actual_log == expected_log
-    assert actual_state == expected_state
 
+@pytest.mark.parametrize("scenario", find_scenarios(GOLDEN_DIR), ids=lambda path: path.name)
+def test_golden_scenario(scenario: Path) -> None:
+    result = replay_scenario(scenario)
+    assert result.passed, result.mismatches
 
-def test_cast_spell_simple(tmp_path: Path) -> None:
-    assert_golden("cast_spell_simple", tmp_path)
 
+def test_replay_batch_reports_mismatches(tmp_path: Path) -> None:
+    for scenario in find_scenarios(GOLDEN_DIR):
+        shutil.copytree(scenario, tmp_path / scenario.name)
+    state_path = tmp_path / "combat_simple" / "expected_state.json"
+    state = json.loads(state_path.read_text(encoding="utf-8"))
+    state["players"][1]["life"] = 7
+    state_path.write_text(json.dumps(state), encoding="utf-8")
+    (tmp_path / "mana_payment" / "expected_log.txt").write_text("nothing happened\n", encoding="utf-8")
 
-def test_mana_payment(tmp_path: Path) -> None:
-    assert_golden("mana_payment", tmp_path)
+    results = {result.scenario.name: result.mismatches for result in replay_batch(tmp_path, jobs=2)}
+    assert results == {
+        "cast_spell_simple": [],
+        "combat_simple": ["state differs at $.players[1].life"],
+        "mana_payment": ["log differs"],
+    }
 
 
-def test_combat_simple(tmp_path: Path) -> None:
-    assert_golden("combat_simple", tmp_path)
+def test_replay_batch_cli() -> None:
+    completed = subprocess.run(
+        [sys.executable, "-m", "py_mage", "validate", "replay-batch", str(GOLDEN_DIR)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    assert completed.stdout.strip() == "3/3 scenarios passed"
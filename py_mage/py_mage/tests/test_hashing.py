@@ -0,0 +1,88 @@
+from py_mage.cards.registry import get_definition
+from py_mage.core.card import Card
+from py_mage.core.game_state import GameState
+from py_mage.core.mana import ManaCost
+from py_mage.core.player import Player
+from py_mage.core.turn import Step
+from py_mage.decks import parse_deck
+from py_mage.simulation import engine
+
+
+def card(player, name):
+    return Card(get_definition(name), owner=player, controller=player)
+
+
+def board():
+    a, b = Player("A"), Player("B")
+    game = GameState(players=[a, b])
+    for player in (a, b):
+        player.library.extend(card(player, "Forest") for _ in range(5))
+        player.hand.add(card(player, "Grizzly Bears"))
+        player.battlefield.extend(card(player, "Forest") for _ in range(2))
+    return game
+
+
+def test_equal_states_hash_equal():
+    assert board().state_hash() == board().state_hash()
+    game = board()
+    before = game.state_hash()
+    game.players[0].hand.add(card(game.players[0], "Forest"))
+    with_one = game.state_hash()
+    game.players[0].hand.add(card(game.players[0], "Forest"))
+    assert len({before, with_one, game.state_hash()}) == 3
+
+
+def test_changes_update_the_hash_and_undoing_them_restores_it():
+    game = board()
+    a = game.players[0]
+    before = game.state_hash()
+    land = a.battlefield.cards[0]
+    for change, undo in (
+        (lambda: setattr(land, "tapped", True), lambda: setattr(land, "tapped", False)),
+        (lambda: setattr(land, "damage", 2), lambda: setattr(land, "damage", 0)),
+        (lambda: setattr(a, "life", 17), lambda: setattr(a, "life", 20)),
+        (lambda: a.mana_pool.add("G", 2), lambda: a.mana_pool.pay(ManaCost.from_string("{G}{G}"))),
+        (lambda: a.hand.add(a.library.pop()), lambda: a.library.add(a.hand.pop())),
+    ):
+        change()
+        assert game.state_hash() != before
+        undo()
+        assert game.state_hash() == before
+
+
+def test_hash_depends_on_seats_and_survives_clone():
+    game = board()
+    game.players[1].life = 3
+    swapped = board()
+    swapped.players[0].life = 3
+    assert game.state_hash() != swapped.state_hash()
+    assert game.clone().state_hash() == game.state_hash()
+
+
+def test_permanent_table_untap_keeps_the_hash_current():
+    game = board()
+    game.use_permanent_table()
+    game.state_hash()
+    for land in game.players[0].battlefield.cards:
+        land.tapped = True
+    game.players[0].battlefield.cards[0].damage = 1
+    game.turn_manager.current_index = game.turn_manager.steps.index(Step.CLEANUP)
+    game.advance_step()
+    assert not any(land.tapped for land in game.players[0].battlefield.cards)
+    assert game.state_hash() == game.clone().state_hash()
+
+
+def test_incremental_hash_matches_a_fresh_hash_through_a_game(monkeypatch):
+    play_step = engine.play_step
+    checked = []
+
+    def checked_step(driver, policies, step):
+        play_step(driver, policies, step)
+        game = driver.game
+        assert game.state_hash() == game.clone().state_hash()
+        checked.append(step)
+
+    monkeypatch.setattr(engine, "play_step", checked_step)
+    deck = parse_deck("NAME:Bears\n9 Forest\n6 Mountain\n10 Grizzly Bears\n5 Lightning Bolt\n")
+    result = engine.play_game([deck, deck], seed=4)
+    assert result.turns > 5 and len(checked) > 50
@@ -7,7 +7,16 @@ from pathlib import Path
 import subprocess
 import sys
 
-from py_mage.cards.mage_import import import_mage_cards
+from py_mage.cards import mage_import
+from py_mage.cards.mage_import import (
+    WRITE_BATCH_SIZE,
+    CardRecord,
+    import_mage_cards,
+    parse_card_source,
+    parse_card_source_reference,
+    update_sqlite,
+    write_sqlite,
+)
 
 
 EXPECTED_CARD_COUNT = 87360
@@ -71,3 +80,178 @@ def test_cards_validate_smoke(tmp_path: Path) -> None:
         check=False,
     )
     assert result.returncode == 0
+
+
+def test_parallel_import_matches_serial(tmp_path: Path) -> None:
+    mage_root = Path(__file__).resolve().parents[3]
+    serial = tmp_path / "serial.sqlite"
+    parallel = tmp_path / "parallel.sqlite"
+    serial_metrics, serial_keywords = import_mage_cards(mage_root, serial)
+    parallel_metrics, parallel_keywords = import_mage_cards(mage_root, parallel, jobs=2)
+    assert serial_metrics == parallel_metrics
+    assert serial_keywords == parallel_keywords
+    assert serial.read_bytes() == parallel.read_bytes()
+
+
+def write_set_file(mage_root: Path, name: str, code: str, cards: list[tuple[str, int, str]]) -> Path:
+    set_dir = mage_root / "Mage.Sets" / "src" / "mage" / "sets"
+    set_dir.mkdir(parents=True, exist_ok=True)
+    lines = [f'        super("{name}", "{code}", ExpansionSet.buildDate(2020, 1, 1), SetType.EXPANSION);']
+    for card_name, number, card_class in cards:
+        lines.append(
+            f'        cards.add(new SetCardInfo("{card_name}", {number}, Rarity.COMMON, mage.cards.{card_class}.class));'
+        )
+    path = set_dir / f"{name}.java"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def copy_card_class(mage_root: Path, card_class: str) -> Path:
+    relative = Path("Mage.Sets/src/mage/cards") / (card_class.replace(".", "/") + ".java")
+    source = Path(__file__).resolve().parents[3] / relative
+    target = mage_root / relative
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(source.read_text(encoding="utf-8"), encoding="utf-8")
+    return target
+
+
+def read_rows(db_path: Path) -> list[tuple]:
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(
+            "SELECT name, set_code, collector_number, rarity, card_class, mana_cost, types, supertypes, "
+            "subtypes, power, toughness, keywords, mana_parse_ok, types_parse_ok, source_path "
+            "FROM cards ORDER BY name, set_code, collector_number"
+        ).fetchall()
+    finally:
+        conn.close()
+
+
+def read_class_tables(db_path: Path) -> dict[str, list[tuple]]:
+    conn = sqlite3.connect(db_path)
+    try:
+        return {
+            table: conn.execute(f"SELECT * FROM {table} ORDER BY 1, 2").fetchall()
+            for table in ("card_classes", "card_types", "card_subtypes", "card_keywords")
+        }
+    finally:
+        conn.close()
+
+
+def read_source_files(db_path: Path) -> list[tuple]:
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT path, kind, mtime, size, sha256 FROM source_files ORDER BY path").fetchall()
+    finally:
+        conn.close()
+
+
+def test_incremental_import_matches_full_rebuild(tmp_path: Path, monkeypatch) -> None:
+    mage_root = tmp_path / "mage"
+    for card_class in ("g.GrizzlyBears", "l.LightningBolt", "h.HillGiant", "g.GiantGrowth"):
+        copy_card_class(mage_root, card_class)
+    mammoth = copy_card_class(mage_root, "w.WarMammoth")
+    write_set_file(
+        mage_root,
+        "Alpha",
+        "LEA",
+        [("Grizzly Bears", 1, "g.GrizzlyBears"), ("Lightning Bolt", 2, "l.LightningBolt")],
+    )
+    beta = write_set_file(
+        mage_root,
+        "Beta",
+        "LEB",
+        [
+            ("Grizzly Bears", 1, "g.GrizzlyBears"),
+            ("Hill Giant", 2, "h.HillGiant"),
+            ("War Mammoth", 3, "w.WarMammoth"),
+        ],
+    )
+    write_set_file(mage_root, "Gamma", "GAM", [("Hill Giant", 1, "h.HillGiant")])
+    catalog = tmp_path / "catalog.sqlite"
+    import_mage_cards(mage_root, catalog)
+
+    bears = mage_root / "Mage.Sets/src/mage/cards/g/GrizzlyBears.java"
+    bears.write_text(
+        bears.read_text(encoding="utf-8").replace("new MageInt(2)", "new MageInt(3)"),
+        encoding="utf-8",
+    )
+    beta.unlink()
+    # Beta held the last War Mammoth, so its class file goes with it.
+    mammoth.unlink()
+    write_set_file(
+        mage_root,
+        "Delta",
+        "DEL",
+        [("Giant Growth", 1, "g.GiantGrowth"), ("Grizzly Bears", 2, "g.GrizzlyBears")],
+    )
+    stats = update_sqlite(mage_root, catalog)
+    assert stats == {"sets_changed": 1, "sets_removed": 1, "classes_changed": 1, "cards_inserted": 2}
+
+    rebuilt = tmp_path / "rebuilt.sqlite"
+    import_mage_cards(mage_root, rebuilt)
+    assert read_rows(catalog) == read_rows(rebuilt)
+    assert read_class_tables(catalog) == read_class_tables(rebuilt)
+    assert read_source_files(catalog) == read_source_files(rebuilt)
+    assert update_sqlite(mage_root, catalog) == {
+        "sets_changed": 0,
+        "sets_removed": 0,
+        "classes_changed": 0,
+        "cards_inserted": 0,
+    }
+
+    expected = import_mage_cards(mage_root, catalog, incremental=True)
+
+    def fail_rebuild(path: Path) -> None:
+        raise AssertionError(f"{path} was rebuilt without changes")
+
+    monkeypatch.setattr(mage_import, "build_search_index", fail_rebuild)
+    monkeypatch.setattr(mage_import, "refresh_catalog_meta", fail_rebuild)
+    assert import_mage_cards(mage_root, catalog, incremental=True) == expected
+
+
+def test_single_pass_parser_matches_reference() -> None:
+    card_dir = Path(__file__).resolve().parents[3] / "Mage.Sets" / "src" / "mage" / "cards"
+    paths = sorted(card_dir.rglob("*.java"))
+    assert paths
+    for path in paths:
+        content = path.read_text(encoding="utf-8", errors="ignore")
+        assert parse_card_source(content) == parse_card_source_reference(content), path
+
+
+def test_write_sqlite_streams_records_in_batches(tmp_path: Path) -> None:
+    consumed = []
+
+    def records():
+        for index in range(WRITE_BATCH_SIZE * 2 + 1):
+            consumed.append(index)
+            yield CardRecord(
+                name=f"Card {index}",
+                set_code="TST",
+                collector_number=str(index),
+                rarity="COMMON",
+                card_class="mage.cards.t.Test",
+                mana_cost="{1}",
+                types=("CREATURE",),
+                supertypes=(),
+                subtypes=("BEAR",),
+                power=2,
+                toughness=2,
+                keywords=(),
+                mana_parse_ok=True,
+                types_parse_ok=True,
+                source_path="",
+            )
+
+    out = tmp_path / "catalog.sqlite"
+    write_sqlite(out, records())
+    assert len(consumed) == WRITE_BATCH_SIZE * 2 + 1
+    assert count_cards(out) == WRITE_BATCH_SIZE * 2 + 1
+    conn = sqlite3.connect(out)
+    try:
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+        types_json = conn.execute("SELECT DISTINCT types FROM cards").fetchall()
+    finally:
+        conn.close()
+    assert {"idx_cards_name", "idx_cards_card_class", "idx_cards_set_path"} <= indexes
+    assert types_json == [('["CREATURE"]',)]
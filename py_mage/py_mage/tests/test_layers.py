@@ -0,0 +1,128 @@
+from py_mage.cards.basic import forest_definition, grizzly_bears_definition
+from py_mage.core.card import Card
+from py_mage.core.layers import ContinuousEffect, ContinuousEffects, Layer
+from py_mage.validation.bench import build_board
+
+
+def anthem(timestamp, power=1, toughness=1, controller=None):
+    def applies_to(state, card, characteristics):
+        if controller is not None and characteristics.controller is not controller:
+            return False
+        return characteristics.is_type("Creature")
+
+    def modify(state, card, characteristics):
+        characteristics.power += power
+        characteristics.toughness += toughness
+
+    return ContinuousEffect(Layer.POWER_TOUGHNESS, None, timestamp, "anthem", modify=modify, applies_to=applies_to)
+
+
+def add_subtype(timestamp, subtype, to=None, provides=(), depends_on=()):
+    def modify(state, card, characteristics):
+        if to is None or to in characteristics.subtypes:
+            characteristics.subtypes = (*characteristics.subtypes, subtype)
+
+    return ContinuousEffect(
+        Layer.TYPE,
+        None,
+        timestamp,
+        subtype,
+        modify=modify,
+        provides=frozenset(provides),
+        depends_on=frozenset(depends_on),
+    )
+
+
+def test_effects_apply_in_layer_then_timestamp_order():
+    effects = ContinuousEffects()
+    applied = []
+    for layer, timestamp in [(Layer.POWER_TOUGHNESS, 1), (Layer.TYPE, 3), (Layer.TYPE, 2), (Layer.CONTROL, 9)]:
+        effects.add(ContinuousEffect(layer, lambda state, key=(layer, timestamp): applied.append(key), timestamp))
+    effects.apply(None)
+    assert applied == [(Layer.CONTROL, 9), (Layer.TYPE, 2), (Layer.TYPE, 3), (Layer.POWER_TOUGHNESS, 1)]
+
+
+def test_characteristics_are_cached_until_effects_or_base_change():
+    game = build_board(8)
+    bears = game.players[0].battlefield.cards[-1]
+    first = anthem(1)
+    game.continuous_effects.add(first)
+    computed = game.characteristics(bears)
+    assert (computed.power, computed.toughness) == (3, 3)
+    assert game.characteristics(bears) is computed
+
+    game.continuous_effects.add(anthem(2, controller=game.players[1]))
+    assert game.characteristics(bears).power == 3
+    game.continuous_effects.add(anthem(3, power=2, toughness=0))
+    assert game.characteristics(bears).power == 5
+    bears.power = 0
+    assert game.characteristics(bears).power == 3
+    game.continuous_effects.remove(first)
+    assert (game.characteristics(bears).power, game.characteristics(bears).toughness) == (2, 2)
+    assert bears.toughness == 2
+
+
+def test_dependent_effect_waits_for_the_effect_it_reads():
+    game = build_board(0)
+    player = game.players[0]
+    land = Card(forest_definition(), owner=player, controller=player)
+    land.subtypes = ()
+    elves = add_subtype(1, "Elf", to="Forest", depends_on={"Forest"})
+    forests = add_subtype(2, "Forest", provides={"Forest"})
+    game.continuous_effects.add(elves)
+    game.continuous_effects.add(forests)
+    assert game.continuous_effects.effects == [forests, elves]
+    assert game.characteristics(land).subtypes == ("Forest", "Elf")
+
+
+def test_dependency_loop_falls_back_to_timestamp_order():
+    effects = ContinuousEffects()
+    first = add_subtype(1, "Forest", provides={"Forest"}, depends_on={"Island"})
+    second = add_subtype(2, "Island", provides={"Island"}, depends_on={"Forest"})
+    effects.add(second)
+    effects.add(first)
+    assert effects.effects == [first, second]
+
+
+def test_board_dependent_effect_is_recomputed_when_the_board_changes():
+    game = build_board(0)
+    player = game.players[0]
+
+    def modify(state, card, characteristics):
+        characteristics.power += sum(1 for other in player.battlefield.cards if other.is_type("Creature"))
+
+    game.continuous_effects.add(
+        ContinuousEffect(Layer.POWER_TOUGHNESS, None, 1, "crusade", modify=modify, board_dependent=True)
+    )
+    bears = Card(grizzly_bears_definition(), owner=player, controller=player)
+    player.battlefield.add(bears)
+    game.zone_changed(bears, "Stack", "Battlefield")
+    assert game.characteristics(bears).power == 3
+    other = Card(grizzly_bears_definition(), owner=player, controller=player)
+    player.battlefield.add(other)
+    game.zone_changed(other, "Stack", "Battlefield")
+    assert game.characteristics(bears).power == 4
+
+
+def test_cards_leaving_the_battlefield_leave_the_cache():
+    game = build_board(8)
+    bears = game.players[0].battlefield.cards[-1]
+    game.continuous_effects.add(anthem(1))
+    game.characteristics(bears)
+    assert id(bears) in game.continuous_effects._cache
+    bears.damage = 3
+    assert game.check_state_based_actions() == [f"{bears.name} died"]
+    assert id(bears) not in game.continuous_effects._cache
+
+
+def test_state_based_actions_and_combat_use_computed_characteristics():
+    game = build_board(8)
+    attacker, victim = game.players[0].battlefield.cards[-1], game.players[1].battlefield.cards[-1]
+    game.check_state_based_actions()
+    game.continuous_effects.add(anthem(1, power=1, toughness=-1, controller=game.players[1]))
+    assert game.check_state_based_actions() == [f"{victim.name} died"] * 2
+
+    game.continuous_effects.add(anthem(2, power=2, toughness=0, controller=game.players[0]))
+    game.declare_attackers([attacker], game.players[1])
+    game.resolve_combat()
+    assert game.players[1].life == 16
@@ -0,0 +1,63 @@
+import pytest
+
+from py_mage.core.mana import ManaCost, ManaPool
+
+
+def pool(**amounts):
+    return ManaPool(dict(amounts))
+
+
+def test_from_string_parses_hybrid_phyrexian_x_and_colorless():
+    cost = ManaCost.from_string("{X}{2}{C}{W/U}{B/P}{2/G}{G/W/P}")
+    assert cost.generic == 2
+    assert cost.amounts() == {"C": 1}
+    assert cost.hybrid == (("W", "U"), ("B", "P"), ("2", "G"), ("G", "W", "P"))
+    assert cost.x == 1
+    assert cost.total() == 8
+    with pytest.raises(ValueError):
+        ManaCost.from_string("{H/W}")
+
+
+def test_costs_are_interned_and_hashable():
+    cost = ManaCost.from_string("{1}{G}")
+    assert ManaCost.from_string("{G}{1}") is cost
+    assert ManaCost(generic=1, colored={"G": 1}) == cost
+    assert {cost: "bears"}[ManaCost(generic=1, colored={"G": 1})] == "bears"
+    with pytest.raises(AttributeError):
+        cost.generic = 2
+
+
+def test_hybrid_payment_finds_the_feasible_assignment():
+    cost = ManaCost.from_string("{W/U}{W}")
+    mana = pool(W=1, U=1)
+    assert mana.pay(cost).amounts() == {"W": 1, "U": 1}
+    assert mana.amounts == {}
+    assert not pool(W=1, B=1).can_pay(cost)
+
+
+def test_payment_keeps_flexible_mana():
+    assert pool(W=1, U=3).payment(ManaCost.from_string("{W/U}")).amounts() == {"U": 1}
+    assert pool(G=2, R=1, C=1).payment(ManaCost.from_string("{2}")).amounts() == {"G": 1, "C": 1}
+    assert pool(G=1, R=2).payment(ManaCost.from_string("{2/G}")).amounts() == {"G": 1}
+    assert pool(R=2).payment(ManaCost.from_string("{2/G}")).amounts() == {"R": 2}
+
+
+def test_colorless_symbol_needs_colorless_mana():
+    cost = ManaCost.from_string("{1}{C}")
+    assert not pool(G=3).can_pay(cost)
+    assert pool(G=1, C=1).payment(cost).amounts() == {"G": 1, "C": 1}
+
+
+def test_phyrexian_mana_prefers_mana_over_life():
+    cost = ManaCost.from_string("{1}{B/P}")
+    assert pool(B=1, R=1).payment(cost, life=20).life == 0
+    payment = pool(R=1).payment(cost, life=20)
+    assert (payment.amounts(), payment.life) == ({"R": 1}, 2)
+    assert pool(R=1).payment(cost, life=1) is None
+
+
+def test_x_scales_generic_requirement():
+    cost = ManaCost.from_string("{X}{R}")
+    assert pool(R=4).can_pay(cost, x=3)
+    assert not pool(R=4).can_pay(cost, x=4)
+    assert pool(R=1).can_pay(cost)
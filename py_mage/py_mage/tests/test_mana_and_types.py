@@ -1,4 +1,9 @@
-from py_mage.cards.mage_import import parse_types, validate_mana_cost
+from py_mage.cards.mage_import import (
+    parse_card_source,
+    parse_card_source_reference,
+    parse_types,
+    validate_mana_cost,
+)
 
 
 def test_validate_mana_cost_accepts_common_symbols():
@@ -15,3 +20,18 @@ def test_validate_mana_cost_rejects_invalid_symbols():
 def test_parse_types_extracts_card_types():
     content = "super(ownerId, setInfo, new CardType[]{CardType.CREATURE, CardType.ARTIFACT}, \"{2}\");"
     assert list(parse_types(content)) == ["CREATURE", "ARTIFACT"]
+
+
+def test_parse_card_source_reads_instance_keywords():
+    content = (
+        'super(ownerId, setInfo, new CardType[]{CardType.CREATURE}, "{1}{W}");\n'
+        "this.power = new MageInt(2);\n"
+        "this.toughness = new MageInt(1);\n"
+        "this.addAbility(FlyingAbility.getInstance());\n"
+        "this.addAbility(new ProtectionAbility(filter));\n"
+    )
+    parsed = parse_card_source(content)
+    assert parsed == parse_card_source_reference(content)
+    assert list(parsed.keywords) == ["FlyingAbility", "ProtectionAbility"]
+    assert (parsed.power, parsed.toughness) == (2, 1)
+    assert parsed.mana_cost == "{1}{W}"
@@ -0,0 +1,69 @@
+import pytest
+
+from py_mage.cards.basic import grizzly_bears_definition
+from py_mage.core.card import Card
+from py_mage.core.permanents import PermanentTable, TableCard
+from py_mage.core.turn import Step
+from py_mage.validation.bench import build_board
+from py_mage.validation.state import serialize_game_state
+
+
+def play_out(game):
+    log = []
+    for player in game.players:
+        for index, card in enumerate(list(player.battlefield.cards)):
+            if index % 3 == 0:
+                card.damage += 2
+            if index % 5 == 0:
+                card.tapped = True
+    log.extend(game.check_state_based_actions())
+    while game.advance_step() != Step.UNTAP:
+        pass
+    game.active_player_index = 1
+    game.turn_manager.current_index = len(game.turn_manager.steps) - 1
+    game.advance_step()
+    log.extend(game.check_state_based_actions())
+    return log
+
+
+def test_permanent_table_matches_object_board():
+    plain = build_board(60)
+    tabled = build_board(60)
+    table = tabled.use_permanent_table()
+    assert len(table) == 60
+    assert play_out(tabled) == play_out(plain)
+    assert serialize_game_state(tabled) == serialize_game_state(plain)
+    assert len(table) == len(plain.players[0].battlefield.cards) + len(plain.players[1].battlefield.cards)
+
+
+def test_cards_are_views_while_on_the_table():
+    game = build_board(4)
+    table = game.use_permanent_table()
+    player = game.players[0]
+    bears = Card(grizzly_bears_definition(), owner=player, controller=player)
+    player.battlefield.add(bears)
+    assert type(bears) is TableCard
+    bears.damage = 1
+    bears.tapped = True
+    assert table.damage[bears.row] == 1 and table.tapped_bits >> bears.row & 1
+    bears.toughness = 1
+    assert table.lethally_damaged() == [bears]
+    row = bears.row
+    player.battlefield.remove(bears)
+    assert type(bears) is Card
+    assert (bears.damage, bears.tapped, bears.toughness, bears.controller) == (1, True, 1, player)
+    assert table.lethally_damaged() == []
+    player.battlefield.add(bears)
+    assert bears.row == row
+    with pytest.raises(ValueError):
+        PermanentTable(game.players).attach(bears, player)
+
+
+def test_clone_keeps_permanent_table():
+    game = build_board(20)
+    game.use_permanent_table()
+    fork = game.clone()
+    assert fork.permanent_table is not None and fork.permanent_table is not game.permanent_table
+    fork.players[0].battlefield.cards[0].tapped = False
+    assert game.players[0].battlefield.cards[0].tapped
+    assert serialize_game_state(game.clone()) == serialize_game_state(game)
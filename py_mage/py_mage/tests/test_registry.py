@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+import sqlite3
+
+from py_mage.cards.catalog import CATALOG_ROW_QUERY
+from py_mage.cards.compiled import CompiledCatalog, compile_catalog
+from py_mage.cards.mage_import import CardRecord, write_sqlite
+from py_mage.cards import registry as registry_module
+from py_mage.cards.registry import CardRegistry, default_catalog_path, get_definition
+from py_mage.core.card import Card
+from py_mage.core.game_state import GameState
+from py_mage.core.player import Player
+
+
+BASICS = (("Plains", "W"), ("Island", "U"), ("Swamp", "B"), ("Mountain", "R"), ("Forest", "G"), ("Wastes", "C"))
+
+
+def record(name: str, types: list[str], keywords: list[str], **fields) -> CardRecord:
+    values = {
+        "name": name,
+        "set_code": "TST",
+        "collector_number": "1",
+        "rarity": "COMMON",
+        "card_class": f"mage.cards.t.{name.replace(' ', '')}",
+        "mana_cost": None,
+        "types": types,
+        "supertypes": [],
+        "subtypes": [],
+        "power": None,
+        "toughness": None,
+        "keywords": keywords,
+        "mana_parse_ok": True,
+        "types_parse_ok": True,
+        "source_path": "",
+    }
+    values.update(fields)
+    return CardRecord(**values)
+
+
+@pytest.fixture
+def catalog(tmp_path: Path) -> Path:
+    path = tmp_path / "catalog.sqlite"
+    write_sqlite(
+        path,
+        [
+            record("Hill Giant", ["CREATURE"], [], mana_cost="{3}{R}", subtypes=["GIANT"], power=3, toughness=3),
+            record("Ornithopter", ["ARTIFACT", "CREATURE"], ["FlyingAbility"], mana_cost="{0}", power=0, toughness=2),
+            record("Tundra", ["LAND"], ["BlueManaAbility", "WhiteManaAbility"], subtypes=["PLAINS", "ISLAND"]),
+            record("Shock", ["INSTANT"], [], mana_cost="{R}"),
+            record("Shock", ["INSTANT"], [], mana_cost="{R}", set_code="AAA", mana_parse_ok=False),
+            record("Æther Adept", ["CREATURE"], [], mana_cost="{1}{U}{U}", power=2, toughness=2),
+        ],
+    )
+    return path
+
+
+def test_handwritten_definitions_take_precedence(catalog: Path) -> None:
+    registry = CardRegistry(catalog)
+    assert registry.get("Grizzly Bears") is registry.get("Grizzly Bears")
+    assert registry.get("Grizzly Bears").power == 2
+
+
+def test_vanilla_creature_built_from_catalog(catalog: Path) -> None:
+    definition = CardRegistry(catalog).get("Hill Giant")
+    assert definition.types == ("Creature",)
+    assert definition.subtypes == ("Giant",)
+    assert (definition.power, definition.toughness) == (3, 3)
+    assert definition.mana_cost.total() == 4
+
+
+def test_land_gets_mana_abilities_from_catalog(catalog: Path) -> None:
+    definition = CardRegistry(catalog).get("Tundra")
+    player = Player("A")
+    land = Card(definition, owner=player, controller=player)
+    player.battlefield.add(land)
+    game = GameState(players=[player])
+    ability = definition.abilities[0](land, game)[0]
+    ability.activate(game)
+    game.pass_priority()
+    assert land.tapped
+    assert player.mana_pool.amounts == {"W": 1}
+    assert [factory(land, game)[0].name for factory in definition.abilities] == ["Tap: Add W", "Tap: Add U"]
+
+
+def test_non_vanilla_cards_are_unknown(catalog: Path) -> None:
+    registry = CardRegistry(catalog)
+    for name in ("Ornithopter", "Shock", "Missing Card"):
+        with pytest.raises(KeyError):
+            registry.get(name)
+
+
+def test_catalog_cache_is_bounded(catalog: Path) -> None:
+    registry = CardRegistry(catalog, cache_size=1)
+    first = registry.get("Hill Giant")
+    assert registry.get("Hill Giant") is first
+    registry.get("Tundra")
+    assert registry.get("Hill Giant") is not first
+
+
+def test_default_registry_knows_handwritten_cards() -> None:
+    assert get_definition("Lightning Bolt").name == "Lightning Bolt"
+
+
+def test_compiled_catalog_matches_sqlite_rows(catalog: Path, tmp_path: Path) -> None:
+    compiled_path = tmp_path / "catalog.cards"
+    assert compile_catalog(catalog, compiled_path) == 5
+    compiled = CompiledCatalog(compiled_path)
+    conn = sqlite3.connect(catalog)
+    for name in ("Hill Giant", "Ornithopter", "Tundra", "Shock", "Æther Adept"):
+        assert compiled.lookup(name) == tuple(conn.execute(CATALOG_ROW_QUERY, (name,)).fetchone())
+    assert compiled.lookup("Missing Card") is None
+    assert compiled.lookup("") is None
+    conn.close()
+    compiled.close()
+
+
+def test_registry_reads_compiled_catalog(catalog: Path, tmp_path: Path) -> None:
+    compiled_path = tmp_path / "catalog.cards"
+    compile_catalog(catalog, compiled_path)
+    registry = CardRegistry(compiled_path)
+    assert registry.get("Hill Giant") == CardRegistry(catalog).get("Hill Giant")
+    assert registry.get("Æther Adept").power == 2
+    with pytest.raises(KeyError):
+        registry.get("Shock")
+    registry.close()
+
+
+def test_basic_lands_resolve_without_catalog_rows(catalog: Path) -> None:
+    for registry in (CardRegistry(catalog), CardRegistry(None)):
+        for name, symbol in BASICS:
+            definition = registry.get(name)
+            assert definition.types == ("Land",)
+            player = Player("A")
+            land = Card(definition, owner=player, controller=player)
+            player.battlefield.add(land)
+            game = GameState(players=[player])
+            definition.abilities[0](land, game)[0].activate(game)
+            game.pass_priority()
+            assert player.mana_pool.amounts == {symbol: 1}
+
+
+def test_default_registry_ignores_a_compiled_catalog_older_than_the_import(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    sqlite_path = tmp_path / "mage_catalog.sqlite"
+    compiled_path = tmp_path / "mage_catalog.cards"
+    monkeypatch.setattr(registry_module, "DEFAULT_CATALOG_PATH", sqlite_path)
+    monkeypatch.setattr(registry_module, "DEFAULT_COMPILED_PATH", compiled_path)
+    write_sqlite(sqlite_path, [record("Hill Giant", ["CREATURE"], [], mana_cost="{3}{R}", power=3, toughness=3)])
+    compile_catalog(sqlite_path, compiled_path)
+    assert default_catalog_path() == compiled_path
+    write_sqlite(sqlite_path, [record("Hill Giant", ["CREATURE"], [], mana_cost="{3}{R}", power=4, toughness=4)])
+    stamp = compiled_path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(sqlite_path, ns=(stamp, stamp))
+    assert default_catalog_path() == sqlite_path
+    assert CardRegistry(default_catalog_path()).get("Hill Giant").power == 4
@@ -0,0 +1,66 @@
+import random
+from pathlib import Path
+
+import pytest
+
+from py_mage.cards.basic import grizzly_bears_definition
+from py_mage.core.card import Card
+from py_mage.validation.bench import build_board
+from py_mage.validation.runner import run_script
+from py_mage.validation.state import serialize_game_state
+
+
+GOLDEN_DIR = Path(__file__).resolve().parent / "golden"
+
+
+def mutate(game, rng):
+    player = game.players[rng.randrange(2)]
+    cards = list(player.battlefield.cards)
+    roll = rng.random()
+    if roll < 0.4 and cards:
+        rng.choice(cards).damage += rng.randrange(3)
+    elif roll < 0.55 and cards:
+        rng.choice(cards).toughness = rng.choice([None, 0, 1, 3])
+    elif roll < 0.7:
+        player.life += rng.randrange(-8, 5)
+    elif roll < 0.85:
+        bears = Card(grizzly_bears_definition(), owner=player, controller=player, damage=rng.randrange(3))
+        player.battlefield.add(bears)
+    elif player.graveyard.cards:
+        card = player.graveyard.cards.pop()
+        player.battlefield.add(card)
+
+
+@pytest.mark.parametrize("use_table", [False, True])
+def test_incremental_sba_matches_full_scan(use_table):
+    rng = random.Random(7)
+    incremental = build_board(40)
+    full = incremental.clone()
+    full.sba.full_scan = True
+    if use_table:
+        incremental.use_permanent_table()
+    for _ in range(300):
+        seed = rng.random()
+        mutate(incremental, random.Random(seed))
+        mutate(full, random.Random(seed))
+        assert incremental.check_state_based_actions() == full.check_state_based_actions()
+        assert serialize_game_state(incremental) == serialize_game_state(full)
+
+
+def test_unchanged_board_is_not_rescanned():
+    game = build_board(200)
+    game.check_state_based_actions()
+    assert not game.sba.dirty_cards
+    card = game.players[1].battlefield.cards[1]
+    card.damage = 5
+    assert list(game.sba.dirty_cards.values()) == [card]
+    assert game.check_state_based_actions() == [f"{card.name} died"]
+
+
+@pytest.mark.parametrize("scenario", ["cast_spell_simple", "combat_simple", "mana_payment"])
+def test_golden_replays_match_full_scan(scenario):
+    path = GOLDEN_DIR / scenario / "input.json"
+    state, log = run_script(path, assert_invariants=True)
+    full_state, full_log = run_script(path, assert_invariants=True, full_sba_scan=True)
+    assert log == full_log
+    assert serialize_game_state(state) == serialize_game_state(full_state)
@@ -0,0 +1,111 @@
+import multiprocessing
+import random
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from py_mage.cards import registry
+from py_mage.cards.mage_import import write_sqlite
+from py_mage.cards.registry import get_definition
+from py_mage.core.card import Card
+from py_mage.core.game_state import GameState
+from py_mage.core.player import Player
+from py_mage.core.turn import Step
+from py_mage.decks import build_library, load_deck, parse_deck
+from py_mage.simulation.driver import GameDriver
+from py_mage.simulation import engine
+from py_mage.simulation.engine import format_report, play_game, simulate
+from py_mage.simulation.policy import GreedyPolicy
+from py_mage.tests.test_registry import record
+
+
+BEARS = "NAME:Bears\n12 Forest\n12 [M10:175] Grizzly Bears\nSB: 2 Lightning Bolt\n"
+BURN = "// Burn\n#Land\n10 Mountain\n6 Forest\n8 Grizzly Bears\n6 Lightning Bolt\n1 Unknown Card\n"
+
+
+def write_decks(tmp_path):
+    paths = [tmp_path / "bears.dck", tmp_path / "burn.dck"]
+    for path, text in zip(paths, (BEARS, BURN)):
+        path.write_text(text, encoding="utf-8")
+    return paths
+
+
+def test_parse_deck_reads_entries_sideboard_and_name():
+    deck = parse_deck(BEARS)
+    assert deck.name == "Bears"
+    assert [(entry.count, entry.name, entry.set_code, entry.collector_number) for entry in deck.main] == [
+        (12, "Forest", None, None),
+        (12, "Grizzly Bears", "M10", "175"),
+    ]
+    assert [(entry.count, entry.name) for entry in deck.sideboard] == [(2, "Lightning Bolt")]
+    library, unsupported = build_library(parse_deck(BURN), Player("A"))
+    assert (len(library), unsupported) == (31, 1)
+
+
+def test_pass_turn_rotates_and_untaps_the_next_player():
+    game = GameState(players=[Player("A"), Player("B")])
+    land = Card(get_definition("Forest"), owner=game.players[1], controller=game.players[1], tapped=True)
+    game.players[1].battlefield.add(land)
+    game.turn_manager.current_index = game.turn_manager.steps.index(Step.CLEANUP)
+    assert game.pass_turn() == Step.UNTAP
+    assert (game.active_player_index, game.turn_number, land.tapped) == (1, 2, False)
+
+
+def test_greedy_policy_plays_a_land_and_casts_what_it_can():
+    player, opponent = Player("A"), Player("B")
+    game = GameState(players=[player, opponent])
+    for name in ("Forest", "Forest", "Grizzly Bears", "Lightning Bolt"):
+        player.hand.add(Card(get_definition(name), owner=player, controller=player))
+    game.play_land(player, player.hand.cards[0])
+    driver = GameDriver(game)
+    GreedyPolicy(random.Random(0)).main_phase(driver, player)
+    assert [card.name for card in player.battlefield.cards] == ["Forest", "Forest", "Grizzly Bears"]
+    assert [card.name for card in player.hand.cards] == ["Lightning Bolt"]
+    assert not driver.can_attack(player.battlefield.cards[-1])
+    assert driver.lands_in_hand(player) == []
+
+
+def test_games_are_deterministic_and_finish(tmp_path):
+    decks = [load_deck(path) for path in write_decks(tmp_path)]
+    first = [play_game(decks, seed=seed) for seed in range(10)]
+    assert first == [play_game(decks, seed=seed) for seed in range(10)]
+    assert all(result.winner in (0, 1, None) and result.turns > 1 for result in first)
+    assert play_game(decks, seed=3, max_turns=2).turns <= 2
+
+
+def test_simulate_results_do_not_depend_on_workers(tmp_path, monkeypatch):
+    paths = write_decks(tmp_path)
+    serial = simulate(paths, games=12, seed=5)
+    sharded = simulate(paths, games=12, seed=5, jobs=2, policy="greedy")
+    assert serial.results == sharded.results
+    assert serial.wins(0) + serial.wins(1) + serial.draws == 12
+    lines = format_report(serial)
+    assert "games/s" in lines[0] and "turns/s" in lines[0]
+    assert lines[3].split()[-1] == "1/31"
+    # Spawned workers inherit nothing from the parent, so they must load the
+    # catalog themselves to play the same games.
+    catalog = tmp_path / "catalog.sqlite"
+    write_sqlite(catalog, [record("Unknown Card", ["CREATURE"], [], mana_cost="{R}", power=3, toughness=1)])
+    monkeypatch.setattr(registry, "_DEFAULT_REGISTRY", registry.CardRegistry(registry.default_catalog_path()))
+    spawn = partial(ProcessPoolExecutor, mp_context=multiprocessing.get_context("spawn"))
+    monkeypatch.setattr(engine, "ProcessPoolExecutor", spawn)
+    with_catalog = simulate(paths, games=12, seed=5, catalog=catalog)
+    assert with_catalog.unsupported == [0, 0]
+    assert with_catalog.results != serial.results
+    assert simulate(paths, games=12, seed=5, jobs=2, catalog=catalog).results == with_catalog.results
+
+
+def test_simulate_cli(tmp_path):
+    paths = write_decks(tmp_path)
+    completed = subprocess.run(
+        [
+            sys.executable, "-m", "py_mage", "simulate", "--decks", *map(str, paths),
+            "--games", "4", "--seed", "2", "--deck-cache", str(tmp_path / "cache"),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    assert completed.stdout.startswith("Games: 4 in ")
+    assert "Bears" in completed.stdout and "Draws" in completed.stdout
@@ -0,0 +1,119 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from py_mage.cards.basic import make_creature_spell, make_lightning_bolt_spell
+from py_mage.cards.registry import get_definition
+from py_mage.core.card import Card
+from py_mage.core.game_state import GameState
+from py_mage.core.player import Player
+from py_mage.decks import parse_deck, unsupported_definition
+from py_mage.simulation import engine
+from py_mage.validation.runner import dump_state, load_state
+from py_mage.validation.snapshot import MAGIC, dump_snapshot, load_snapshot
+from py_mage.validation.state import serialize_game_state
+
+
+GOLDEN_DIR = Path(__file__).parent / "golden"
+
+
+def card(player, name, controller=None):
+    return Card(get_definition(name), owner=player, controller=controller or player)
+
+
+def busy_board():
+    a, b = Player("A"), Player("B", life=-2)
+    game = GameState(players=[a, b])
+    forest = card(a, "Forest")
+    a.hand.add(forest)
+    game.play_land(a, forest)
+    stolen = card(b, "Grizzly Bears", controller=a)
+    stolen.damage = 1
+    stolen.power = 4
+    a.battlefield.add(stolen)
+    a.mana_pool.add("R", 2)
+    a.library.extend([card(a, "Mountain"), Card(unsupported_definition("Unknown Card"), owner=a, controller=a)])
+    forest.abilities[0].activate(game)
+    bears, bolt = card(a, "Grizzly Bears"), card(a, "Lightning Bolt")
+    game.add_to_stack(bears, make_creature_spell(bears), controller=a)
+    game.add_to_stack(bolt, make_lightning_bolt_spell(bolt, stolen), controller=a)
+    game.turn_number = 9
+    game.active_player_index = 1
+    return game
+
+
+def test_snapshot_round_trips_cards_owners_and_the_stack():
+    game = busy_board()
+    data = dump_snapshot(game)
+    loaded = load_snapshot(data)
+    assert dump_snapshot(loaded) == data
+    assert serialize_game_state(loaded) == serialize_game_state(game)
+    assert loaded.state_hash() == game.state_hash()
+    assert (loaded.turn_number, loaded.active_player_index) == (9, 1)
+    a, b = loaded.players
+    stolen = a.battlefield.cards[1]
+    assert (stolen.owner, stolen.controller, stolen.power, stolen.damage) == (b, a, 4, 1)
+    loaded.resolve_top()
+    assert stolen.damage == 4
+    loaded.resolve_top()
+    loaded.resolve_top()
+    assert [card.name for card in a.battlefield.cards] == ["Forest", "Grizzly Bears", "Grizzly Bears"]
+    assert a.mana_pool.amounts == {"R": 2, "G": 1}
+
+
+def test_json_dumps_keep_stack_targets(tmp_path: Path) -> None:
+    game = busy_board()
+    path = tmp_path / "state.json"
+    dump_state(game, path, "json")
+    loaded = load_state(path)
+    assert serialize_game_state(loaded) == serialize_game_state(game)
+    assert serialize_game_state(game)["stack"][-1]["target"] == {"player": 0, "zone": "battlefield", "index": 1}
+    loaded.resolve_top()
+    assert loaded.players[0].battlefield.cards[1].damage == 4
+
+
+def test_snapshots_round_trip_through_a_simulated_game(monkeypatch):
+    play_step = engine.play_step
+    sizes = []
+
+    def checked_step(driver, policies, step):
+        play_step(driver, policies, step)
+        data = dump_snapshot(driver.game)
+        assert dump_snapshot(load_snapshot(data)) == data
+        sizes.append((len(data), len(json.dumps(serialize_game_state(driver.game), indent=2))))
+
+    monkeypatch.setattr(engine, "play_step", checked_step)
+    deck = parse_deck("NAME:Bears\n9 Forest\n6 Mountain\n10 Grizzly Bears\n5 Lightning Bolt\n")
+    engine.play_game([deck, deck], seed=2)
+    assert sum(binary for binary, _ in sizes) * 20 < sum(text for _, text in sizes)
+
+
+def test_corrupt_snapshots_are_rejected():
+    data = dump_snapshot(busy_board())
+    with pytest.raises(ValueError):
+        load_snapshot(data[:-3])
+    with pytest.raises(ValueError):
+        load_snapshot(MAGIC + b"\x63")
+    with pytest.raises(ValueError):
+        load_snapshot(b"{}")
+
+
+def test_replay_writes_binary_states(tmp_path: Path) -> None:
+    scenario = GOLDEN_DIR / "combat_simple"
+    out = tmp_path / "state.bin"
+    subprocess.run(
+        [
+            sys.executable, "-m", "py_mage", "validate", "replay", str(scenario / "input.json"),
+            "--out", str(out), "--log", str(tmp_path / "log.txt"), "--format", "bin",
+        ],
+        check=True,
+    )
+    expected = json.loads((scenario / "expected_state.json").read_text(encoding="utf-8"))
+    assert out.read_bytes().startswith(MAGIC)
+    assert serialize_game_state(load_state(out)) == expected
+    json_path = tmp_path / "expected.json"
+    json_path.write_text(json.dumps(expected), encoding="utf-8")
+    assert serialize_game_state(load_state(json_path)) == expected
@@ -0,0 +1,39 @@
+import pytest
+
+from py_mage.cards.basic import grizzly_bears_definition
+from py_mage.core.card import Card
+from py_mage.core.player import Player
+from py_mage.core.zones import Zone
+
+
+def make_bears(player, count):
+    return [Card(grizzly_bears_definition(), owner=player, controller=player) for _ in range(count)]
+
+
+def test_zone_membership_and_removal_use_identity():
+    player = Player("A")
+    first, second, third = make_bears(player, 3)
+    assert first != second and first == first
+    zone = Zone("Battlefield", [first, second, third])
+    zone.remove(second)
+    assert list(zone.cards) == [first, third]
+    assert zone.cards[0] is first and zone.cards[-1] is third
+    assert second not in zone and first in zone
+    with pytest.raises(ValueError):
+        zone.remove(second)
+    with pytest.raises(ValueError):
+        zone.add(first)
+
+
+def test_zone_keeps_insertion_order_for_draws():
+    player = Player("A")
+    cards = make_bears(player, 4)
+    player.library.extend(cards)
+    player.library.remove(cards[1])
+    player.library.add(cards[1])
+    assert list(player.library.cards) == [cards[0], cards[2], cards[3], cards[1]]
+    player.draw()
+    player.draw()
+    assert list(player.hand.cards) == [cards[1], cards[3]]
+    assert player.library.cards.pop(0) is cards[0]
+    assert list(player.library.cards) == [cards[2]]
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import copy
+import time
+from typing import Callable, Dict
+
+from py_mage.cards.basic import forest_definition, grizzly_bears_definition, make_creature_spell
+from py_mage.core.card import Card
+from py_mage.core.game_state import GameState
+from py_mage.core.player import Player
+
+
+def build_board(permanents: int) -> GameState:
+    players = [Player("A"), Player("B")]
+    game_state = GameState(players=players)
+    for index in range(permanents):
+        player = players[index % 2]
+        if index % 4 < 2:
+            card = Card(forest_definition(), owner=player, controller=player)
+            card.tapped = index % 8 == 0
+        else:
+            card = Card(grizzly_bears_definition(), owner=player, controller=player)
+            card.damage = index % 2
+        card.zone = "Battlefield"
+        for factory in card.definition.abilities:
+            for ability in factory(card, game_state):
+                card.add_ability(ability)
+        player.battlefield.add(card)
+    caster = players[0]
+    spell = Card(grizzly_bears_definition(), owner=caster, controller=caster)
+    game_state.add_to_stack(spell, make_creature_spell(spell), controller=caster)
+    return game_state
+
+
+def time_fork(fork: Callable[[GameState], GameState], game_state: GameState, forks: int) -> float:
+    start = time.perf_counter()
+    for _ in range(forks):
+        fork(game_state)
+    return (time.perf_counter() - start) / forks
+
+
+def bench_clone(permanents: int = 200, forks: int = 200) -> Dict[str, float]:
+    game_state = build_board(permanents)
+    clone_seconds = time_fork(GameState.clone, game_state, forks)
+    deepcopy_seconds = time_fork(copy.deepcopy, game_state, max(1, forks // 10))
+    return {
+        "permanents": permanents,
+        "clone_us": clone_seconds * 1e6,
+        "deepcopy_us": deepcopy_seconds * 1e6,
+        "speedup": deepcopy_seconds / clone_seconds,
+    }
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import json
 import random
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional
 
@@ -12,7 +14,17 @@ from py_mage.core.card import Card
 from py_mage.core.game_state import GameState
 from py_mage.core.invariants import check_invariants
 from py_mage.core.player import Player
-from py_mage.validation.state import serialize_game_state
+from py_mage.core.sba import StateBasedActions
+from py_mage.core.zones import Zone
+from py_mage.validation.snapshot import dump_snapshot, is_snapshot, load_snapshot
+from py_mage.validation.state import deserialize_game_state, serialize_game_state
+
+
+SCRIPT_NAME = "input.json"
+EXPECTED_STATE_NAME = "expected_state.json"
+EXPECTED_LOG_NAME = "expected_log.txt"
+REPLAY_CHUNKS_PER_JOB = 4
+STATE_FORMATS = ("json", "bin")
 
 
 @dataclass
@@ -37,12 +49,13 @@ class ActionScript:
 class ActionRunner:
     script: ActionScript
     assert_invariants: bool = False
+    full_sba_scan: bool = False
     log: List[str] = field(default_factory=list)
 
     def run(self) -> GameState:
         random.seed(self.script.seed)
         players = [Player(entry["name"]) for entry in self.script.players]
-        game_state = GameState(players=players)
+        game_state = GameState(players=players, sba=StateBasedActions(full_scan=self.full_sba_scan))
         self._apply_initial_zones(game_state)
         if self.assert_invariants:
             check_invariants(game_state)
@@ -55,14 +68,14 @@ class ActionRunner:
     def _apply_initial_zones(self, game_state: GameState) -> None:
         for player in game_state.players:
             zones = self.script.initial_zones.get(player.name, {})
-            self._populate_zone(player.battlefield.cards, zones.get("battlefield", []), player)
-            self._populate_zone(player.hand.cards, zones.get("hand", []), player)
-            self._populate_zone(player.library.cards, zones.get("library", []), player)
+            self._populate_zone(player.battlefield, zones.get("battlefield", []), player)
+            self._populate_zone(player.hand, zones.get("hand", []), player)
+            self._populate_zone(player.library, zones.get("library", []), player)
 
-    def _populate_zone(self, destination: List[Card], names: Iterable[str], owner: Player) -> None:
+    def _populate_zone(self, destination: Zone, names: Iterable[str], owner: Player) -> None:
         for name in names:
             definition = get_definition(name)
-            destination.append(Card(definition, owner=owner, controller=owner))
+            destination.add(Card(definition, owner=owner, controller=owner))
 
     def _apply_action(self, game_state: GameState, action: Dict[str, Any]) -> None:
         kind = action["action"]
@@ -128,8 +141,8 @@ class ActionRunner:
             self.log.append(f"{player.name} blocks")
             return
         if kind == "resolve_combat":
-            game_state.resolve_combat()
-            results = game_state.check_state_based_actions()
+            results = game_state.resolve_combat()
+            results.extend(game_state.check_state_based_actions())
             self.log.extend(results)
             self.log.append("combat resolved")
             return
@@ -151,21 +164,23 @@ class ActionRunner:
                 return player
         raise ValueError(f"Unknown player: {name}")
 
-    def _find_card(self, cards: List[Card], name: str, index: int) -> Card:
+    def _find_card(self, cards: Iterable[Card], name: str, index: int) -> Card:
         matches = [card for card in cards if card.name == name]
         if len(matches) <= index:
             raise ValueError(f"Card {name} index {index} not found")
         return matches[index]
 
 
-def run_script(path: Path, assert_invariants: bool) -> tuple[GameState, List[str]]:
+def run_script(
+    path: Path, assert_invariants: bool, full_sba_scan: bool = False
+) -> tuple[GameState, List[str]]:
     script = ActionScript.from_path(path)
-    runner = ActionRunner(script=script, assert_invariants=assert_invariants)
+    runner = ActionRunner(script=script, assert_invariants=assert_invariants, full_sba_scan=full_sba_scan)
     game_state = runner.run()
     return game_state, runner.log
 
 
-def run_smoke(seed: int, assert_invariants: bool) -> tuple[GameState, List[str]]:
+def run_smoke(seed: int, assert_invariants: bool, full_sba_scan: bool = False) -> tuple[GameState, List[str]]:
     script = ActionScript(
         seed=seed,
         players=[{"name": "A"}, {"name": "B"}],
@@ -182,10 +197,94 @@ def run_smoke(seed: int, assert_invariants: bool) -> tuple[GameState, List[str]]
             {"action": "cast_creature", "player": "B", "card": "Grizzly Bears", "index": 0},
         ],
     )
-    runner = ActionRunner(script=script, assert_invariants=assert_invariants)
+    runner = ActionRunner(script=script, assert_invariants=assert_invariants, full_sba_scan=full_sba_scan)
     game_state = runner.run()
     return game_state, runner.log
 
 
-def dump_state(game_state: GameState, out_path: Path) -> None:
-    out_path.write_text(json.dumps(serialize_game_state(game_state), indent=2), encoding="utf-8")
+def dump_state(game_state: GameState, out_path: Path, format: str = "json") -> None:
+    if format == "bin":
+        out_path.write_bytes(dump_snapshot(game_state))
+    elif format == "json":
+        out_path.write_text(json.dumps(serialize_game_state(game_state), indent=2), encoding="utf-8")
+    else:
+        raise ValueError(f"Unknown state format: {format}")
+
+
+def load_state(path: Path) -> GameState:
+    data = path.read_bytes()
+    if is_snapshot(data):
+        return load_snapshot(data)
+    return deserialize_game_state(json.loads(data))
+
+
+def format_log(log: Iterable[str]) -> str:
+    return "\n".join(log) + "\n"
+
+
+@dataclass
+class ReplayResult:
+    scenario: Path
+    mismatches: List[str] = field(default_factory=list)
+
+    @property
+    def passed(self) -> bool:
+        return not self.mismatches
+
+
+def find_scenarios(root: Path) -> List[Path]:
+    return sorted(path.parent for path in root.rglob(SCRIPT_NAME))
+
+
+def replay_scenario(
+    scenario: Path, assert_invariants: bool = True, full_sba_scan: bool = False
+) -> ReplayResult:
+    # Replays one scenario directory and compares against its expected files in
+    # memory; failures are reported rather than raised so a batch keeps going.
+    result = ReplayResult(scenario)
+    try:
+        game_state, log = run_script(scenario / SCRIPT_NAME, assert_invariants, full_sba_scan)
+    except Exception as exc:
+        result.mismatches.append(f"error: {type(exc).__name__}: {exc}")
+        return result
+    expected_log = scenario / EXPECTED_LOG_NAME
+    if expected_log.exists() and format_log(log) != expected_log.read_text(encoding="utf-8"):
+        result.mismatches.append("log differs")
+    expected_state = scenario / EXPECTED_STATE_NAME
+    if expected_state.exists():
+        difference = first_difference(
+            json.loads(expected_state.read_text(encoding="utf-8")), serialize_game_state(game_state)
+        )
+        if difference is not None:
+            result.mismatches.append(f"state differs at {difference}")
+    return result
+
+
+def replay_batch(
+    root: Path, jobs: int = 1, assert_invariants: bool = True, full_sba_scan: bool = False
+) -> List[ReplayResult]:
+    scenarios = find_scenarios(root)
+    replay = partial(replay_scenario, assert_invariants=assert_invariants, full_sba_scan=full_sba_scan)
+    if jobs <= 1 or len(scenarios) < 2:
+        return [replay(scenario) for scenario in scenarios]
+    chunksize = max(1, len(scenarios) // (jobs * REPLAY_CHUNKS_PER_JOB))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(replay, scenarios, chunksize=chunksize))
+
+
+def first_difference(expected: Any, actual: Any, path: str = "$") -> Optional[str]:
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        for key in sorted(expected.keys() | actual.keys(), key=str):
+            if key not in expected or key not in actual:
+                return f"{path}.{key}"
+            difference = first_difference(expected[key], actual[key], f"{path}.{key}")
+            if difference is not None:
+                return difference
+        return None
+    if isinstance(expected, list) and isinstance(actual, list):
+        for index, (left, right) in enumerate(zip(expected, actual)):
+            difference = first_difference(left, right, f"{path}[{index}]")
+            if difference is not None:
+                return difference
+        return None if len(expected) == len(actual) else f"{path}[{min(len(expected), len(actual))}]"
+    return None if expected == actual else path
@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from py_mage.core.card import Card
+from py_mage.core.game_state import GameState
+from py_mage.core.mana import ManaPool
+from py_mage.core.player import Player
+from py_mage.core.stack import StackItem
+from py_mage.core.turn import Step
+from py_mage.validation.state import ZONE_NAMES, build_card, prepare_permanents, rebuild_ability
+
+
+# Layout, every integer a LEB128 varint (signed ones zigzag encoded):
+#   magic, version, string count, strings (length + UTF-8),
+#   step index, active player, turn number, player count,
+#   per player: name, life, has lost, mana pool (symbol, amount) pairs, then
+#   per zone: card count, name refs, tapped bitset, and sparse (index, value)
+#   lists for damage, changed power/toughness, owner and controller,
+#   stack items as (source, ability name, controller, target).
+# Continuous effects, combat and event subscriptions are not stored.
+MAGIC = b"PYMGSNAP"
+FORMAT_VERSION = 1
+STEPS = list(Step)
+NO_CARD = 0
+ZONE_CARD = 1
+LOOSE_CARD = 2
+
+CardPosition = Tuple[int, int, int]
+
+
+def zigzag(value: int) -> int:
+    return value << 1 if value >= 0 else (-value << 1) - 1
+
+
+def unzigzag(value: int) -> int:
+    return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+
+def write_uint(out: bytearray, value: int) -> None:
+    if value < 0:
+        raise ValueError(f"Cannot write {value} as an unsigned varint")
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+class SnapshotWriter:
+    def __init__(self) -> None:
+        self.strings: Dict[str, int] = {}
+        self.body = bytearray()
+
+    def uint(self, value: int) -> None:
+        write_uint(self.body, value)
+
+    def int(self, value: int) -> None:
+        write_uint(self.body, zigzag(value))
+
+    def optional_int(self, value: Optional[int]) -> None:
+        write_uint(self.body, 0 if value is None else zigzag(value) + 1)
+
+    def string(self, value: str) -> None:
+        write_uint(self.body, self.strings.setdefault(value, len(self.strings)))
+
+    def bits(self, flags: Sequence[bool]) -> None:
+        value = 0
+        for index, flag in enumerate(flags):
+            if flag:
+                value |= 1 << index
+        self.body += value.to_bytes((len(flags) + 7) // 8, "little")
+
+    def data(self) -> bytes:
+        out = bytearray(MAGIC)
+        write_uint(out, FORMAT_VERSION)
+        write_uint(out, len(self.strings))
+        for value in self.strings:
+            encoded = value.encode("utf-8")
+            write_uint(out, len(encoded))
+            out += encoded
+        return bytes(out + self.body)
+
+
+class SnapshotReader:
+    def __init__(self, data: bytes) -> None:
+        if not data.startswith(MAGIC):
+            raise ValueError("Not a py_mage state snapshot")
+        self.data = data
+        self.pos = len(MAGIC)
+        version = self.uint()
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported snapshot version {version}")
+        self.strings: List[str] = []
+        for _ in range(self.uint()):
+            length = self.uint()
+            self.strings.append(data[self.pos:self.pos + length].decode("utf-8"))
+            self.pos += length
+
+    def uint(self) -> int:
+        result = 0
+        shift = 0
+        while True:
+            byte = self.data[self.pos]
+            self.pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def int(self) -> int:
+        return unzigzag(self.uint())
+
+    def optional_int(self) -> Optional[int]:
+        value = self.uint()
+        return None if value == 0 else unzigzag(value - 1)
+
+    def string(self) -> str:
+        return self.strings[self.uint()]
+
+    def bits(self, count: int) -> List[bool]:
+        size = (count + 7) // 8
+        value = int.from_bytes(self.data[self.pos:self.pos + size], "little")
+        self.pos += size
+        return [bool(value >> index & 1) for index in range(count)]
+
+
+def dump_snapshot(game_state: GameState) -> bytes:
+    writer = SnapshotWriter()
+    seats = {id(player): seat for seat, player in enumerate(game_state.players)}
+    positions: Dict[int, CardPosition] = {}
+    writer.uint(STEPS.index(game_state.turn_manager.current_step()))
+    writer.uint(game_state.active_player_index)
+    writer.uint(game_state.turn_number)
+    writer.uint(len(game_state.players))
+    for seat, player in enumerate(game_state.players):
+        writer.string(player.name)
+        writer.int(player.life)
+        writer.uint(player.has_lost)
+        amounts = [(symbol, amount) for symbol, amount in player.mana_pool.amounts.items() if amount]
+        writer.uint(len(amounts))
+        for symbol, amount in amounts:
+            writer.string(symbol)
+            writer.uint(amount)
+        for zone_index, zone_name in enumerate(ZONE_NAMES):
+            cards = list(getattr(player, zone_name).cards)
+            for index, card in enumerate(cards):
+                positions[id(card)] = (seat, zone_index, index)
+            write_zone(writer, cards, seat, seats)
+    writer.uint(len(game_state.stack.items))
+    for item in game_state.stack.items:
+        write_card_ref(writer, item.source, positions, seats)
+        writer.string(item.ability.name)
+        writer.uint(0 if item.controller is None else seats[id(item.controller)] + 1)
+        write_card_ref(writer, item.ability.target, positions, seats)
+    return writer.data()
+
+
+def write_zone(writer: SnapshotWriter, cards: List[Card], seat: int, seats: Dict[int, int]) -> None:
+    writer.uint(len(cards))
+    for card in cards:
+        writer.string(card.name)
+    writer.bits([card.tapped for card in cards])
+    damaged = [(index, card.damage) for index, card in enumerate(cards) if card.damage]
+    writer.uint(len(damaged))
+    for index, damage in damaged:
+        writer.uint(index)
+        writer.int(damage)
+    changed = [
+        (index, card)
+        for index, card in enumerate(cards)
+        if (card.power, card.toughness) != (card.definition.power, card.definition.toughness)
+    ]
+    writer.uint(len(changed))
+    for index, card in changed:
+        writer.uint(index)
+        writer.optional_int(card.power)
+        writer.optional_int(card.toughness)
+    for attribute in ("owner", "controller"):
+        moved = [
+            (index, seats[id(getattr(card, attribute))])
+            for index, card in enumerate(cards)
+            if seats[id(getattr(card, attribute))] != seat
+        ]
+        writer.uint(len(moved))
+        for index, other in moved:
+            writer.uint(index)
+            writer.uint(other)
+
+
+def write_card_ref(
+    writer: SnapshotWriter, card: Optional[Card], positions: Dict[int, CardPosition], seats: Dict[int, int]
+) -> None:
+    # Cards in a zone are referenced by position; spells on the stack belong
+    # to no zone and are written out whole.
+    if card is None:
+        writer.uint(NO_CARD)
+        return
+    position = positions.get(id(card))
+    if position is not None:
+        writer.uint(ZONE_CARD)
+        for value in position:
+            writer.uint(value)
+        return
+    writer.uint(LOOSE_CARD)
+    writer.string(card.name)
+    writer.uint(seats[id(card.owner)])
+    writer.uint(seats[id(card.controller)])
+
+
+def load_snapshot(data: bytes) -> GameState:
+    try:
+        return read_snapshot(SnapshotReader(data))
+    except (IndexError, UnicodeDecodeError) as exc:
+        raise ValueError("Truncated or corrupt state snapshot") from exc
+
+
+def read_snapshot(reader: SnapshotReader) -> GameState:
+    step = reader.uint()
+    active = reader.uint()
+    turn_number = reader.uint()
+    players: List[Player] = []
+    zones: List[List[List[Card]]] = []
+    fixups: List[Tuple[Card, str, int]] = []
+    for seat in range(reader.uint()):
+        player = Player(reader.string(), life=reader.int(), has_lost=bool(reader.uint()))
+        pool = ManaPool()
+        for _ in range(reader.uint()):
+            symbol = reader.string()
+            pool.amounts[symbol] = reader.uint()
+        player.mana_pool = pool
+        players.append(player)
+        zones.append([read_zone(reader, player, fixups) for _ in ZONE_NAMES])
+    for card, attribute, other in fixups:
+        setattr(card, attribute, players[other])
+    for player, player_zones in zip(players, zones):
+        for zone_name, cards in zip(ZONE_NAMES, player_zones):
+            getattr(player, zone_name).extend(cards)
+    game_state = GameState(players=players)
+    game_state.turn_manager.current_index = step
+    game_state.active_player_index = active
+    game_state.turn_number = turn_number
+    prepare_permanents(game_state)
+    for _ in range(reader.uint()):
+        source = read_card_ref(reader, players, zones)
+        name = reader.string()
+        controller = reader.uint()
+        target = read_card_ref(reader, players, zones)
+        game_state.stack.push(
+            StackItem(source, rebuild_ability(source, name, target), players[controller - 1] if controller else None)
+        )
+    return game_state
+
+
+def read_zone(reader: SnapshotReader, holder: Player, fixups: List[Tuple[Card, str, int]]) -> List[Card]:
+    count = reader.uint()
+    names = [reader.string() for _ in range(count)]
+    tapped = reader.bits(count)
+    cards = [build_card(name, holder, holder, flag) for name, flag in zip(names, tapped)]
+    for _ in range(reader.uint()):
+        index = reader.uint()
+        cards[index].damage = reader.int()
+    for _ in range(reader.uint()):
+        card = cards[reader.uint()]
+        card.power = reader.optional_int()
+        card.toughness = reader.optional_int()
+    for attribute in ("owner", "controller"):
+        for _ in range(reader.uint()):
+            index = reader.uint()
+            fixups.append((cards[index], attribute, reader.uint()))
+    return cards
+
+
+def read_card_ref(reader: SnapshotReader, players: List[Player], zones: List[List[List[Card]]]) -> Optional[Card]:
+    kind = reader.uint()
+    if kind == NO_CARD:
+        return None
+    if kind == ZONE_CARD:
+        seat, zone_index, index = reader.uint(), reader.uint(), reader.uint()
+        return zones[seat][zone_index][index]
+    name = reader.string()
+    owner, controller = reader.uint(), reader.uint()
+    return build_card(name, players[owner], players[controller])
+
+
+def is_snapshot(data: bytes) -> bool:
+    return data.startswith(MAGIC)
@@ -1,13 +1,27 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Optional
+
+from py_mage.cards.basic import make_creature_spell, make_lightning_bolt_spell
+from py_mage.cards.registry import get_definition
+from py_mage.core.abilities import Ability
+from py_mage.core.card import Card, CardDefinition
+from py_mage.core.game_state import GameState
+from py_mage.core.mana import ManaPool
+from py_mage.core.player import Player
+from py_mage.core.stack import StackItem
+from py_mage.core.turn import Step
+from py_mage.decks import unsupported_definition
+
+
+ZONE_NAMES = ("library", "hand", "battlefield", "graveyard", "exile")
 
 
 def serialize_game_state(game_state: "GameState") -> Dict[str, Any]:
     return {
         "turn": game_state.turn_manager.current_step().value,
         "players": [serialize_player(player) for player in game_state.players],
-        "stack": [serialize_stack_item(item) for item in game_state.stack.items],
+        "stack": [serialize_stack_item(item, game_state) for item in game_state.stack.items],
     }
 
 
@@ -16,17 +30,11 @@ def serialize_player(player: "Player") -> Dict[str, Any]:
         "name": player.name,
         "life": player.life,
         "mana_pool": dict(player.mana_pool.amounts),
-        "zones": {
-            "library": serialize_zone(player.library.cards),
-            "hand": serialize_zone(player.hand.cards),
-            "battlefield": serialize_zone(player.battlefield.cards),
-            "graveyard": serialize_zone(player.graveyard.cards),
-            "exile": serialize_zone(player.exile.cards),
-        },
+        "zones": {zone_name: serialize_zone(getattr(player, zone_name).cards) for zone_name in ZONE_NAMES},
     }
 
 
-def serialize_zone(cards: List["Card"]) -> List[Dict[str, Any]]:
+def serialize_zone(cards: Iterable["Card"]) -> List[Dict[str, Any]]:
     return [serialize_card(card) for card in cards]
 
 
@@ -40,15 +48,98 @@ def serialize_card(card: "Card") -> Dict[str, Any]:
     }
 
 
-def serialize_stack_item(item: "StackItem") -> Dict[str, Any]:
+def serialize_stack_item(item: "StackItem", game_state: "GameState") -> Dict[str, Any]:
     return {
         "source": item.source.name,
         "ability": item.ability.name,
         "controller": item.controller.name if item.controller else None,
+        "target": serialize_card_ref(item.ability.target, game_state),
     }
 
 
-from py_mage.core.card import Card  # noqa: E402
-from py_mage.core.game_state import GameState  # noqa: E402
-from py_mage.core.player import Player  # noqa: E402
-from py_mage.core.stack import StackItem  # noqa: E402
+def serialize_card_ref(card: Optional["Card"], game_state: "GameState") -> Optional[Dict[str, Any]]:
+    # Targets in a zone are referenced by seat and position; anything else,
+    # such as a spell on the stack, by name only.
+    if card is None:
+        return None
+    for seat, player in enumerate(game_state.players):
+        for zone_name in ZONE_NAMES:
+            for index, other in enumerate(getattr(player, zone_name).cards):
+                if other is card:
+                    return {"player": seat, "zone": zone_name, "index": index}
+    return {"name": card.name}
+
+
+def deserialize_game_state(data: Dict[str, Any]) -> GameState:
+    # Dumps carry names and counters only, so cards are rebuilt from the
+    # registry and owned by the player whose zone holds them.
+    players = []
+    for entry in data["players"]:
+        player = Player(entry["name"], life=entry["life"], mana_pool=ManaPool(dict(entry["mana_pool"])))
+        for zone_name in ZONE_NAMES:
+            zone = getattr(player, zone_name)
+            for card_data in entry["zones"][zone_name]:
+                card = build_card(card_data["name"], player, player, card_data["tapped"], card_data["damage"])
+                card.power, card.toughness = card_data["power"], card_data["toughness"]
+                zone.add(card)
+        players.append(player)
+    game_state = GameState(players=players)
+    game_state.turn_manager.current_index = game_state.turn_manager.steps.index(Step(data["turn"]))
+    prepare_permanents(game_state)
+    by_name = {player.name: player for player in players}
+    for item in data["stack"]:
+        controller = by_name.get(item["controller"]) if item["controller"] else None
+        owner = controller or players[0]
+        # Activated abilities come from a permanent; spells were removed from their zone.
+        source = next(
+            (
+                card
+                for card in owner.battlefield.cards
+                if card.name == item["source"] and any(ability.name == item["ability"] for ability in card.abilities)
+            ),
+            None,
+        ) or build_card(item["source"], owner, owner)
+        target = deserialize_card_ref(item.get("target"), players, owner)
+        game_state.stack.push(StackItem(source, rebuild_ability(source, item["ability"], target), controller))
+    return game_state
+
+
+def deserialize_card_ref(data: Optional[Dict[str, Any]], players: List[Player], owner: Player) -> Optional[Card]:
+    if data is None:
+        return None
+    if "name" in data:
+        return build_card(data["name"], owner, owner)
+    return getattr(players[data["player"]], data["zone"]).cards[data["index"]]
+
+
+def card_definition(name: str) -> CardDefinition:
+    try:
+        return get_definition(name)
+    except KeyError:
+        return unsupported_definition(name)
+
+
+def build_card(name: str, owner: Player, controller: Player, tapped: bool = False, damage: int = 0) -> Card:
+    return Card(card_definition(name), owner=owner, controller=controller, tapped=tapped, damage=damage)
+
+
+def prepare_permanents(game_state: GameState) -> None:
+    for player in game_state.players:
+        for card in player.battlefield.cards:
+            card.zone = "Battlefield"
+            for factory in card.definition.abilities:
+                for ability in factory(card, game_state):
+                    card.add_ability(ability)
+
+
+def rebuild_ability(source: Card, name: str, target: Optional[Card] = None) -> Ability:
+    # Abilities are closures, so stack items are rebuilt from their name: an
+    # ability of the source permanent, a creature spell, or Lightning Bolt.
+    for ability in source.abilities:
+        if ability.name == name:
+            return ability
+    if name == f"Resolve {source.name}":
+        return make_creature_spell(source, target)
+    if name == "Lightning Bolt" and target is not None:
+        return make_lightning_bolt_spell(source, target)
+    raise ValueError(f"Cannot rebuild stack ability {name!r} of {source.name}")